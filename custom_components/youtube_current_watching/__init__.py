@@ -1,19 +1,87 @@
 """The YouTube Watching integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import datetime
 import logging
+import shutil
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, STATE_PLAYING
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, CONF_APPLE_TV, CONF_COOKIES_PATH, CONF_TRACK_ALL, YOUTUBE_APP_IDS
+from .const import (
+    DOMAIN,
+    CONF_APPLE_TV,
+    CONF_COOKIES_PATH,
+    CONF_TRACK_ALL,
+    CONF_PARSE_BACKEND,
+    CONF_THUMBNAIL_WIDTH,
+    CONF_THUMBNAIL_CACHE_SIZE,
+    CONF_RECOMMENDED_COUNT,
+    CONF_REQUEST_BUDGET,
+    CONF_HTTP2,
+    CONF_RECORD_PAGES,
+    CONF_FEEDS,
+    CONF_THUMBNAIL_MODE,
+    DEFAULT_PARSE_BACKEND,
+    DEFAULT_RECOMMENDED_COUNT,
+    DEFAULT_THUMBNAIL_WIDTH,
+    DEFAULT_THUMBNAIL_CACHE_SIZE,
+    DEFAULT_REQUEST_BUDGET,
+    DEFAULT_HTTP2,
+    DEFAULT_RECORD_PAGES,
+    DEFAULT_THUMBNAIL_MODE,
+    FEED_INTERVAL_OPTIONS,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+    OPTIONAL_FEEDS,
+    THUMBNAIL_CACHE_DIR,
+    RECORDING_DIR,
+    YOUTUBE_APP_IDS,
+)
+from .channel_cache import STORAGE_VERSION as CHANNEL_STORAGE_VERSION
+from .watch_statistics import STORAGE_VERSION as WATCH_STORAGE_VERSION
 from .coordinator import YouTubeDataCoordinator
+from .services import async_setup_services
+from .thumbnail_cache import ThumbnailCache
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.IMAGE]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Entities only created while their feed is enabled: (platform, unique_id)
+FEED_ENTITIES: dict[str, list[tuple[Platform, str]]] = {
+    FEED_SUBSCRIPTIONS: [(Platform.SENSOR, f"{DOMAIN}_subscriptions")],
+    FEED_RECOMMENDED: [
+        (Platform.SENSOR, f"{DOMAIN}_recommended"),
+        (Platform.IMAGE, f"{DOMAIN}_recommended_thumbnail"),
+    ],
+    FEED_UPLOADS: [(Platform.SENSOR, f"{DOMAIN}_subscription_uploads")],
+}
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the YouTube Watching services.
+    
+    Args:
+        hass: Home Assistant instance
+        config: Configuration (unused, config entries only)
+        
+    Returns:
+        True if setup was successful
+    """
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -31,14 +99,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = YouTubeDataCoordinator(
         hass,
         entry.data[CONF_COOKIES_PATH],
+        parse_backend=entry.options.get(CONF_PARSE_BACKEND, DEFAULT_PARSE_BACKEND),
+        http2=entry.options.get(CONF_HTTP2, DEFAULT_HTTP2),
+        enabled_feeds=entry.options.get(CONF_FEEDS, OPTIONAL_FEEDS),
+        channel_store=Store(
+            hass, CHANNEL_STORAGE_VERSION, f"{DOMAIN}/{entry.entry_id}/channels"
+        ),
+        watch_store=Store(
+            hass, WATCH_STORAGE_VERSION, f"{DOMAIN}/{entry.entry_id}/watch_statistics"
+        ),
+        recording_dir=_recording_path(hass, entry),
+        **_live_options(entry.options),
+    )
+    _async_remove_disabled_feed_entities(hass, coordinator)
+    await coordinator.channel_cache.async_load()
+    await coordinator.watch_statistics.async_load()
+
+    # Local thumbnail cache served by the image entities and entity pictures
+    thumbnail_cache = ThumbnailCache(
+        hass,
+        _cache_path(hass, entry),
+        max_bytes=int(
+            entry.options.get(CONF_THUMBNAIL_CACHE_SIZE, DEFAULT_THUMBNAIL_CACHE_SIZE)
+        ) * 1024 * 1024,
+        download=coordinator.download_thumbnail,
+        thumbnail_url=coordinator.thumbnail_url,
+        target_width=int(entry.options.get(CONF_THUMBNAIL_WIDTH, DEFAULT_THUMBNAIL_WIDTH)),
+        budget=coordinator.budget,
+        executor=coordinator.executor,
     )
+    await thumbnail_cache.async_setup()
 
     # Store coordinator and config
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "thumbnail_cache": thumbnail_cache,
         "apple_tv_entity": entry.data[CONF_APPLE_TV],
         "track_all": entry.data.get(CONF_TRACK_ALL, False),
+        "reload_options": _reload_options(entry.options),
     }
 
     # Track all mode: Update periodically regardless of media player state
@@ -58,6 +157,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if new_state is None:
                 return
 
+            now = dt_util.utcnow()
+            if (
+                old_state is not None
+                and old_state.state == STATE_PLAYING
+                and new_state.state != STATE_PLAYING
+            ):
+                coordinator.progress.pause(now)
+                coordinator.async_update_listeners()
+
             # Check if state changed to playing
             if new_state.state == STATE_PLAYING and (old_state is None or old_state.state != STATE_PLAYING):
                 # Get attributes
@@ -102,13 +210,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     # Check if title changed
                     current_sensor_title = None
                     if coordinator.data:
-                        current_sensor_title = coordinator.data.get("title")
+                        current_sensor_title = coordinator.data.title
                     
                     if media_title and media_title != current_sensor_title:
                         _LOGGER.debug("YouTube started playing new video: %s", media_title)
-                        hass.async_create_task(coordinator.async_refresh())
+                        coordinator.progress.start(now, media_title)
+                        # Show a video seen in any feed right away; the refresh confirms it
+                        coordinator.async_resolve_title(media_title)
+                        coordinator.async_start_convergence(media_title)
                     else:
                         _LOGGER.debug("Same video playing, skipping refresh")
+                        coordinator.progress.resume(now)
+                        coordinator.async_update_listeners()
                 else:
                     _LOGGER.debug(
                         "Not YouTube - app_id: %s, app_name: %s, source: %s, "
@@ -116,6 +229,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         app_id, app_name, source, media_content_id, media_title
                     )
 
+            _async_sync_progress(coordinator, new_state)
+
         # Track media player state changes
         entry.async_on_unload(
             async_track_state_change_event(
@@ -125,15 +240,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         )
 
+    # Stop the parse backend if setup fails from here on
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    # Cheap login check first, then again on its own slow timer
+    await coordinator.async_check_auth()
+    entry.async_on_unload(coordinator.async_start_auth_checks())
+
     # Initial data fetch
     await coordinator.async_config_entry_first_refresh()
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Apply changed options, reloading only when entities come or go
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
     return True
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the options of a config entry after they changed.
+    
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry whose options changed
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if _reload_options(entry.options) != entry_data["reload_options"]:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator = entry_data["coordinator"]
+    coordinator.async_apply_options(**_live_options(entry.options))
+
+    thumbnail_cache = entry_data["thumbnail_cache"]
+    thumbnail_cache.max_bytes = int(
+        entry.options.get(CONF_THUMBNAIL_CACHE_SIZE, DEFAULT_THUMBNAIL_CACHE_SIZE)
+    ) * 1024 * 1024
+    thumbnail_cache.target_width = int(
+        entry.options.get(CONF_THUMBNAIL_WIDTH, DEFAULT_THUMBNAIL_WIDTH)
+    )
+
+    # Reschedule with the new interval and show the new counts right away
+    await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry.
     
@@ -147,6 +299,87 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["coordinator"].executor.async_shutdown()
+
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the files of a deleted config entry.
+    
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry being removed
+    """
+    await hass.async_add_executor_job(
+        shutil.rmtree, hass.config.path(".storage", DOMAIN, entry.entry_id), True
+    )
+
+
+@callback
+def _async_sync_progress(coordinator: YouTubeDataCoordinator, state: State) -> None:
+    """Take over the playback position the media player reports, if any.
+    
+    Only positions reported for the title the progress was started with are
+    used, so another app on the same player doesn't move it.
+    """
+    position = state.attributes.get("media_position")
+    updated_at = state.attributes.get("media_position_updated_at")
+    if position is None or not isinstance(updated_at, datetime):
+        return
+    if state.attributes.get("media_title") != coordinator.progress.title:
+        return
+    coordinator.progress.seek(position, updated_at)
+
+
+def _live_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the coordinator settings that can change without a reload."""
+    return {
+        "recommended_count": int(options.get(CONF_RECOMMENDED_COUNT, DEFAULT_RECOMMENDED_COUNT)),
+        "feed_intervals": {
+            feed: int(options.get(key, default))
+            for feed, (key, default) in FEED_INTERVAL_OPTIONS.items()
+        },
+        "thumbnail_mode": options.get(CONF_THUMBNAIL_MODE, DEFAULT_THUMBNAIL_MODE),
+        "request_budget": int(options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)),
+        "record_pages": options.get(CONF_RECORD_PAGES, DEFAULT_RECORD_PAGES),
+    }
+
+
+def _reload_options(options: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the options a change of which needs a reload.
+    
+    They decide which entities exist and how the coordinator is built;
+    every other option is applied live.
+    """
+    return {
+        CONF_FEEDS: frozenset(options.get(CONF_FEEDS, OPTIONAL_FEEDS)),
+        CONF_PARSE_BACKEND: options.get(CONF_PARSE_BACKEND, DEFAULT_PARSE_BACKEND),
+        CONF_HTTP2: options.get(CONF_HTTP2, DEFAULT_HTTP2),
+    }
+
+
+@callback
+def _async_remove_disabled_feed_entities(
+    hass: HomeAssistant, coordinator: YouTubeDataCoordinator
+) -> None:
+    """Remove the registry entries of entities whose feed is turned off."""
+    registry = er.async_get(hass)
+    for feed, entities in FEED_ENTITIES.items():
+        if coordinator.feed_enabled(feed):
+            continue
+        for platform, unique_id in entities:
+            entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+
+
+def _cache_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the thumbnail cache directory of a config entry."""
+    return hass.config.path(".storage", DOMAIN, entry.entry_id, THUMBNAIL_CACHE_DIR)
+
 
-    return unload_ok
\ No newline at end of file
+def _recording_path(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the page recording directory of a config entry."""
+    return hass.config.path(".storage", DOMAIN, entry.entry_id, RECORDING_DIR)
@@ -0,0 +1,155 @@
+"""Cookie validity checks for YouTube Watching integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import hashlib
+from http.cookiejar import CookieJar
+import time
+
+from .json_backend import loads
+from .parser import parse_logged_in
+from .transport import Transport, TransportError
+
+ORIGIN = "https://www.youtube.com"
+
+# Small authenticated InnerTube call used as the login probe
+PROBE_PATH = "/youtubei/v1/account/account_menu?prettyPrint=false"
+# Client context of every InnerTube call; English keeps labels like
+# "1.1K subscribers" recognizable
+INNERTUBE_CLIENT = {"clientName": "WEB", "clientVersion": "2.20240101.00.00", "hl": "en"}
+
+# Cookies a logged-in session needs; the first SAPISID variant found is
+# used to sign the probe request
+SAPISID_COOKIES = ("SAPISID", "__Secure-3PAPISID")
+AUTH_COOKIES = ("SID", "LOGIN_INFO", *SAPISID_COOKIES)
+
+REASON_OK = "ok"
+REASON_MISSING_COOKIES = "missing_cookies"
+REASON_EXPIRED = "expired"
+REASON_LOGGED_OUT = "logged_out"
+REASON_UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class CookieExpiry:
+    """Expiry information read once from a cookie jar."""
+
+    # Earliest expiry of the auth cookies, None for session cookies only
+    expires_at: datetime | None
+    missing: tuple[str, ...]
+    sapisid: str | None
+
+    @property
+    def expired(self) -> bool:
+        """Return true if an auth cookie has expired."""
+        return self.expires_at is not None and self.expires_at <= datetime.now(timezone.utc)
+
+    def seconds_left(self) -> int | None:
+        """Return the seconds until the first auth cookie expires."""
+        if self.expires_at is None:
+            return None
+        return max(0, int((self.expires_at - datetime.now(timezone.utc)).total_seconds()))
+
+
+@dataclass(frozen=True, slots=True)
+class AuthStatus:
+    """Cached result of the last auth check."""
+
+    valid: bool | None
+    reason: str
+    checked_at: datetime
+    expiry: CookieExpiry | None = None
+
+
+def read_cookie_expiry(cookie_jar: CookieJar) -> CookieExpiry:
+    """Inspect the auth cookies of a jar.
+
+    Args:
+        cookie_jar: Loaded cookie jar
+
+    Returns:
+        Expiry information of the auth cookies
+    """
+    found: set[str] = set()
+    expiries: list[int] = []
+    # Browser exports often carry SAPISID for .google.com only; the
+    # .youtube.com one is preferred when both exist
+    sapisid = google_sapisid = None
+    for cookie in cookie_jar:
+        if cookie.name not in AUTH_COOKIES:
+            continue
+        if not cookie.domain.endswith(("youtube.com", "google.com")):
+            continue
+        found.add(cookie.name)
+        if cookie.expires:
+            expiries.append(cookie.expires)
+        if cookie.name in SAPISID_COOKIES:
+            if cookie.domain.endswith("youtube.com"):
+                sapisid = sapisid or cookie.value
+            else:
+                google_sapisid = google_sapisid or cookie.value
+    sapisid = sapisid or google_sapisid
+
+    missing = [name for name in ("SID", "LOGIN_INFO") if name not in found]
+    if not found.intersection(SAPISID_COOKIES):
+        missing.append(SAPISID_COOKIES[0])
+
+    expires_at = (
+        datetime.fromtimestamp(min(expiries), timezone.utc) if expiries else None
+    )
+    return CookieExpiry(expires_at=expires_at, missing=tuple(missing), sapisid=sapisid)
+
+
+def sapisid_hash(sapisid: str, origin: str = ORIGIN) -> str:
+    """Build the SAPISIDHASH authorization header value.
+
+    Args:
+        sapisid: Value of the SAPISID cookie
+        origin: Origin the request is made from
+
+    Returns:
+        Authorization header value
+    """
+    timestamp = int(time.time())
+    digest = hashlib.sha1(f"{timestamp} {sapisid} {origin}".encode()).hexdigest()
+    return f"SAPISIDHASH {timestamp}_{digest}"
+
+
+def probe_login(
+    transport: Transport, sapisid: str, base_url: str = ORIGIN
+) -> bool | None:
+    """Ask YouTube whether the session is logged in.
+
+    Args:
+        transport: Transport with loaded cookies
+        sapisid: Value of the SAPISID cookie
+        base_url: YouTube base URL (overridden by the test stub server)
+
+    Returns:
+        True or False if YouTube answered with its logged_in flag, None if
+        the answer is unclear
+
+    Raises:
+        TransportError: If the request fails
+    """
+    status, body = transport.post(
+        f"{base_url}{PROBE_PATH}",
+        {"context": {"client": INNERTUBE_CLIENT}},
+        headers={
+            "Authorization": sapisid_hash(sapisid),
+            "Origin": ORIGIN,
+            "X-Origin": ORIGIN,
+            "Content-Type": "application/json",
+        },
+        timeout=10,
+    )
+    # A 401 or 403 may also come from an outdated client context or a
+    # rejected signature, only the logged_in flag says the session is gone
+    if status >= 400:
+        raise TransportError(f"Login probe answered {status}")
+
+    try:
+        return parse_logged_in(loads(body))
+    except ValueError:
+        return None
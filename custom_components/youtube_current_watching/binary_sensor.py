@@ -54,6 +54,11 @@ class YouTubeCookiesStatusSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if cookies are valid."""
+        # Prefer the dedicated login check when it gave a clear answer
+        auth_status = self.coordinator.auth_status
+        if auth_status is not None and auth_status.valid is not None:
+            return auth_status.valid
+
         # Cookies are valid if either subscription data or history data is successfully fetched
         has_subscription_data = self.coordinator.subscriptions_data is not None
         has_history_data = self.coordinator.data is not None
@@ -68,12 +73,27 @@ class YouTubeCookiesStatusSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
-        return {
+        attributes = {
             "has_history_data": self.coordinator.data is not None,
             "has_subscription_data": self.coordinator.subscriptions_data is not None,
             "cookies_valid_flag": self.coordinator.cookies_valid,
         }
 
+        auth_status = self.coordinator.auth_status
+        if auth_status is not None:
+            expiry = auth_status.expiry
+            attributes.update({
+                "reason": auth_status.reason,
+                "last_checked": auth_status.checked_at.isoformat(),
+                "expires_at": (
+                    expiry.expires_at.isoformat()
+                    if expiry and expiry.expires_at else None
+                ),
+                "seconds_to_expiry": expiry.seconds_left() if expiry else None,
+            })
+
+        return attributes
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
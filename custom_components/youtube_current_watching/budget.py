@@ -0,0 +1,132 @@
+"""Request budget for YouTube Watching integration.
+
+Every request to YouTube (pages, login probe, thumbnails) takes a token from
+a per-account token bucket that refills at the configured hourly rate. Lower
+priorities must leave a reserve in the bucket, so when it runs low they are
+deferred first and the history page keeps getting through.
+"""
+from __future__ import annotations
+
+from collections import Counter, deque
+import threading
+import time
+from typing import Any
+
+from .const import FEED_HISTORY, FEED_RECOMMENDED, FEED_SUBSCRIPTIONS, FEED_UPLOADS
+
+# Request priorities, most important first
+PRIORITY_HIGH = "high"  # history page, login probe
+PRIORITY_NORMAL = "normal"  # recommended videos
+PRIORITY_LOW = "low"  # subscriptions, uploads, thumbnails
+PRIORITIES = [PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW]
+
+FEED_PRIORITIES = {
+    FEED_HISTORY: PRIORITY_HIGH,
+    FEED_RECOMMENDED: PRIORITY_NORMAL,
+    FEED_SUBSCRIPTIONS: PRIORITY_LOW,
+    FEED_UPLOADS: PRIORITY_LOW,
+}
+
+# Share of the bucket a priority must leave for the ones above it
+PRIORITY_RESERVE = {
+    PRIORITY_HIGH: 0.0,
+    PRIORITY_NORMAL: 0.2,
+    PRIORITY_LOW: 0.5,
+}
+
+# The bucket holds this many minutes of budget, bounding bursts
+BURST_MINUTES = 5
+MIN_CAPACITY = 10
+
+HOUR = 3600
+
+
+class RequestBudget:
+    """Token bucket shared by every request of one account.
+
+    Tokens are taken from the event loop (page fetches) and from executor
+    threads (thumbnails), so the bucket is guarded by a lock.
+    """
+
+    def __init__(self, per_hour: int) -> None:
+        """Initialize the budget.
+
+        Args:
+            per_hour: Requests allowed per hour
+        """
+        self.per_hour = per_hour
+        self.capacity = max(MIN_CAPACITY, per_hour * BURST_MINUTES / 60)
+        self._rate = per_hour / HOUR
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        # (monotonic time, priority) of the requests made and deferred within
+        # the last hour
+        self._spent: deque[tuple[float, str]] = deque()
+        self._deferred: deque[tuple[float, str]] = deque()
+
+    def set_rate(self, per_hour: int) -> None:
+        """Change the allowed requests per hour, keeping the requests already made.
+
+        Args:
+            per_hour: Requests allowed per hour
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.per_hour = per_hour
+            self.capacity = max(MIN_CAPACITY, per_hour * BURST_MINUTES / 60)
+            self._rate = per_hour / HOUR
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last call."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        for window in (self._spent, self._deferred):
+            while window and window[0][0] <= now - HOUR:
+                window.popleft()
+
+    def try_acquire(self, priority: str = PRIORITY_HIGH) -> bool:
+        """Take a token for one request if the priority may still spend.
+
+        Args:
+            priority: Priority of the request
+
+        Returns:
+            True if the request may be made, False if it should be deferred
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens < 1 + PRIORITY_RESERVE[priority] * self.capacity:
+                self._deferred.append((now, priority))
+                return False
+            self._tokens -= 1
+            self._spent.append((now, priority))
+            return True
+
+    @property
+    def used_last_hour(self) -> int:
+        """Return the number of requests made within the last hour."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return len(self._spent)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the budget state for attributes and diagnostics.
+
+        The requests and deferrals per priority cover the last hour, like
+        used_last_hour.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            spent = Counter(priority for _, priority in self._spent)
+            deferred = Counter(priority for _, priority in self._deferred)
+            return {
+                "budget_per_hour": self.per_hour,
+                "used_last_hour": len(self._spent),
+                "tokens_available": int(self._tokens),
+                "capacity": int(self.capacity),
+                "requests": {priority: spent[priority] for priority in PRIORITIES},
+                "deferred": {priority: deferred[priority] for priority in PRIORITIES},
+            }
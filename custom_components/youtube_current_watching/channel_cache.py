@@ -0,0 +1,194 @@
+"""Channel details cache for YouTube Watching integration.
+
+The channels page lists every subscription in one request, but its current
+layout leaves out details such as the video count. Missing details are
+fetched in the background from each channel's InnerTube browse response, a
+few channels per subscriptions update, and kept per channel for a TTL. The
+cache is persisted in a Store so a restart doesn't fetch everything again.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_AVATAR,
+    ATTR_HANDLE,
+    ATTR_SUBSCRIBER_COUNT,
+    ATTR_VIDEO_COUNT,
+    CHANNEL_DETAILS_BATCH_SIZE,
+    CHANNEL_DETAILS_TTL_SECONDS,
+)
+from .models import ChannelInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Seconds to collect changes before the Store is written
+SAVE_DELAY = 60
+
+# ChannelInfo field -> detail key
+_FIELDS = {
+    "handle": ATTR_HANDLE,
+    "subscriber_count": ATTR_SUBSCRIBER_COUNT,
+    "video_count": ATTR_VIDEO_COUNT,
+    "avatar": ATTR_AVATAR,
+}
+
+
+class ChannelCache:
+    """Per-channel details with a TTL, filled by a background batch fetcher.
+
+    Only touched from the event loop. At most one batch runs at a time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[str], Awaitable[dict[str, str] | None]],
+        store: Store | None = None,
+        ttl: float = CHANNEL_DETAILS_TTL_SECONDS,
+        batch_size: int = CHANNEL_DETAILS_BATCH_SIZE,
+        on_fetched: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            hass: Home Assistant instance
+            fetch: Fetches the details of one channel ID; returns None if
+                it can't right now, which ends the batch
+            store: Store the cache is persisted in, None keeps it in memory
+            ttl: Seconds before a channel's details are fetched again
+            batch_size: Channels fetched per batch
+            on_fetched: Called from the event loop after a batch fetched anything
+        """
+        self.hass = hass
+        self._fetch = fetch
+        self._store = store
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self._on_fetched = on_fetched
+        # channel_id -> (wall clock fetch time, details)
+        self._details: dict[str, tuple[float, dict[str, str]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cached channels."""
+        return len(self._details)
+
+    async def async_load(self) -> None:
+        """Load the persisted details."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for channel_id, entry in stored.get("channels", {}).items():
+            self._details[channel_id] = (entry["fetched_at"], entry["details"])
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a running batch."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def enrich(self, channels: list[ChannelInfo]) -> list[ChannelInfo]:
+        """Fill in the details a channel record lacks from the cache.
+
+        Details from the page itself win over cached ones.
+
+        Args:
+            channels: Channel records of the channels page
+
+        Returns:
+            Channel records with every cached detail filled in
+        """
+        enriched = []
+        for channel in channels:
+            cached = self._details.get(channel.channel_id) if channel.channel_id else None
+            if cached is not None:
+                details = cached[1]
+                changes = {
+                    field: details[key]
+                    for field, key in _FIELDS.items()
+                    if getattr(channel, field) is None and key in details
+                }
+                if changes:
+                    channel = replace(channel, **changes)
+            enriched.append(channel)
+        return enriched
+
+    @callback
+    def async_schedule(self, channels: list[ChannelInfo]) -> None:
+        """Fetch the details of incomplete channels in the background.
+
+        Channels whose cached details are still fresh are skipped even if
+        incomplete, and channels no longer subscribed are forgotten. An
+        empty list is more likely a failed parse than no subscriptions at
+        all, so it forgets nothing.
+
+        Args:
+            channels: Current channel records, already enriched
+        """
+        subscribed = {channel.channel_id for channel in channels if channel.channel_id}
+        if subscribed:
+            unsubscribed = self._details.keys() - subscribed
+            for channel_id in unsubscribed:
+                del self._details[channel_id]
+            if unsubscribed and self._store is not None:
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+        if self._task is not None and not self._task.done():
+            return
+
+        now = time.time()
+        due = [
+            channel.channel_id
+            for channel in channels
+            if channel.channel_id
+            and not channel.complete
+            and now - self._details.get(channel.channel_id, (0.0, {}))[0] >= self.ttl
+        ][: self.batch_size]
+        if not due:
+            return
+
+        self._task = self.hass.async_create_background_task(
+            self._async_fetch_batch(due), f"{__name__} fetch {len(due)} channels"
+        )
+
+    async def _async_fetch_batch(self, channel_ids: list[str]) -> None:
+        """Fetch and cache the details of a batch of channels."""
+        fetched = 0
+        for channel_id in channel_ids:
+            details = await self._fetch(channel_id)
+            if details is None:
+                # Budget or network trouble; the next update picks it up again
+                break
+            self._details[channel_id] = (time.time(), details)
+            fetched += 1
+
+        if fetched:
+            _LOGGER.debug("Fetched details of %d channels", fetched)
+            if self._store is not None:
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            if self._on_fetched is not None:
+                self._on_fetched()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the cache in its stored form."""
+        return {
+            "channels": {
+                channel_id: {"fetched_at": fetched_at, "details": details}
+                for channel_id, (fetched_at, details) in self._details.items()
+            }
+        }
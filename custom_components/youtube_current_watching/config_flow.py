@@ -8,6 +8,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
@@ -16,7 +17,37 @@ from .const import (
     CONF_APPLE_TV,
     CONF_COOKIES_PATH,
     CONF_TRACK_ALL,
+    CONF_PARSE_BACKEND,
+    CONF_THUMBNAIL_WIDTH,
+    CONF_THUMBNAIL_CACHE_SIZE,
+    CONF_RECOMMENDED_COUNT,
+    CONF_REQUEST_BUDGET,
+    CONF_HTTP2,
+    CONF_RECORD_PAGES,
+    CONF_FEEDS,
+    CONF_THUMBNAIL_MODE,
     DEFAULT_COOKIES_PATH,
+    DEFAULT_PARSE_BACKEND,
+    DEFAULT_THUMBNAIL_WIDTH,
+    DEFAULT_THUMBNAIL_CACHE_SIZE,
+    DEFAULT_RECOMMENDED_COUNT,
+    DEFAULT_REQUEST_BUDGET,
+    DEFAULT_HTTP2,
+    DEFAULT_RECORD_PAGES,
+    DEFAULT_THUMBNAIL_MODE,
+    FEED_HISTORY,
+    FEED_INTERVAL_OPTIONS,
+    FEED_SUBSCRIPTIONS,
+    FEED_RECOMMENDED,
+    FEED_UPLOADS,
+    MAX_RECOMMENDED_COUNT,
+    MIN_SCAN_INTERVAL_SECONDS,
+    MAX_SCAN_INTERVAL_SECONDS,
+    OPTIONAL_FEEDS,
+    MIN_REQUEST_BUDGET,
+    MAX_REQUEST_BUDGET,
+    PARSE_BACKENDS,
+    THUMBNAIL_MODES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +58,14 @@ class YouTubeCurrentWatchingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> YouTubeCurrentWatchingOptionsFlow:
+        """Get the options flow for this handler."""
+        return YouTubeCurrentWatchingOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -99,4 +138,136 @@ class YouTubeCurrentWatchingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
             step_id="user",
             data_schema=data_schema,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class YouTubeCurrentWatchingOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for YouTube Watching."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options.
+        
+        Args:
+            user_input: User input dictionary or None
+            
+        Returns:
+            FlowResult with form or entry update
+        """
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+
+        def interval(feed: str) -> dict[Any, Any]:
+            """Return the schema entry of a feed's update interval."""
+            key, default = FEED_INTERVAL_OPTIONS[feed]
+            return {
+                vol.Required(key, default=options.get(key, default)): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=MIN_SCAN_INTERVAL_SECONDS,
+                        max=MAX_SCAN_INTERVAL_SECONDS,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                )
+            }
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_FEEDS,
+                    default=options.get(CONF_FEEDS, OPTIONAL_FEEDS),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=OPTIONAL_FEEDS,
+                        multiple=True,
+                        translation_key=CONF_FEEDS,
+                    )
+                ),
+                **interval(FEED_HISTORY),
+                **interval(FEED_SUBSCRIPTIONS),
+                **interval(FEED_RECOMMENDED),
+                **interval(FEED_UPLOADS),
+                vol.Required(
+                    CONF_RECOMMENDED_COUNT,
+                    default=options.get(CONF_RECOMMENDED_COUNT, DEFAULT_RECOMMENDED_COUNT),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=MAX_RECOMMENDED_COUNT,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_THUMBNAIL_MODE,
+                    default=options.get(CONF_THUMBNAIL_MODE, DEFAULT_THUMBNAIL_MODE),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=THUMBNAIL_MODES,
+                        translation_key=CONF_THUMBNAIL_MODE,
+                    )
+                ),
+                vol.Required(
+                    CONF_PARSE_BACKEND,
+                    default=options.get(CONF_PARSE_BACKEND, DEFAULT_PARSE_BACKEND),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=PARSE_BACKENDS,
+                        translation_key=CONF_PARSE_BACKEND,
+                    )
+                ),
+                vol.Required(
+                    CONF_THUMBNAIL_WIDTH,
+                    default=options.get(CONF_THUMBNAIL_WIDTH, DEFAULT_THUMBNAIL_WIDTH),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=1280,
+                        step=1,
+                        unit_of_measurement="px",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_THUMBNAIL_CACHE_SIZE,
+                    default=options.get(CONF_THUMBNAIL_CACHE_SIZE, DEFAULT_THUMBNAIL_CACHE_SIZE),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=1024,
+                        step=1,
+                        unit_of_measurement="MB",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_REQUEST_BUDGET,
+                    default=options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=MIN_REQUEST_BUDGET,
+                        max=MAX_REQUEST_BUDGET,
+                        step=1,
+                        unit_of_measurement="requests/h",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_HTTP2,
+                    default=options.get(CONF_HTTP2, DEFAULT_HTTP2),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_RECORD_PAGES,
+                    default=options.get(CONF_RECORD_PAGES, DEFAULT_RECORD_PAGES),
+                ): selector.BooleanSelector(),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=data_schema,
+        )
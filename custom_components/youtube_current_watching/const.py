@@ -8,12 +8,112 @@ CONF_APPLE_TV = "apple_tv_entity_id"
 CONF_COOKIES_PATH = "cookies_path"
 CONF_TRACK_ALL = "track_all"  # Always track mode (ignore media player state)
 
+# Options keys
+CONF_FEEDS = "feeds"  # optional feeds to fetch, history is always fetched
+CONF_HISTORY_INTERVAL = "history_interval"  # seconds
+CONF_SUBSCRIPTIONS_INTERVAL = "subscriptions_interval"  # seconds
+CONF_UPLOADS_INTERVAL = "uploads_interval"  # seconds
+CONF_THUMBNAIL_MODE = "thumbnail_mode"
+CONF_PARSE_BACKEND = "parse_backend"
+CONF_THUMBNAIL_WIDTH = "thumbnail_width"  # 0 = keep original size
+CONF_THUMBNAIL_CACHE_SIZE = "thumbnail_cache_size"  # MB
+CONF_RECOMMENDED_COUNT = "recommended_count"
+CONF_RECOMMENDED_INTERVAL = "recommended_interval"  # seconds
+CONF_REQUEST_BUDGET = "request_budget"  # requests per hour
+CONF_HTTP2 = "http2"  # needs httpx and h2
+CONF_RECORD_PAGES = "record_pages"  # save scrubbed pages, see recording.py
+
+# Parse backends (see parse_backend.py)
+PARSE_BACKEND_THREAD = "thread"
+PARSE_BACKEND_PROCESS = "process"
+PARSE_BACKENDS = [PARSE_BACKEND_THREAD, PARSE_BACKEND_PROCESS]
+DEFAULT_PARSE_BACKEND = PARSE_BACKEND_THREAD
+
+# Thumbnail modes: probe for maxresdefault.jpg, or use 0.jpg without a request
+THUMBNAIL_MODE_BEST = "best"
+THUMBNAIL_MODE_STANDARD = "standard"
+THUMBNAIL_MODES = [THUMBNAIL_MODE_BEST, THUMBNAIL_MODE_STANDARD]
+DEFAULT_THUMBNAIL_MODE = THUMBNAIL_MODE_BEST
+
+# Thumbnail cache defaults
+DEFAULT_THUMBNAIL_WIDTH = 0
+DEFAULT_THUMBNAIL_CACHE_SIZE = 50
+THUMBNAIL_CACHE_DIR = "thumbnails"
+
+# Page recordings (see recording.py)
+DEFAULT_RECORD_PAGES = False
+RECORDING_DIR = "recordings"
+RECORDING_MAX_FILES = 10  # per feed
+
 # Default cookies path
 DEFAULT_COOKIES_PATH = "/config/youtube_cookies.txt"
 
 # Update interval in seconds
 SCAN_INTERVAL_SECONDS = 30  # 시청 기록과 구독 채널
 SCAN_INTERVAL_RECOMMENDED_SECONDS = 60  # 추천 영상 (1분)
+SCAN_INTERVAL_UPLOADS_SECONDS = 300  # 구독 채널 새 영상 (5분)
+AUTH_CHECK_INTERVAL_SECONDS = 1800  # 쿠키 로그인 확인 (30분)
+MIN_SCAN_INTERVAL_SECONDS = 10
+MAX_SCAN_INTERVAL_SECONDS = 86400
+
+# History-only polls after a play event until the history shows the new video
+CONVERGENCE_DELAYS_SECONDS = (3, 5, 10, 20)
+
+# Local playback progress (see progress.py): attribute update interval while
+# playing, and how long after a play event a video change still belongs to it
+PROGRESS_UPDATE_SECONDS = 5
+PROGRESS_START_GRACE_SECONDS = 60
+
+# Recommended videos
+DEFAULT_RECOMMENDED_COUNT = 3
+MAX_RECOMMENDED_COUNT = 20
+
+# Request budget (requests per hour, see budget.py)
+DEFAULT_REQUEST_BUDGET = 1200
+MIN_REQUEST_BUDGET = 60
+MAX_REQUEST_BUDGET = 10000
+
+# HTTP transport (see transport.py)
+DEFAULT_HTTP2 = False
+
+# Thread pool running the blocking YouTube work (see executor.py)
+EXECUTOR_MAX_WORKERS = 3
+EXECUTOR_MAX_QUEUE = 8  # jobs waiting for a worker before new ones are shed
+
+# History entries kept for the get_history service
+DEFAULT_HISTORY_COUNT = 20
+
+# Subscription uploads: most found per poll, and kept for the sensor
+MAX_NEW_UPLOADS = 30
+DEFAULT_UPLOADS_COUNT = 20
+
+# Channel details filled in by the background fetcher (see channel_cache.py)
+CHANNEL_DETAILS_TTL_SECONDS = 86400
+CHANNEL_DETAILS_BATCH_SIZE = 5  # channels fetched per subscriptions update
+
+# Event fired for every new upload of a subscribed channel
+EVENT_NEW_UPLOAD = f"{DOMAIN}_new_upload"
+# Events fired when the current video or the set of recommended videos changes
+EVENT_VIDEO_CHANGED = f"{DOMAIN}_video_changed"
+EVENT_RECOMMENDED_CHANGED = f"{DOMAIN}_recommended_changed"
+
+# Feed names
+FEED_HISTORY = "history"
+FEED_RECOMMENDED = "recommended"
+FEED_SUBSCRIPTIONS = "subscriptions"
+FEED_UPLOADS = "uploads"  # new uploads of subscribed channels
+
+# Feeds that can be turned off in the options; all are on by default
+OPTIONAL_FEEDS = [FEED_SUBSCRIPTIONS, FEED_RECOMMENDED, FEED_UPLOADS]
+
+# Feed -> (interval option, default seconds); the history interval is the
+# coordinator update interval
+FEED_INTERVAL_OPTIONS = {
+    FEED_HISTORY: (CONF_HISTORY_INTERVAL, SCAN_INTERVAL_SECONDS),
+    FEED_SUBSCRIPTIONS: (CONF_SUBSCRIPTIONS_INTERVAL, SCAN_INTERVAL_SECONDS),
+    FEED_RECOMMENDED: (CONF_RECOMMENDED_INTERVAL, SCAN_INTERVAL_RECOMMENDED_SECONDS),
+    FEED_UPLOADS: (CONF_UPLOADS_INTERVAL, SCAN_INTERVAL_UPLOADS_SECONDS),
+}
 
 # Sensor attributes
 ATTR_CHANNEL = "channel"
@@ -21,6 +121,11 @@ ATTR_TITLE = "title"
 ATTR_VIDEO_ID = "video_id"
 ATTR_THUMBNAIL = "thumbnail"
 ATTR_DURATION = "duration"
+ATTR_DURATION_SECONDS = "duration_seconds"
+# Estimated playback progress, in seconds and percent
+ATTR_POSITION = "position"
+ATTR_REMAINING = "remaining"
+ATTR_PROGRESS = "progress"
 ATTR_URL = "url"
 
 # Subscriptions attributes
@@ -30,6 +135,8 @@ ATTR_CHANNEL_ID = "channel_id"
 ATTR_CHANNEL_NAME = "channel_name"
 ATTR_SUBSCRIBER_COUNT = "subscriber_count"
 ATTR_VIDEO_COUNT = "video_count"
+ATTR_HANDLE = "handle"
+ATTR_AVATAR = "avatar"
 
 # Binary sensor attributes
 ATTR_COOKIES_VALID = "cookies_valid"
@@ -46,3 +153,13 @@ YOUTUBE_APP_IDS = [
     "youtube",                                      # Lowercase variant
     "com.google.android.youtube.tvkids",            # YouTube Kids
 ]
+
+# Services
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_GET_RECOMMENDED = "get_recommended"
+SERVICE_GET_SUBSCRIPTIONS = "get_subscriptions"
+SERVICE_REFRESH = "refresh"
+ATTR_MAX_AGE = "max_age"  # seconds
+ATTR_LIMIT = "limit"
+ATTR_VIDEOS = "videos"
+ATTR_UPDATED = "updated"
@@ -1,77 +1,633 @@
 """DataUpdateCoordinator for YouTube Watching integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import replace
 from datetime import timedelta, datetime
 import json
 import logging
 import os
-import re
 from http.cookiejar import MozillaCookieJar
-from typing import Any
+import threading
+from typing import Any, TypeVar
 
-import requests
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SCAN_INTERVAL_SECONDS, SCAN_INTERVAL_RECOMMENDED_SECONDS
+from .const import (
+    DOMAIN,
+    AUTH_CHECK_INTERVAL_SECONDS,
+    CONVERGENCE_DELAYS_SECONDS,
+    PROGRESS_START_GRACE_SECONDS,
+    FEED_INTERVAL_OPTIONS,
+    OPTIONAL_FEEDS,
+    DEFAULT_THUMBNAIL_MODE,
+    THUMBNAIL_MODE_STANDARD,
+    DEFAULT_PARSE_BACKEND,
+    DEFAULT_RECOMMENDED_COUNT,
+    DEFAULT_HISTORY_COUNT,
+    DEFAULT_REQUEST_BUDGET,
+    DEFAULT_RECORD_PAGES,
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+    DEFAULT_UPLOADS_COUNT,
+    MAX_NEW_UPLOADS,
+    EVENT_NEW_UPLOAD,
+    EVENT_RECOMMENDED_CHANGED,
+    EVENT_VIDEO_CHANGED,
+)
+from .auth import (
+    INNERTUBE_CLIENT,
+    ORIGIN,
+    REASON_EXPIRED,
+    REASON_LOGGED_OUT,
+    REASON_MISSING_COOKIES,
+    REASON_OK,
+    REASON_UNKNOWN,
+    AuthStatus,
+    CookieExpiry,
+    probe_login,
+    read_cookie_expiry,
+)
+from .budget import FEED_PRIORITIES, PRIORITY_HIGH, PRIORITY_LOW, RequestBudget
+from .channel_cache import ChannelCache
+from .executor import FetchExecutor, JobRejected
+from .json_backend import loads
+from .models import NOT_AVAILABLE, THUMBNAIL_URL, VideoInfo
+from .parse_backend import create_parse_backend
+from .parser import ParseResult, parse_channel_details
+from .progress import PlaybackProgress
+from .recording import PageRecorder
+from .title_index import TitleIndex, normalize_title
+from .transport import Transport, TransportError, create_transport
+from .watch_statistics import WatchStatistics
+from .stats import (
+    AUTH,
+    OUTCOME_EMPTY,
+    OUTCOME_ERROR,
+    STAGE_CHANNEL_DETAILS,
+    STAGE_COOKIE_LOAD,
+    STAGE_CONNECT,
+    STAGE_DOWNLOAD,
+    STAGE_REGEX,
+    STAGE_THUMBNAIL,
+    STAGE_TOTAL,
+    REFRESH,
+    RefreshStats,
+    StageSample,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Page paths below the YouTube base URL
+HISTORY_PATH = "/feed/history"
+RECOMMENDED_PATH = "/"
+SUBSCRIPTIONS_PATH = "/feed/channels"
+UPLOADS_PATH = "/feed/subscriptions"
+# InnerTube endpoint the channel details are read from
+CHANNEL_DETAILS_PATH = "/youtubei/v1/browse?prettyPrint=false"
+
+# How long a locally matched video wins over a history page that still shows
+# the previous video
+LOCAL_MATCH_HOLD = timedelta(minutes=5)
+# Videos whose maxres thumbnail probe result is remembered
+MAXRES_PROBE_CACHE_SIZE = 500
+
 
 class YouTubeDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching YouTube watch history data."""
 
-    def __init__(self, hass: HomeAssistant, cookies_path: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        cookies_path: str,
+        parse_backend: str = DEFAULT_PARSE_BACKEND,
+        recommended_count: int = DEFAULT_RECOMMENDED_COUNT,
+        feed_intervals: Mapping[str, int] | None = None,
+        request_budget: int = DEFAULT_REQUEST_BUDGET,
+        http2: bool = False,
+        enabled_feeds: Iterable[str] = OPTIONAL_FEEDS,
+        thumbnail_mode: str = DEFAULT_THUMBNAIL_MODE,
+        channel_store: Store | None = None,
+        watch_store: Store | None = None,
+        recording_dir: str | None = None,
+        record_pages: bool = DEFAULT_RECORD_PAGES,
+        base_url: str = ORIGIN,
+        thumbnail_url: str = THUMBNAIL_URL,
+    ) -> None:
         """Initialize the coordinator.
         
         Args:
             hass: Home Assistant instance
             cookies_path: Path to YouTube cookies file
+            parse_backend: Where to decode and extract pages (thread or process)
+            recommended_count: Number of recommended videos to extract
+            feed_intervals: Seconds between updates per feed, defaults for missing feeds
+            request_budget: Requests to YouTube allowed per hour
+            http2: Fetch pages over one multiplexed HTTP/2 connection
+            enabled_feeds: Optional feeds to fetch; the history is always fetched
+            thumbnail_mode: Probe for the best thumbnail or use the standard one
+            channel_store: Store the channel details are persisted in
+            watch_store: Store the watch statistics are persisted in
+            recording_dir: Directory parsed pages are recorded to
+            record_pages: Record the parsed pages, needs a recording_dir
+            base_url: YouTube base URL, overridden to run against a stub server
+            thumbnail_url: Thumbnail host URL prefix, overridden likewise
         """
         self.cookies_path = cookies_path
         self.cookies_valid = False
-        self.subscriptions_data = None
-        self.recommended_data = None
-        self._last_recommended_update = None
+        self.subscriptions_data: dict[str, Any] | None = None
+        self.recommended_data: list[VideoInfo] | None = None
+        # Latest history entries, newest first
+        self.history_data: list[VideoInfo] = []
+        self._refresh_lock = asyncio.Lock()
+        # Latest new uploads of subscribed channels, newest first
+        self.uploads_data: list[VideoInfo] = []
+        # Channel name -> last seen upload video_id
+        self.upload_watermarks: dict[str, str] = {}
+        # Videos seen in any feed, for resolving media player titles locally
+        self.title_index = TitleIndex()
+        # Blocking YouTube work runs here instead of the shared executor
+        self.executor = FetchExecutor(hass)
+        # Details the channels page leaves out, fetched in the background
+        self.channel_cache = ChannelCache(
+            hass,
+            self._async_fetch_channel_details,
+            channel_store,
+            on_fetched=self._async_channel_details_fetched,
+        )
+        # Hourly rollups of watched videos for the long-term statistics
+        self.watch_statistics = WatchStatistics(hass, watch_store)
+        # (matched video, video shown before, match time) until history confirms it
+        self._local_match: tuple[VideoInfo, str | None, datetime] | None = None
+        # Burst of history polls after a play event, see async_start_convergence
+        self._convergence_task: asyncio.Task[None] | None = None
+        self._history_only = False
+        # Outcome of the last burst, for diagnostics
+        self.last_convergence: dict[str, Any] | None = None
+        # Estimated position in the current video, driven by the media player
+        self.progress = PlaybackProgress()
+        # What the last change events announced, None until the first data
+        self._announced_video_id: str | None = None
+        self._announced_recommended: frozenset[str] | None = None
+        self.enabled_feeds = frozenset((FEED_HISTORY, *enabled_feeds))
+        self.feed_intervals = {
+            feed: default for feed, (_, default) in FEED_INTERVAL_OPTIONS.items()
+        }
+        self.feed_intervals.update(feed_intervals or {})
+        # Feed -> start of the cycle that last fetched and parsed its page
+        self._last_feed_update: dict[str, datetime] = {}
+        # Pages parsed per feed, tells a fetched feed from a deferred or failed one
+        self._parsed_pages: Counter[str] = Counter()
+        # Feeds the next cycles fetch regardless of their interval, until they do
+        self._forced_feeds: set[str] = set()
+        self.recommended_count = recommended_count
+        self.thumbnail_mode = thumbnail_mode
+        # Scrubbed copies of the parsed pages for offline replay, see recording.py
+        self.page_recorder = PageRecorder(recording_dir) if recording_dir else None
+        self.record_pages = record_pages
+        self.stats = RefreshStats()
+        self.budget = RequestBudget(request_budget)
+        self.base_url = base_url.rstrip("/")
+        self.thumbnail_url = thumbnail_url
+        self._parse_backend = create_parse_backend(hass, parse_backend, self.executor)
+        self._http2 = http2
+        # Created on first use in the executor, shared by every request
+        self._transport: Transport | None = None
+        self._transport_lock = threading.Lock()
+        # Separate client without the cookie jar, so the account cookies are
+        # never sent to the thumbnail hosts
+        self._thumbnail_transport: Transport | None = None
+        # Video ID -> whether it has a maxres thumbnail, oldest first
+        self._maxres_probes: dict[str, bool] = {}
+        # Cookie jar handed to the transport and the file mtime it was loaded at
+        self._cookie_jar: MozillaCookieJar | None = None
+        self._cookie_jar_mtime: float | None = None
+        self.auth_status: AuthStatus | None = None
+        # Cookie file mtime the auth status was computed for
+        self._auth_mtime: float | None = None
+        # (cookie file mtime, expiry) so the jar is only inspected once per version
+        self._cookie_expiry: tuple[float, CookieExpiry] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
+            update_interval=timedelta(seconds=self.feed_intervals[FEED_HISTORY]),
         )
 
-    async def _async_update_data(self) -> dict[str, Any] | None:
-        """Fetch data from YouTube.
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes, stop the parse backend and close the connections."""
+        await super().async_shutdown()
+        if self._convergence_task is not None:
+            self._convergence_task.cancel()
+            self._convergence_task = None
+        self.channel_cache.async_shutdown()
+        # Normally already done on unload; also covers a failed setup
+        await self.executor.async_shutdown()
+        await self._parse_backend.async_shutdown()
+        for transport in (self._transport, self._thumbnail_transport):
+            if transport is not None:
+                await self.hass.async_add_executor_job(transport.close)
+        self._transport = None
+        self._thumbnail_transport = None
+
+    @callback
+    def async_apply_options(
+        self,
+        recommended_count: int,
+        feed_intervals: Mapping[str, int],
+        thumbnail_mode: str,
+        request_budget: int,
+        record_pages: bool,
+    ) -> None:
+        """Apply changed options without recreating the coordinator.
+        
+        They take effect from the next refresh.
+        
+        Args:
+            recommended_count: Number of recommended videos to extract
+            feed_intervals: Seconds between updates per feed
+            thumbnail_mode: Probe for the best thumbnail or use the standard one
+            request_budget: Requests to YouTube allowed per hour
+            record_pages: Record the parsed pages
+        """
+        if recommended_count > self.recommended_count:
+            # The cached page was cut off at the old count
+            self._forced_feeds.add(FEED_RECOMMENDED)
+        self.recommended_count = recommended_count
+        self.feed_intervals.update(feed_intervals)
+        self.update_interval = timedelta(seconds=self.feed_intervals[FEED_HISTORY])
+        self.thumbnail_mode = thumbnail_mode
+        self.budget.set_rate(request_budget)
+        self.record_pages = record_pages
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the entities, then announce what changed."""
+        super().async_update_listeners()
+        self._async_announce_changes()
+
+    @callback
+    def _async_announce_changes(self) -> None:
+        """Fire an event if the current video or the recommended set changed.
+        
+        The first data after startup is only remembered. An empty or paused
+        history doesn't reset the current video, so it isn't announced again
+        when it reappears.
+        """
+        video = self.data
+        if video is not None and video.video_id != self._announced_video_id:
+            previous_id = self._announced_video_id
+            self._announced_video_id = video.video_id
+            if previous_id is not None:
+                self.progress.restart_if_stale(
+                    dt_util.utcnow(), timedelta(seconds=PROGRESS_START_GRACE_SECONDS)
+                )
+                self.hass.bus.async_fire(
+                    EVENT_VIDEO_CHANGED,
+                    {**video.as_dict(), "previous_video_id": previous_id},
+                )
+
+        if self.recommended_data:
+            recommended = frozenset(video.video_id for video in self.recommended_data)
+            if recommended != self._announced_recommended:
+                previous = self._announced_recommended
+                self._announced_recommended = recommended
+                if previous is not None:
+                    self.hass.bus.async_fire(
+                        EVENT_RECOMMENDED_CHANGED,
+                        {
+                            "videos": [video.as_dict() for video in self.recommended_data],
+                            "new_video_ids": [
+                                video.video_id
+                                for video in self.recommended_data
+                                if video.video_id not in previous
+                            ],
+                        },
+                    )
+
+    def feed_enabled(self, feed: str) -> bool:
+        """Return true if a feed is fetched at all."""
+        return feed in self.enabled_feeds
+
+    @property
+    def transport_name(self) -> str | None:
+        """Return the name of the HTTP client in use, once it exists."""
+        return self._transport.name if self._transport is not None else None
+
+    @property
+    def auth_known_bad(self) -> bool:
+        """Return true if YouTube said the cookies are logged out."""
+        return self.auth_status is not None and self.auth_status.valid is False
+
+    def async_start_auth_checks(self) -> CALLBACK_TYPE:
+        """Check the login periodically, independent of the feed refreshes.
         
         Returns:
-            Dictionary containing video information or None if no data
+            Callback that stops the checks
         """
-        try:
-            history_data = await self.hass.async_add_executor_job(
-                self._fetch_youtube_history
-            )
-            subscriptions_data = await self.hass.async_add_executor_job(
-                self._fetch_subscribed_channels
+        return async_track_time_interval(
+            self.hass,
+            self._async_scheduled_auth_check,
+            timedelta(seconds=AUTH_CHECK_INTERVAL_SECONDS),
+            name=f"{DOMAIN} auth check",
+        )
+
+    async def _async_scheduled_auth_check(self, _now: datetime) -> None:
+        """Run a scheduled auth check."""
+        await self.async_check_auth()
+
+    async def async_check_auth(self) -> AuthStatus:
+        """Check whether the cookies are still logged in.
+        
+        Returns:
+            New auth status, also cached on the coordinator
+        """
+        mtime, status = await self.executor.async_run(PRIORITY_HIGH, self._check_auth)
+        self._async_set_auth_status(status, mtime)
+        return status
+
+    def _async_set_auth_status(self, status: AuthStatus, mtime: float | None) -> None:
+        """Cache an auth status and notify the entities."""
+        previous = self.auth_status
+        self.auth_status = status
+        self._auth_mtime = mtime
+        if status.valid is False and (previous is None or previous.valid is not False):
+            _LOGGER.warning(
+                "YouTube cookies are not usable (%s), pausing feed updates "
+                "until the cookies file changes or the next auth check passes",
+                status.reason
             )
+        if status.valid is not None:
+            self.cookies_valid = status.valid
+        self.async_update_listeners()
+
+    async def _async_auth_usable(self) -> bool:
+        """Return false while auth is known bad and the cookies file is unchanged.
+        
+        The scheduled auth check probes again meanwhile and resumes the
+        updates once YouTube reports the session as logged in.
+        """
+        if not self.auth_known_bad:
+            return True
+        mtime = await self.hass.async_add_executor_job(self._cookies_mtime)
+        if mtime is not None and mtime != self._auth_mtime:
+            await self.async_check_auth()
+        return not self.auth_known_bad
+
+    def feed_updated(self, feed: str = FEED_HISTORY) -> datetime | None:
+        """Return when the cached data of a feed was last fetched."""
+        return self._last_feed_update.get(feed)
+
+    def _feed_due(self, feed: str, now: datetime) -> bool:
+        """Return true if an enabled feed is forced or its interval has passed."""
+        if feed not in self.enabled_feeds:
+            return False
+        if feed in self._forced_feeds:
+            return True
+        updated = self._last_feed_update.get(feed)
+        return updated is None or (now - updated).total_seconds() >= self.feed_intervals[feed]
+
+    async def async_refresh_if_stale(
+        self, max_age: float | None, feed: str = FEED_HISTORY
+    ) -> None:
+        """Refresh once if the cached feed is older than max_age seconds.
+        
+        Callers arriving while a refresh runs wait for it and share its
+        result instead of starting another one, as long as that refresh
+        fetched their feed.
+        
+        Args:
+            max_age: Accepted cache age in seconds, None accepts any age
+            feed: Feed whose cache age is checked
+        """
+        if max_age is None:
+            return
+
+        requested = dt_util.utcnow()
+        async with self._refresh_lock:
+            # Checked for the feed itself: a refresh that ran while we were
+            # waiting may have been for another feed and skipped this one
+            updated = self.feed_updated(feed)
+            if updated is not None and (
+                updated >= requested
+                or (dt_util.utcnow() - updated).total_seconds() < max_age
+            ):
+                return
+
+            # Make the refresh include the feed's page; a deferred page keeps
+            # its old data and update time and is fetched by a later cycle
+            self._forced_feeds.add(feed)
+            await self.async_refresh()
+
+    @callback
+    def async_resolve_title(self, media_title: str) -> VideoInfo | None:
+        """Show the indexed video matching a media player title right away.
+        
+        The next history fetch confirms the match; until it does, a history
+        page still showing the previous video doesn't undo it.
+        
+        Args:
+            media_title: Title reported by the media player
             
-            current_time = datetime.now()
-            should_update_recommended = (
-                self._last_recommended_update is None or
-                (current_time - self._last_recommended_update).total_seconds() >= SCAN_INTERVAL_RECOMMENDED_SECONDS
-            )
+        Returns:
+            Matched video or None if the title is not indexed
+        """
+        match = self.title_index.lookup(media_title)
+        if match is None:
+            return None
+
+        current = self.data
+        if current is not None and current.video_id == match.video.video_id:
+            return match.video
+
+        _LOGGER.debug(
+            "Matched %s to %s locally (score %.2f)",
+            media_title, match.video.video_id, match.score
+        )
+        self._local_match = (
+            match.video,
+            current.video_id if current else None,
+            dt_util.utcnow(),
+        )
+        self.async_set_updated_data(match.video)
+        return match.video
+
+    @callback
+    def async_start_convergence(self, media_title: str) -> None:
+        """Refresh now, then poll the history until it shows the new video.
+        
+        YouTube takes a few seconds to add a watch to the history, so the
+        refresh right after a play event often still finds the previous
+        video. A short burst of history-only polls at growing intervals
+        follows; it stops once the top of the history changed or matches
+        the title, or after the last poll. A new play event replaces a
+        running burst.
+        
+        Args:
+            media_title: Title reported by the media player
+        """
+        if self._convergence_task is not None:
+            self._convergence_task.cancel()
+        previous_id = self.history_data[0].video_id if self.history_data else None
+        self._convergence_task = self.hass.async_create_background_task(
+            self._async_converge(normalize_title(media_title), previous_id),
+            f"{DOMAIN} history convergence",
+        )
+
+    async def _async_converge(self, title: str, previous_id: str | None) -> None:
+        """Run the refresh and history polls of one convergence burst."""
+        start = self.hass.loop.time()
+        await self.async_refresh()
+        polls = 0
+        converged = self._history_converged(title, previous_id)
+        for delay in CONVERGENCE_DELAYS_SECONDS:
+            if converged:
+                break
+            await asyncio.sleep(delay)
+            self._history_only = True
+            try:
+                await self.async_refresh()
+            finally:
+                self._history_only = False
+            polls += 1
+            converged = self._history_converged(title, previous_id)
+
+        _LOGGER.debug(
+            "History %s after %d extra polls",
+            "caught up" if converged else "did not catch up", polls
+        )
+        self.last_convergence = {
+            "converged": converged,
+            "polls": polls,
+            "seconds": round(self.hass.loop.time() - start, 1),
+        }
+
+    def _history_converged(self, title: str, previous_id: str | None) -> bool:
+        """Return true if the history shows a video other than before the play event."""
+        if not self.history_data:
+            return False
+        top = self.history_data[0]
+        return top.video_id != previous_id or normalize_title(top.title) == title
+
+    def _confirm_local_match(self, history_top: VideoInfo | None) -> VideoInfo | None:
+        """Reconcile a fetched history page with a pending local match.
+        
+        Args:
+            history_top: Most recent video of the fetched history page
             
-            if should_update_recommended:
-                recommended_data = await self.hass.async_add_executor_job(
-                    self._fetch_recommended_videos
+        Returns:
+            Video to show as currently watched
+        """
+        if self._local_match is None:
+            return history_top
+
+        video, previous_id, matched_at = self._local_match
+        if history_top is not None and history_top.video_id == video.video_id:
+            self._local_match = None
+            return history_top
+
+        lagging = history_top is None or history_top.video_id == previous_id
+        if lagging and dt_util.utcnow() - matched_at < LOCAL_MATCH_HOLD:
+            return video
+
+        # History moved on to something else, trust it
+        self._local_match = None
+        return history_top
+
+    async def _async_update_data(self) -> VideoInfo | None:
+        """Fetch data from YouTube.
+        
+        Returns:
+            Most recently watched video or None if no data
+        """
+        with self.stats.stage(REFRESH, STAGE_TOTAL):
+            return await self._async_fetch_feeds()
+
+    async def _async_fetch_feeds(self) -> VideoInfo | None:
+        """Fetch every feed that is due.
+        
+        Returns:
+            Most recently watched video or None if no data
+        """
+        # Don't download three full pages just to find out we're logged out
+        if not await self._async_auth_usable():
+            self.cookies_valid = False
+            return None
+
+        # Intervals are measured between cycle starts, so a feed with the
+        # coordinator's own interval is fetched every cycle
+        current_time = dt_util.utcnow()
+
+        try:
+            # Deferred feeds keep their previous data until the budget allows
+            history_data = self.data
+            if self._take_budget(FEED_HISTORY):
+                history_data = await self._async_fetch_timed(
+                    FEED_HISTORY, self._async_fetch_youtube_history, current_time
                 )
-                self.recommended_data = recommended_data
-                self._last_recommended_update = current_time
-            
-            self.subscriptions_data = subscriptions_data
+                self.title_index.add_many(self.history_data)
+                self.watch_statistics.async_record(self.history_data)
+                history_data = self._confirm_local_match(history_data)
+            if self.auth_known_bad:
+                # The history page came back logged out
+                return None
+
+            fetches: list[Callable[[], Awaitable[None]]] = []
+
+            async def fetch_subscriptions() -> None:
+                subscriptions_data = await self._async_fetch_timed(
+                    FEED_SUBSCRIPTIONS, self._async_fetch_subscribed_channels, current_time
+                )
+                if subscriptions_data is not None:
+                    self.subscriptions_data = subscriptions_data
+
+            async def fetch_recommended() -> None:
+                recommended_data = await self._async_fetch_timed(
+                    FEED_RECOMMENDED, self._async_fetch_recommended_videos, current_time
+                )
+                if recommended_data is not None:
+                    self.recommended_data = recommended_data
+                    self.title_index.add_many(recommended_data)
+
+            async def fetch_uploads() -> None:
+                await self._async_fetch_timed(
+                    FEED_UPLOADS, self._async_fetch_uploads, current_time
+                )
+
+            for feed, fetch in (
+                (FEED_SUBSCRIPTIONS, fetch_subscriptions),
+                (FEED_RECOMMENDED, fetch_recommended),
+                (FEED_UPLOADS, fetch_uploads),
+            ):
+                if self._history_only:
+                    # Convergence poll, only the history matters
+                    break
+                if self._feed_due(feed, current_time) and self._take_budget(feed):
+                    fetches.append(fetch)
+
+            if self._transport is not None and self._transport.multiplexed:
+                # Streams of one HTTP/2 connection, no extra connections needed
+                await asyncio.gather(*(fetch() for fetch in fetches))
+            else:
+                for fetch in fetches:
+                    await fetch()
             
-            if subscriptions_data is not None or history_data is not None or self.recommended_data is not None:
+            subscriptions_data = self.subscriptions_data
+
+            if not self.auth_known_bad and (
+                subscriptions_data is not None or history_data is not None or self.recommended_data is not None
+            ):
                 self.cookies_valid = True
             
             return history_data
@@ -79,545 +635,560 @@ class YouTubeDataCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error fetching YouTube data: %s", err)
             raise UpdateFailed(f"Error communicating with YouTube: {err}") from err
 
-    def _get_session(self) -> requests.Session | None:
-        """Create and return a session with cookies.
+    def _take_budget(self, feed: str) -> bool:
+        """Take a request token for a feed page.
         
+        Args:
+            feed: Feed name of the page
+            
         Returns:
-            Requests session with loaded cookies or None if failed
+            True if the page may be downloaded now
         """
-        if not os.path.exists(self.cookies_path):
-            _LOGGER.error("Cookies file not found at path: %s", self.cookies_path)
-            self.cookies_valid = False
-            return None
-        
-        cookie_jar = MozillaCookieJar(self.cookies_path)
-        try:
-            cookie_jar.load(ignore_discard=True, ignore_expires=True)
-        except OSError as err:
-            _LOGGER.error(
-                "Failed to load cookies file: %s. Error: %s. "
-                "Please make sure the file is in Netscape format.",
-                self.cookies_path, err
-            )
-            self.cookies_valid = False
-            return None
-        except Exception as err:
-            _LOGGER.error(
-                "Unexpected error loading cookies: %s. "
-                "The cookies file might be corrupted.",
-                err
-            )
-            self.cookies_valid = False
-            return None
+        if self.budget.try_acquire(FEED_PRIORITIES[feed]):
+            return True
+        _LOGGER.debug("Request budget is running low, deferring the %s page", feed)
+        return False
 
-        if len(cookie_jar) == 0:
-            _LOGGER.error("Cookies file is empty: %s", self.cookies_path)
-            self.cookies_valid = False
-            return None
-
-        session = requests.Session()
-        session.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                          "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-us,en;q=0.5",
-            "Sec-Fetch-Mode": "navigate",
-        }
-        session.cookies = cookie_jar
+    async def _async_fetch_timed(
+        self, feed: str, fetch: Callable[[], Awaitable[_T]], started: datetime
+    ) -> _T:
+        """Run a feed fetcher and time it as a whole.
+        
+        The feed's update time only moves when its page was parsed, so a
+        failed or shed fetch doesn't make old data look fresh.
         
-        return session
+        Args:
+            feed: Feed name the fetcher belongs to
+            fetch: Fetch coroutine function
+            started: Start of the refresh cycle
+            
+        Returns:
+            Result of the fetcher
+        """
+        parsed = self._parsed_pages[feed]
+        with self.stats.stage(feed, STAGE_TOTAL) as sample:
+            try:
+                result = await fetch()
+            except JobRejected as err:
+                # The feed keeps its previous data, like a deferred page
+                _LOGGER.debug("Skipping the %s page: %s", feed, err)
+                result = None
+            if result is None:
+                sample.outcome = OUTCOME_EMPTY
+        if self._parsed_pages[feed] != parsed:
+            self._last_feed_update[feed] = started
+            self._forced_feeds.discard(feed)
+        return result
 
-    def _fetch_youtube_history(self) -> dict[str, Any] | None:
+    async def _async_fetch_youtube_history(self) -> VideoInfo | None:
         """Fetch the most recent watch history from YouTube.
         
         Returns:
-            Dictionary containing the most recent video information or None
+            Most recently watched video or None
         """
-        session = self._get_session()
-        if session is None:
+        body = await self.executor.async_run(
+            FEED_PRIORITIES[FEED_HISTORY],
+            self._download_feed,
+            FEED_HISTORY,
+            f"{self.base_url}{HISTORY_PATH}",
+            True,
+        )
+        if body is None:
             return None
 
         try:
-            response = session.get("https://www.youtube.com/feed/history", timeout=10)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("YouTube history request error: %s", err)
+            result = await self._async_parse(FEED_HISTORY, body, DEFAULT_HISTORY_COUNT)
+        except (AttributeError, json.JSONDecodeError, KeyError) as err:
+            _LOGGER.error("Can't parse JSON: %s", err)
             return None
 
-        try:
-            cookie_jar = MozillaCookieJar(self.cookies_path)
-            cookie_jar.load(ignore_discard=True, ignore_expires=True)
-            cookie_jar.save(ignore_discard=True, ignore_expires=True)
-        except Exception:
-            pass
+        self.history_data = result.history
 
-        html = response.text
+        if not result.found:
+            _LOGGER.error("Cannot find ytInitialData")
+            return None
 
-        try:
-            regex = r"var ytInitialData\s*=\s*({.*?});"
-            match = re.search(regex, html, re.DOTALL)
-            if not match:
-                alt_regex = r"ytInitialData\s*=\s*({.*?});"
-                match = re.search(alt_regex, html, re.DOTALL)
-                if not match:
-                    _LOGGER.error("Cannot find ytInitialData")
-                    return None
+        if result.records is None:
+            return None
 
-            data = json.loads(match.group(1))
+        return await self.executor.async_run(
+            FEED_PRIORITIES[FEED_HISTORY],
+            self._with_best_thumbnail,
+            FEED_HISTORY,
+            result.records,
+        )
 
-        except (AttributeError, json.JSONDecodeError, KeyError) as err:
-            _LOGGER.error("Can't parse JSON: %s", err)
+    async def _async_fetch_recommended_videos(self) -> list[VideoInfo] | None:
+        """Fetch recommended videos from YouTube.
+        
+        Returns:
+            List of recommended videos or None
+        """
+        body = await self.executor.async_run(
+            FEED_PRIORITIES[FEED_RECOMMENDED],
+            self._download_feed,
+            FEED_RECOMMENDED,
+            f"{self.base_url}{RECOMMENDED_PATH}",
+        )
+        if body is None:
             return None
 
-        # Try multiple paths to find video content
-        path = None
-        
-        # Path 1: Standard path
         try:
-            path = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][0]["tabRenderer"] \
-                       ["content"]["sectionListRenderer"]["contents"][0]["itemSectionRenderer"]["contents"]
-        except (KeyError, TypeError, IndexError):
-            pass
-                
-        # Path 2: Iterate through tabs
-        if path is None:
-            try:
-                tabs = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]
-                for i, tab in enumerate(tabs):
-                    if "tabRenderer" in tab:
-                        content = tab["tabRenderer"].get("content", {})
-                        if "sectionListRenderer" in content:
-                            sections = content["sectionListRenderer"].get("contents", [])
-                            for j, section in enumerate(sections):
-                                if "itemSectionRenderer" in section:
-                                    contents = section["itemSectionRenderer"].get("contents", [])
-                                    if contents:
-                                        path = contents
-                                        break
-                        if path:
-                            break
-            except (KeyError, TypeError):
-                pass
-
-        if not path:
-            _LOGGER.error("Could not find videos in history")
+            result = await self._async_parse(
+                FEED_RECOMMENDED, body, self.recommended_count
+            )
+        except (AttributeError, json.JSONDecodeError, KeyError) as err:
+            _LOGGER.error("Can't parse recommended videos JSON: %s", err)
             return None
 
-        # Check for messageRenderer (empty history or paused)
-        for item in path:
-            if isinstance(item, dict) and "messageRenderer" in item:
-                return None
-        
-        # Find video: Try lockupViewModel first, then videoRenderer, then Shorts
-        video_data = None
-        
-        # Step 1: Look for lockupViewModel (new YouTube format)
-        for item in path:
-            if isinstance(item, dict) and "lockupViewModel" in item:
-                lockup = item["lockupViewModel"]
-                content_type = lockup.get("contentType", "")
-                if content_type == "LOCKUP_CONTENT_TYPE_VIDEO":
-                    video_data = self._extract_lockup_info(lockup)
-                    if video_data:
-                        return video_data
-        
-        # Step 2: Look for videoRenderer (old YouTube format)
-        for item in path:
-            if isinstance(item, dict):
-                if "videoRenderer" in item:
-                    video_data = self._extract_video_renderer_info(item["videoRenderer"])
-                    if video_data:
-                        return video_data
-                elif "richItemRenderer" in item:
-                    content = item["richItemRenderer"].get("content", {})
-                    if "videoRenderer" in content:
-                        video_data = self._extract_video_renderer_info(content["videoRenderer"])
-                        if video_data:
-                            return video_data
-        
-        # Step 3: Look for Shorts
-        for item in path:
-            if isinstance(item, dict):
-                if "reelShelfRenderer" in item:
-                    reel_shelf = item["reelShelfRenderer"]
-                    reel_items = reel_shelf.get("items", [])
-                    for reel_item in reel_items:
-                        if "shortsLockupViewModel" in reel_item:
-                            video_data = self._extract_shorts_info(reel_item["shortsLockupViewModel"])
-                            if video_data:
-                                return video_data
-
-        _LOGGER.error("No video found in history")
-        return None
-
-    def _fetch_recommended_videos(self) -> list[dict[str, Any]] | None:
-        """Fetch recommended videos from YouTube.
+        if not result.records:
+            return None
+
+        return await self.executor.async_run(
+            FEED_PRIORITIES[FEED_RECOMMENDED],
+            self._with_best_thumbnails,
+            FEED_RECOMMENDED,
+            result.records,
+        )
+
+    async def _async_fetch_subscribed_channels(self) -> dict[str, Any] | None:
+        """Fetch subscribed channels from YouTube.
         
         Returns:
-            List of dictionaries containing recommended video information or None
+            Dictionary containing subscription information or None if fetch fails
         """
-        session = self._get_session()
-        if session is None:
+        body = await self.executor.async_run(
+            FEED_PRIORITIES[FEED_SUBSCRIPTIONS],
+            self._download_feed,
+            FEED_SUBSCRIPTIONS,
+            f"{self.base_url}{SUBSCRIPTIONS_PATH}",
+        )
+        if body is None:
             return None
 
         try:
-            response = session.get("https://www.youtube.com", timeout=10)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("YouTube recommended request error: %s", err)
+            result = await self._async_parse(FEED_SUBSCRIPTIONS, body)
+        except (AttributeError, json.JSONDecodeError, KeyError) as err:
+            _LOGGER.error("Can't parse subscriptions JSON: %s", err)
             return None
 
-        html = response.text
+        if not result.found:
+            return None
 
-        try:
-            regex = r"var ytInitialData\s*=\s*({.*?});"
-            match = re.search(regex, html, re.DOTALL)
-            if not match:
-                return None
+        channels = self.channel_cache.enrich(result.records or [])
+        self.channel_cache.async_schedule(channels)
+        return {
+            "total_count": len(channels),
+            "channels": channels,
+        }
 
-            data = json.loads(match.group(1))
+    @callback
+    def _async_channel_details_fetched(self) -> None:
+        """Show newly fetched channel details without waiting for the next update."""
+        if self.subscriptions_data is None:
+            return
+        self.subscriptions_data = {
+            **self.subscriptions_data,
+            "channels": self.channel_cache.enrich(self.subscriptions_data["channels"]),
+        }
+        self.async_update_listeners()
 
-            tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
+    async def _async_fetch_channel_details(self, channel_id: str) -> dict[str, str] | None:
+        """Fetch the header details of one channel in the executor.
+        
+        Args:
+            channel_id: YouTube channel ID
             
-            videos = []
+        Returns:
+            Details found, or None if the request can't be made or failed
+        """
+        try:
+            return await self.executor.async_run(
+                PRIORITY_LOW, self._fetch_channel_details, channel_id
+            )
+        except JobRejected as err:
+            _LOGGER.debug("Can't fetch details of channel %s: %s", channel_id, err)
+            return None
+
+    def _fetch_channel_details(self, channel_id: str) -> dict[str, str] | None:
+        """Fetch the header details of one channel.
+        
+        Args:
+            channel_id: YouTube channel ID
             
-            for tab in tabs:
-                tab_renderer = tab.get("tabRenderer", {})
-                if tab_renderer.get("selected"):
-                    rich_grid = tab_renderer.get("content", {}).get("richGridRenderer", {})
-                    grid_contents = rich_grid.get("contents", [])
-                    
-                    for item in grid_contents:
-                        rich_item = item.get("richItemRenderer", {})
-                        content = rich_item.get("content", {})
-                        
-                        if "lockupViewModel" in content:
-                            lockup = content["lockupViewModel"]
-                            content_type = lockup.get("contentType", "")
-                            if content_type == "LOCKUP_CONTENT_TYPE_VIDEO":
-                                video_info = self._extract_lockup_info(lockup)
-                                if video_info:
-                                    videos.append(video_info)
-                        
-                        elif "videoRenderer" in content:
-                            video_info = self._extract_video_renderer_info(content["videoRenderer"])
-                            if video_info:
-                                videos.append(video_info)
-                        
-                        if len(videos) >= 3:
-                            break
-                    
-                    break
+        Returns:
+            Details found, or None if the request can't be made or failed
+        """
+        # Channel details are nice to have, they go first when requests are scarce
+        if self._transport is None or not self.budget.try_acquire(PRIORITY_LOW):
+            return None
 
-            if videos:
-                return videos
-            else:
+        with self.stats.stage(FEED_SUBSCRIPTIONS, STAGE_CHANNEL_DETAILS) as sample:
+            try:
+                status, body = self._transport.post(
+                    f"{self.base_url}{CHANNEL_DETAILS_PATH}",
+                    {"context": {"client": INNERTUBE_CLIENT}, "browseId": channel_id},
+                    headers={"Content-Type": "application/json"},
+                    timeout=10,
+                )
+                if status >= 400:
+                    raise TransportError(f"Channel details answered {status}")
+                sample.nbytes = len(body)
+                return parse_channel_details(loads(body))
+            except (TransportError, ValueError, AttributeError) as err:
+                _LOGGER.debug("Can't fetch details of channel %s: %s", channel_id, err)
+                sample.outcome = OUTCOME_ERROR
                 return None
 
+    async def _async_fetch_uploads(self) -> list[VideoInfo] | None:
+        """Fetch the uploads of subscribed channels newer than the watermarks.
+        
+        The first poll only sets the watermarks; later polls fire an event
+        for every new upload.
+        
+        Returns:
+            New uploads, newest first, or None if the fetch failed
+        """
+        body = await self.executor.async_run(
+            FEED_PRIORITIES[FEED_UPLOADS],
+            self._download_feed,
+            FEED_UPLOADS,
+            f"{self.base_url}{UPLOADS_PATH}",
+        )
+        if body is None:
+            return None
+
+        try:
+            result = await self._async_parse(
+                FEED_UPLOADS,
+                body,
+                MAX_NEW_UPLOADS,
+                # Recent uploads too, in case a watermark video was deleted
+                frozenset(self.upload_watermarks.values()).union(
+                    video.video_id for video in self.uploads_data
+                ),
+            )
         except (AttributeError, json.JSONDecodeError, KeyError) as err:
-            _LOGGER.error("Can't parse recommended videos JSON: %s", err)
+            _LOGGER.error("Can't parse subscription uploads JSON: %s", err)
+            return None
+
+        if not result.found:
             return None
 
-    def _extract_lockup_info(self, lockup: dict) -> dict[str, Any] | None:
-        """Extract information from lockupViewModel.
+        uploads = result.records or []
+        baseline = not self.upload_watermarks
+
+        # Oldest first, so the newest upload of every channel ends up as its watermark
+        for video in reversed(uploads):
+            self.upload_watermarks[video.channel] = video.video_id
+            if not baseline:
+                self.hass.bus.async_fire(EVENT_NEW_UPLOAD, video.as_dict())
+
+        self.title_index.add_many(uploads)
+        self.uploads_data = (uploads + self.uploads_data)[:DEFAULT_UPLOADS_COUNT]
+        return uploads
+
+    async def _async_parse(
+        self,
+        feed: str,
+        body: bytes,
+        limit: int = DEFAULT_RECOMMENDED_COUNT,
+        known: frozenset[str] = frozenset(),
+    ) -> ParseResult:
+        """Parse a downloaded page with the configured backend.
         
         Args:
-            lockup: lockupViewModel dictionary from YouTube API
+            feed: Feed name the page belongs to
+            body: Raw response body
+            limit: Maximum number of recommended videos or history entries to extract
+            known: Upload watermarks, video IDs the uploads walk stops at
             
         Returns:
-            Dictionary containing video information or None if extraction fails
+            Parse result with the extracted records
         """
+        result = await self._parse_backend.async_parse(feed, body, limit, known)
+        if result.found:
+            self._parsed_pages[feed] += 1
+
+        if result.logged_in is False:
+            self._async_set_auth_status(
+                AuthStatus(
+                    valid=False,
+                    reason=REASON_LOGGED_OUT,
+                    checked_at=dt_util.utcnow(),
+                    expiry=self.auth_status.expiry if self.auth_status else None,
+                ),
+                await self.hass.async_add_executor_job(self._cookies_mtime),
+            )
+
+        # Stage timings were measured wherever the parse ran
+        for stage, duration in result.timings.items():
+            sample = StageSample(duration=duration)
+            if stage == STAGE_REGEX:
+                sample.nbytes = result.raw_bytes
+                if not result.found:
+                    sample.outcome = OUTCOME_EMPTY
+            self.stats.add(feed, stage, sample)
+
+        if self.record_pages and self.page_recorder is not None and result.found:
+            # Off the refresh path; a shed or failed recording is just skipped
+            self.hass.async_create_background_task(
+                self._async_record_page(feed, body), f"{DOMAIN} record {feed} page"
+            )
+
+        return result
+
+    async def _async_record_page(self, feed: str, body: bytes) -> None:
+        """Save a scrubbed copy of a parsed page."""
         try:
-            video_id = lockup.get("contentId")
-            if not video_id:
-                return None
-            
-            metadata = lockup.get("metadata", {}).get("lockupMetadataViewModel", {})
-            
-            title = metadata.get("title", {}).get("content", "N/A")
-            if title and isinstance(title, str):
-                title = title.strip()
-            else:
-                title = "N/A"
-            
-            channel = "N/A"
-            metadata_rows = metadata.get("metadata", {}).get("contentMetadataViewModel", {}).get("metadataRows", [])
-            if metadata_rows:
-                first_row = metadata_rows[0]
-                parts = first_row.get("metadataParts", [])
-                if parts:
-                    channel = parts[0].get("text", {}).get("content", "N/A")
-                    if channel and isinstance(channel, str):
-                        channel = channel.strip()
-                    else:
-                        channel = "N/A"
-            
-            # Extract duration
-            duration = "N/A"
-            
-            thumbnail = lockup.get("contentImage", {}).get("thumbnailViewModel", {})
-            overlays = thumbnail.get("overlays", [])
-            
-            for overlay in overlays:
-                if "thumbnailOverlayBadgeViewModel" in overlay:
-                    badge_vm = overlay["thumbnailOverlayBadgeViewModel"]
-                    badges = badge_vm.get("thumbnailBadges", [])
-                    for badge in badges:
-                        if "thumbnailBadgeViewModel" in badge:
-                            badge_data = badge["thumbnailBadgeViewModel"]
-                            badge_text = badge_data.get("text", "")
-                            badge_style = badge_data.get("badgeStyle", "")
-                            
-                            if badge_style == "THUMBNAIL_OVERLAY_BADGE_STYLE_LIVE" or badge_text in ["라이브", "LIVE"]:
-                                duration = "LIVE"
-                                break
-                            elif badge_text and re.match(r'^\d{1,2}:\d{2}', badge_text):
-                                duration = badge_text
-                                break
-                    if duration != "N/A":
-                        break
-                
-                elif "thumbnailOverlayTimeStatusRenderer" in overlay:
-                    time_status = overlay["thumbnailOverlayTimeStatusRenderer"]
-                    text_obj = time_status.get("text", {})
-                    if "simpleText" in text_obj:
-                        duration = text_obj["simpleText"]
-                        break
-                    elif "accessibility" in text_obj:
-                        duration = text_obj["accessibility"].get("accessibilityData", {}).get("label", "N/A")
-                        break
-                
-                elif "thumbnailBottomOverlayViewModel" in overlay:
-                    badges = overlay["thumbnailBottomOverlayViewModel"].get("badges", [])
-                    for badge in badges:
-                        if "thumbnailBadgeViewModel" in badge:
-                            duration = badge["thumbnailBadgeViewModel"].get("text", "N/A")
-                            break
-                    if duration != "N/A":
-                        break
-            
-            if duration == "N/A":
-                for row in metadata_rows:
-                    parts = row.get("metadataParts", [])
-                    for part in parts:
-                        text = part.get("text", {}).get("content", "")
-                        if re.match(r'^\d{1,2}:\d{2}(:\d{2})?$', text):
-                            duration = text
-                            break
-                    if duration != "N/A":
-                        break
-            
-            output = {
-                "channel": channel,
-                "title": title,
-                "video_id": video_id,
-                "duration": duration,
-                "thumbnail": self._get_best_thumbnail(video_id),
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-
-            return output
-            
-        except Exception as err:
-            _LOGGER.error("Failed to extract lockupViewModel: %s", err)
-            return None
+            await self.executor.async_run(PRIORITY_LOW, self.page_recorder.record, feed, body)
+        except JobRejected:
+            _LOGGER.debug("Skipped recording the %s page, executor busy", feed)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Failed to record the %s page: %s", feed, err)
 
-    def _extract_video_renderer_info(self, video_renderer: dict) -> dict[str, Any] | None:
-        """Extract information from videoRenderer.
+    def _get_session(self) -> Transport | None:
+        """Return the shared transport with the current cookies loaded.
+        
+        The cookies file is only parsed again when it changed on disk.
         
-        Args:
-            video_renderer: videoRenderer dictionary from YouTube API
-            
         Returns:
-            Dictionary containing video information or None if extraction fails
+            Transport with loaded cookies or None if failed
         """
+        if not os.path.exists(self.cookies_path):
+            _LOGGER.error("Cookies file not found at path: %s", self.cookies_path)
+            self.cookies_valid = False
+            return None
+
+        with self._transport_lock:
+            if self._transport is None:
+                self._transport = create_transport(self._http2)
+
+            mtime = self._cookies_mtime()
+            if self._cookie_jar is not None and mtime == self._cookie_jar_mtime:
+                return self._transport
+        
+            cookie_jar = MozillaCookieJar(self.cookies_path)
+            try:
+                cookie_jar.load(ignore_discard=True, ignore_expires=True)
+            except OSError as err:
+                _LOGGER.error(
+                    "Failed to load cookies file: %s. Error: %s. "
+                    "Please make sure the file is in Netscape format.",
+                    self.cookies_path, err
+                )
+                self.cookies_valid = False
+                return None
+            except Exception as err:
+                _LOGGER.error(
+                    "Unexpected error loading cookies: %s. "
+                    "The cookies file might be corrupted.",
+                    err
+                )
+                self.cookies_valid = False
+                return None
+
+            if len(cookie_jar) == 0:
+                _LOGGER.error("Cookies file is empty: %s", self.cookies_path)
+                self.cookies_valid = False
+                return None
+
+            self._transport.set_cookies(cookie_jar)
+            self._cookie_jar = cookie_jar
+            self._cookie_jar_mtime = mtime
+            return self._transport
+
+    def _cookies_mtime(self) -> float | None:
+        """Return the modification time of the cookies file."""
         try:
-            video_id = video_renderer.get("videoId", "N/A")
-            
-            title = "N/A"
-            if "title" in video_renderer:
-                title_data = video_renderer["title"]
-                if "runs" in title_data and len(title_data["runs"]) > 0:
-                    title = title_data["runs"][0].get("text", "N/A")
-                elif "simpleText" in title_data:
-                    title = title_data["simpleText"]
-                
-                if title and isinstance(title, str):
-                    title = title.strip()
-                else:
-                    title = "N/A"
-            
-            channel = "N/A"
-            for key in ["longBylineText", "shortBylineText", "ownerText"]:
-                if key in video_renderer:
-                    byline = video_renderer[key]
-                    if "runs" in byline and len(byline["runs"]) > 0:
-                        channel = byline["runs"][0].get("text", "N/A")
-                        break
-                    elif "simpleText" in byline:
-                        channel = byline["simpleText"]
-                        break
-            
-            if channel and isinstance(channel, str):
-                channel = channel.strip()
-            else:
-                channel = "N/A"
-            
-            output = {
-                "channel": channel,
-                "title": title,
-                "video_id": video_id,
-                "duration": video_renderer.get("lengthText", {}).get("simpleText", "N/A"),
-                "thumbnail": self._get_best_thumbnail(video_id),
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-
-            return output
-            
-        except Exception as err:
-            _LOGGER.error("Failed to extract videoRenderer: %s", err)
+            return os.path.getmtime(self.cookies_path)
+        except OSError:
             return None
 
-    def _extract_shorts_info(self, shorts_data: dict) -> dict[str, Any] | None:
-        """Extract information from shortsLockupViewModel.
+    def _check_auth(self) -> tuple[float | None, AuthStatus]:
+        """Inspect the cookie expiry and probe the login.
+        
+        Only YouTube's own logged_in flag makes the status invalid. Missing
+        auth cookies and expiry times are guesses about a cookie export, so
+        they only explain an unknown status.
+        
+        Returns:
+            Cookie file mtime and the resulting auth status
+        """
+        mtime = self._cookies_mtime()
+        transport = self._load_session(AUTH)
+        if mtime is None or transport is None:
+            return mtime, AuthStatus(None, REASON_MISSING_COOKIES, dt_util.utcnow())
+
+        if self._cookie_expiry is None or self._cookie_expiry[0] != mtime:
+            self._cookie_expiry = (mtime, read_cookie_expiry(self._cookie_jar))
+        expiry = self._cookie_expiry[1]
+        if expiry.missing:
+            _LOGGER.debug("Cookies file lacks auth cookies: %s", ", ".join(expiry.missing))
+
+        logged_in = None
+        # The probe request is signed with SAPISID, without it only the pages tell
+        if expiry.sapisid is not None and self.budget.try_acquire(PRIORITY_HIGH):
+            with self.stats.stage(AUTH, STAGE_TOTAL) as sample:
+                try:
+                    logged_in = probe_login(transport, expiry.sapisid, self.base_url)
+                except TransportError as err:
+                    _LOGGER.debug("YouTube login probe failed: %s", err)
+                    sample.outcome = OUTCOME_ERROR
+
+        if logged_in is not None:
+            reason = REASON_OK if logged_in else REASON_LOGGED_OUT
+        elif expiry.missing:
+            reason = REASON_MISSING_COOKIES
+        elif expiry.expired:
+            reason = REASON_EXPIRED
+        else:
+            reason = REASON_UNKNOWN
+        return mtime, AuthStatus(logged_in, reason, dt_util.utcnow(), expiry)
+
+    def _load_session(self, feed: str) -> Transport | None:
+        """Get the transport for a feed, timing the cookie load.
         
         Args:
-            shorts_data: shortsLockupViewModel dictionary from YouTube API
+            feed: Feed name the transport is used for
             
         Returns:
-            Dictionary containing Shorts video information or None if extraction fails
+            Transport with loaded cookies or None if failed
         """
-        try:
-            entity_id = shorts_data.get("entityId", "")
-            video_id = entity_id.split("-")[-1] if entity_id else None
-            
-            if not video_id or video_id == "item":
-                on_tap = shorts_data.get("onTap", {})
-                innertube = on_tap.get("innertubeCommand", {})
-                reel_watch = innertube.get("reelWatchEndpoint", {})
-                video_id = reel_watch.get("videoId")
-            
-            if not video_id:
-                return None
-            
-            overlay = shorts_data.get("overlayMetadata", {})
-            title = overlay.get("primaryText", {}).get("content", "YouTube Shorts")
-            
-            if title and isinstance(title, str):
-                title = title.strip()
-            else:
-                title = "YouTube Shorts"
-            
-            output = {
-                "channel": "YouTube Shorts",
-                "title": title,
-                "video_id": video_id,
-                "duration": "Shorts",
-                "thumbnail": self._get_best_thumbnail(video_id),
-                "url": f"https://www.youtube.com/shorts/{video_id}",
-            }
-            
-            return output
-            
-        except Exception as err:
-            _LOGGER.error("Failed to extract Shorts info: %s", err)
-            return None
+        with self.stats.stage(feed, STAGE_COOKIE_LOAD) as sample:
+            transport = self._get_session()
+            if transport is None:
+                sample.outcome = OUTCOME_ERROR
+        return transport
 
-    def _fetch_subscribed_channels(self) -> dict[str, Any] | None:
-        """Fetch subscribed channels from YouTube.
+    def _download_feed(self, feed: str, url: str, save_cookies: bool = False) -> bytes | None:
+        """Download a feed page, timing the connect and download stages.
         
+        Args:
+            feed: Feed name the page belongs to
+            url: Page URL
+            save_cookies: Write the cookie jar back after the request
+            
         Returns:
-            Dictionary containing subscription information or None if fetch fails
+            Raw response body or None if the request failed
         """
-        session = self._get_session()
-        if session is None:
+        transport = self._load_session(feed)
+        if transport is None:
             return None
 
         try:
-            response = session.get("https://www.youtube.com/feed/channels", timeout=10)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as err:
-            _LOGGER.error("YouTube subscriptions request error: %s", err)
+            with self.stats.stage(feed, STAGE_CONNECT):
+                # Returns after the headers so the body is timed separately
+                response = transport.open(url, timeout=10)
+
+            with self.stats.stage(feed, STAGE_DOWNLOAD) as sample:
+                download = response.read()
+                body = download.body
+                sample.nbytes = len(body)
+                sample.wire_bytes = download.wire_bytes
+        except TransportError as err:
+            _LOGGER.error("YouTube %s request error: %s", feed, err)
             return None
 
-        html = response.text
+        if save_cookies:
+            with self._transport_lock:
+                # The shared jar holds the cookies YouTube rotated in its answers
+                try:
+                    self._cookie_jar.save(ignore_discard=True, ignore_expires=True)
+                    self._cookie_jar_mtime = self._cookies_mtime()
+                except Exception:
+                    pass
 
-        try:
-            regex = r"var ytInitialData\s*=\s*({.*?});"
-            match = re.search(regex, html, re.DOTALL)
-            if not match:
-                return None
+        return body
 
-            data = json.loads(match.group(1))
+    def _with_best_thumbnails(self, feed: str, videos: list[VideoInfo]) -> list[VideoInfo]:
+        """Resolve the best thumbnail of several video records.
+        
+        Args:
+            feed: Feed name the videos belong to
+            videos: Video records from one of the extractors
+            
+        Returns:
+            Video records carrying the probed thumbnail URLs
+        """
+        return [self._with_best_thumbnail(feed, video) for video in videos]
 
-            tabs = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]
+    def _with_best_thumbnail(self, feed: str, video: VideoInfo) -> VideoInfo:
+        """Return a copy of the video record with its best thumbnail resolved.
+        
+        Args:
+            feed: Feed name the video belongs to
+            video: Video record from one of the extractors
             
-            channel_list = None
-            for tab in tabs:
-                if "tabRenderer" in tab:
-                    tab_content = tab["tabRenderer"].get("content", {})
-                    if "sectionListRenderer" in tab_content:
-                        sections = tab_content["sectionListRenderer"].get("contents", [])
-                        for section in sections:
-                            if "itemSectionRenderer" in section:
-                                items = section["itemSectionRenderer"].get("contents", [])
-                                for item in items:
-                                    if "shelfRenderer" in item:
-                                        shelf_content = item["shelfRenderer"].get("content", {})
-                                        if "expandedShelfContentsRenderer" in shelf_content:
-                                            channel_list = shelf_content["expandedShelfContentsRenderer"].get("items", [])
-                                            break
-                                if channel_list:
-                                    break
-                    if channel_list:
-                        break
-
-            if not channel_list:
-                return {"total_count": 0, "channels": []}
-
-            channels = []
-            for item in channel_list:
-                if "channelRenderer" in item:
-                    channel_renderer = item["channelRenderer"]
-                    channel_title = channel_renderer.get("title", {}).get("simpleText", "")
-                    
-                    if channel_title and isinstance(channel_title, str):
-                        channel_title = channel_title.strip()
-                        if channel_title:
-                            channels.append({"channel_name": channel_title})
-
-            result = {
-                "total_count": len(channels),
-                "channels": channels,
-            }
-
-            return result
+        Returns:
+            Video record carrying the probed thumbnail URL
+        """
+        with self.stats.stage(feed, STAGE_THUMBNAIL):
+            thumbnail = self._get_best_thumbnail(video.video_id)
+        return replace(video, resolved_thumbnail=thumbnail)
 
-        except (AttributeError, json.JSONDecodeError, KeyError) as err:
-            _LOGGER.error("Can't parse subscriptions JSON: %s", err)
-            return None
+    def _get_thumbnail_transport(self) -> Transport:
+        """Return the cookie-less transport for the thumbnail hosts."""
+        with self._transport_lock:
+            if self._thumbnail_transport is None:
+                self._thumbnail_transport = create_transport(self._http2)
+            return self._thumbnail_transport
+
+    def download_thumbnail(self, url: str) -> bytes:
+        """Download a thumbnail without the account cookies.
+        
+        Runs in a worker thread, for the thumbnail cache.
+        
+        Args:
+            url: Thumbnail URL
+            
+        Returns:
+            Image bytes
+            
+        Raises:
+            TransportError: If the request fails
+        """
+        return self._get_thumbnail_transport().open(url, timeout=10).read().body
 
     def _get_best_thumbnail(self, video_id: str) -> str:
         """Get the best available thumbnail for a video.
         
+        Whether a video has a maxres thumbnail doesn't change, so the probe
+        answer is remembered and every video is only probed once.
+        
         Args:
             video_id: YouTube video ID
             
         Returns:
             URL of the best available thumbnail
         """
-        if not video_id or video_id == "N/A":
+        if not video_id or video_id == NOT_AVAILABLE:
             return ""
             
-        url_base = f"https://img.youtube.com/vi/{video_id}"
+        url_base = f"{self.thumbnail_url}{video_id}"
         maxres_url = f"{url_base}/maxresdefault.jpg"
         default_url = f"{url_base}/0.jpg"
 
-        try:
-            response = requests.get(maxres_url, timeout=3)
-            if response.status_code == 200:
-                return maxres_url
-        except requests.exceptions.RequestException:
-            pass
+        if self.thumbnail_mode == THUMBNAIL_MODE_STANDARD:
+            return default_url
+
+        has_maxres = self._maxres_probes.get(video_id)
+        if has_maxres is None:
+            # The probe is the first thing to go when requests are scarce
+            if not self.budget.try_acquire(PRIORITY_LOW):
+                return default_url
+            try:
+                # Only the status matters, don't download the image
+                status = self._get_thumbnail_transport().head(maxres_url, timeout=3)
+            except TransportError:
+                return default_url
+            if status not in (200, 404):
+                # Throttled or failing, ask again next time
+                return default_url
+            has_maxres = status == 200
+            with self._transport_lock:
+                self._maxres_probes[video_id] = has_maxres
+                if len(self._maxres_probes) > MAXRES_PROBE_CACHE_SIZE:
+                    del self._maxres_probes[next(iter(self._maxres_probes))]
 
-        return default_url
+        return maxres_url if has_maxres else default_url
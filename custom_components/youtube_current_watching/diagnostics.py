@@ -0,0 +1,62 @@
+"""Diagnostics support for YouTube Watching integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_COOKIES_PATH
+from .json_backend import JSON_BACKEND
+from .transport import ACCEPT_ENCODING
+
+TO_REDACT = {CONF_COOKIES_PATH}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+    
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        
+    Returns:
+        Dictionary with the entry configuration and refresh timings
+    """
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    auth_status = coordinator.auth_status
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "cookies_valid": coordinator.cookies_valid,
+        "last_update_success": coordinator.last_update_success,
+        "auth": {
+            "valid": auth_status.valid,
+            "reason": auth_status.reason,
+            "checked_at": auth_status.checked_at.isoformat(),
+            "missing_cookies": list(auth_status.expiry.missing) if auth_status.expiry else None,
+            "seconds_to_expiry": (
+                auth_status.expiry.seconds_left() if auth_status.expiry else None
+            ),
+        } if auth_status else None,
+        "json_backend": JSON_BACKEND,
+        "transport": {
+            "client": coordinator.transport_name,
+            "accept_encoding": ACCEPT_ENCODING,
+        },
+        "timings": coordinator.stats.as_dict(),
+        "request_budget": coordinator.budget.as_dict(),
+        "title_index_size": len(coordinator.title_index),
+        "last_convergence": coordinator.last_convergence,
+        "upload_watermarks": len(coordinator.upload_watermarks),
+        "channel_details_cached": len(coordinator.channel_cache),
+        "watch_statistics": len(coordinator.watch_statistics),
+        "executor": coordinator.executor.as_dict(),
+        "recording": {
+            "enabled": coordinator.record_pages,
+            **coordinator.page_recorder.as_dict(),
+        } if coordinator.page_recorder else None,
+    }
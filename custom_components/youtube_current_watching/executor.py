@@ -0,0 +1,163 @@
+"""Thread pool for YouTube Watching integration.
+
+Page downloads, login probes, thumbnail probes and parsing block for as long
+as YouTube takes to answer. On Home Assistant's shared executor a slow
+network would tie up workers that core and other integrations need, so every
+config entry runs this work on a small thread pool of its own.
+
+The queue in front of the pool is bounded. Once it is full new jobs are shed
+instead of piling up behind a stalled connection, lowest priority first: low
+priority work may only fill half of the queue, and high priority jobs (the
+history page and the login probe, at most one of each at a time) are never
+shed.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+
+from .budget import PRIORITIES, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL
+from .const import DOMAIN, EXECUTOR_MAX_QUEUE, EXECUTOR_MAX_WORKERS
+from .stats import DEFAULT_WINDOW, percentile
+
+_T = TypeVar("_T")
+
+# Share of the queue a priority may fill, None is never shed
+QUEUE_SHARE = {
+    PRIORITY_HIGH: None,
+    PRIORITY_NORMAL: 1.0,
+    PRIORITY_LOW: 0.5,
+}
+
+
+class JobRejected(Exception):
+    """Job was shed because the queue is full or the pool is shut down."""
+
+
+@dataclass(slots=True)
+class _Job:
+    """Queue state of one submitted job, guarded by the executor's lock."""
+
+    started: bool = False
+    # The caller stopped waiting before a worker picked the job up
+    abandoned: bool = False
+
+
+class FetchExecutor:
+    """Bounded, named thread pool with occupancy and queue wait tracking.
+
+    Jobs are submitted from the event loop; the counters are also updated
+    from the worker threads, so they are guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_workers: int = EXECUTOR_MAX_WORKERS,
+        max_queue: int = EXECUTOR_MAX_QUEUE,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            hass: Home Assistant instance
+            max_workers: Worker threads
+            max_queue: Jobs that may wait for a worker
+        """
+        self.hass = hass
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=DOMAIN)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._active = 0
+        self._queued = 0
+        # Seconds the latest jobs waited for a worker
+        self._waits: deque[float] = deque(maxlen=DEFAULT_WINDOW)
+        self._completed = 0
+        self._shed: Counter[str] = Counter()
+
+    async def async_run(self, priority: str, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking function in the pool.
+
+        Args:
+            priority: Priority of the job, decides when it is shed
+            func: Function to run
+            *args: Arguments for the function
+
+        Returns:
+            Result of the function
+
+        Raises:
+            JobRejected: If the job was shed
+        """
+        share = QUEUE_SHARE[priority]
+        with self._lock:
+            if self._closed:
+                raise JobRejected("Executor is shut down")
+            if share is not None and self._queued >= share * self.max_queue:
+                self._shed[priority] += 1
+                raise JobRejected(f"Executor queue is full, shedding a {priority} job")
+            self._queued += 1
+        job = _Job()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool, self._run, job, time.monotonic(), func, args
+            )
+        finally:
+            # Cancelled, or the pool shut down, before a worker took the job;
+            # the worker skips it, so the slot is given back here
+            with self._lock:
+                if not job.started and not job.abandoned:
+                    job.abandoned = True
+                    self._queued -= 1
+
+    def _run(
+        self, job: _Job, submitted: float, func: Callable[..., _T], args: tuple[Any, ...]
+    ) -> _T:
+        """Run a job in a worker thread, counting it while it runs."""
+        with self._lock:
+            if job.abandoned:
+                raise asyncio.CancelledError
+            job.started = True
+            self._queued -= 1
+            self._active += 1
+            self._waits.append(time.monotonic() - submitted)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    async def async_shutdown(self) -> None:
+        """Shed queued and new jobs and wait for the running ones to finish."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        await self.hass.async_add_executor_job(
+            lambda: self._pool.shutdown(wait=True, cancel_futures=True)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pool state for attributes and diagnostics."""
+        with self._lock:
+            waits = sorted(wait * 1000 for wait in self._waits)
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "queue_wait_p50_ms": round(percentile(waits, 50), 1) if waits else None,
+                "queue_wait_p95_ms": round(percentile(waits, 95), 1) if waits else None,
+                "shed": {priority: self._shed[priority] for priority in PRIORITIES},
+            }
@@ -0,0 +1,130 @@
+"""Image platform for YouTube Watching integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, FEED_RECOMMENDED
+from .models import VideoInfo
+from .thumbnail_cache import ThumbnailCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up YouTube Watching thumbnail images from a config entry.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+        async_add_entities: Callback to add entities
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    cache = entry_data["thumbnail_cache"]
+
+    entities = [
+        YouTubeThumbnailImage(
+            coordinator,
+            cache,
+            "watching_thumbnail",
+            "YouTube Watching Thumbnail",
+            lambda: coordinator.data,
+        ),
+    ]
+    if coordinator.feed_enabled(FEED_RECOMMENDED):
+        entities.append(
+            YouTubeThumbnailImage(
+                coordinator,
+                cache,
+                "recommended_thumbnail",
+                "YouTube Recommended Thumbnail",
+                lambda: (
+                    coordinator.recommended_data[0]
+                    if coordinator.recommended_data
+                    else None
+                ),
+            )
+        )
+
+    async_add_entities(entities)
+
+
+class YouTubeThumbnailImage(CoordinatorEntity, ImageEntity):
+    """Thumbnail of a YouTube video served from the local cache."""
+
+    _attr_has_entity_name = True
+    _attr_content_type = "image/jpeg"
+
+    def __init__(
+        self,
+        coordinator,
+        cache: ThumbnailCache,
+        key: str,
+        name: str,
+        video_getter: Callable[[], VideoInfo | None],
+    ) -> None:
+        """Initialize the image.
+
+        Args:
+            coordinator: Data coordinator instance
+            cache: Thumbnail cache of the config entry
+            key: Unique ID suffix
+            name: Entity name
+            video_getter: Returns the video whose thumbnail is shown
+        """
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._cache = cache
+        self._video_getter = video_getter
+        self._video_id: str | None = None
+        self._attr_name = name
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._attr_icon = "mdi:youtube"
+
+    async def async_added_to_hass(self) -> None:
+        """Start caching the current thumbnail when added."""
+        await super().async_added_to_hass()
+        self._update_video()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_video()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_video(self) -> None:
+        """Track the shown video and prefetch its thumbnail once."""
+        video = self._video_getter()
+        video_id = video.video_id if video else None
+        if video_id == self._video_id:
+            return
+
+        self._video_id = video_id
+        self._attr_image_last_updated = dt_util.utcnow()
+        if video is not None:
+            self._cache.async_schedule(video.video_id, video.thumbnail)
+
+    async def async_image(self) -> bytes | None:
+        """Return the cached thumbnail bytes."""
+        video = self._video_getter()
+        if video is None:
+            return None
+        return await self._cache.async_fetch(video.video_id, video.thumbnail)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.cookies_valid
@@ -0,0 +1,47 @@
+"""JSON decoder backends for YouTube Watching integration.
+
+ytInitialData is several megabytes per page. orjson (shipped with Home
+Assistant) decodes the raw bytes directly and several times faster than the
+standard library; the stdlib decoder is kept as a fallback.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+JSON_BACKEND_ORJSON = "orjson"
+JSON_BACKEND_STDLIB = "json"
+
+
+def _stdlib_loads(raw: bytes | str) -> Any:
+    """Decode JSON with the standard library."""
+    return json.loads(raw)
+
+
+def _orjson_loads(raw: bytes | str) -> Any:
+    """Decode JSON with orjson, retrying with the standard library.
+
+    orjson is stricter (e.g. about lone surrogate escapes), so a failure is
+    retried with the stdlib decoder, which raises if the JSON is really bad.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+DECODERS: dict[str, Callable[[bytes | str], Any]] = {
+    JSON_BACKEND_STDLIB: _stdlib_loads,
+}
+if orjson is not None:
+    DECODERS[JSON_BACKEND_ORJSON] = _orjson_loads
+
+JSON_BACKEND = JSON_BACKEND_ORJSON if orjson is not None else JSON_BACKEND_STDLIB
+
+loads: Callable[[bytes | str], Any] = DECODERS[JSON_BACKEND]
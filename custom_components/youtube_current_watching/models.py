@@ -0,0 +1,153 @@
+"""Data models for YouTube Watching integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import sys
+from typing import Any
+
+from .const import (
+    ATTR_CHANNEL,
+    ATTR_TITLE,
+    ATTR_VIDEO_ID,
+    ATTR_THUMBNAIL,
+    ATTR_DURATION,
+    ATTR_DURATION_SECONDS,
+    ATTR_URL,
+    ATTR_CHANNEL_NAME,
+    ATTR_CHANNEL_ID,
+    ATTR_HANDLE,
+    ATTR_SUBSCRIBER_COUNT,
+    ATTR_VIDEO_COUNT,
+    ATTR_AVATAR,
+)
+
+# Interned sentinel values shared by every record
+NOT_AVAILABLE = sys.intern("N/A")
+SHORTS_LABEL = sys.intern("YouTube Shorts")
+SHORTS_DURATION = sys.intern("Shorts")
+LIVE_DURATION = sys.intern("LIVE")
+
+WATCH_URL = "https://www.youtube.com/watch?v="
+SHORTS_URL = "https://www.youtube.com/shorts/"
+THUMBNAIL_URL = "https://img.youtube.com/vi/"
+
+
+@dataclass(frozen=True, slots=True)
+class VideoInfo:
+    """Immutable record of a single YouTube video."""
+
+    video_id: str
+    title: str = NOT_AVAILABLE
+    channel: str = NOT_AVAILABLE
+    duration: str = NOT_AVAILABLE
+    is_short: bool = False
+    # Best thumbnail resolved by the coordinator, None until probed
+    resolved_thumbnail: str | None = None
+    # Parsed from duration once, None for live streams, Shorts and unknown
+    duration_seconds: int | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Parse the duration label."""
+        object.__setattr__(self, "duration_seconds", parse_duration(self.duration))
+
+    @property
+    def url(self) -> str:
+        """Return the watch URL of the video."""
+        if self.is_short:
+            return f"{SHORTS_URL}{self.video_id}"
+        return f"{WATCH_URL}{self.video_id}"
+
+    @property
+    def thumbnail(self) -> str:
+        """Return the resolved thumbnail or the default resolution fallback."""
+        if self.resolved_thumbnail is not None:
+            return self.resolved_thumbnail
+        if not self.video_id or self.video_id == NOT_AVAILABLE:
+            return ""
+        return f"{THUMBNAIL_URL}{self.video_id}/0.jpg"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as entity state attributes.
+
+        Returns:
+            Dictionary keyed by the sensor attribute names
+        """
+        return {
+            ATTR_CHANNEL: self.channel,
+            ATTR_TITLE: self.title,
+            ATTR_VIDEO_ID: self.video_id,
+            ATTR_THUMBNAIL: self.thumbnail,
+            ATTR_DURATION: self.duration,
+            ATTR_DURATION_SECONDS: self.duration_seconds,
+            ATTR_URL: self.url,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelInfo:
+    """Immutable record of a subscribed YouTube channel."""
+
+    channel_name: str
+    channel_id: str | None = None
+    handle: str | None = None
+    # Counts as YouTube shows them, e.g. "1.1K subscribers"
+    subscriber_count: str | None = None
+    video_count: str | None = None
+    avatar: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Return true if no detail is missing."""
+        return None not in (
+            self.channel_id, self.subscriber_count, self.video_count, self.avatar
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as entity state attributes.
+
+        Returns:
+            Dictionary keyed by the sensor attribute names
+        """
+        return {
+            ATTR_CHANNEL_NAME: self.channel_name,
+            ATTR_CHANNEL_ID: self.channel_id,
+            ATTR_HANDLE: self.handle,
+            ATTR_SUBSCRIBER_COUNT: self.subscriber_count,
+            ATTR_VIDEO_COUNT: self.video_count,
+            ATTR_AVATAR: self.avatar,
+        }
+
+
+def clean_text(value: Any, default: str = NOT_AVAILABLE) -> str:
+    """Strip a text value from YouTube data, falling back to a sentinel.
+
+    Args:
+        value: Raw value taken from the YouTube response
+        default: Sentinel returned when the value is missing or not a string
+
+    Returns:
+        Stripped string or the default sentinel
+    """
+    if value and isinstance(value, str):
+        value = value.strip()
+        if value:
+            return value
+    return default
+
+
+def parse_duration(duration: str) -> int | None:
+    """Convert a duration label like "1:02:03" or "12:34" to seconds.
+
+    Args:
+        duration: Duration as shown on the thumbnail overlay
+
+    Returns:
+        Length in seconds, None for live streams, Shorts and missing labels
+    """
+    parts = duration.split(":")
+    if not 2 <= len(parts) <= 3 or not all(part.isdigit() for part in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
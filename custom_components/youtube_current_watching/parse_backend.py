@@ -0,0 +1,180 @@
+"""Parse backends for YouTube Watching integration.
+
+Decoding ytInitialData and walking it is pure-Python CPU work that holds the
+GIL. The thread backend runs it in the integration's thread pool; the process
+backend ships the raw page bytes to a persistent worker process and only gets
+the compact parse result back.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+import os
+import pickle
+
+from homeassistant.core import HomeAssistant
+
+from .budget import FEED_PRIORITIES
+from .const import DEFAULT_RECOMMENDED_COUNT, PARSE_BACKEND_PROCESS
+from .executor import FetchExecutor
+from .parser import ParseResult, parse_page
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE = __name__.rpartition(".")[0]
+
+# Run in the worker before anything is unpickled. Registering the package as
+# a bare module means importing the parser there does not execute the
+# package __init__ (and with it Home Assistant), keeping the worker small.
+_WORKER_BOOTSTRAP = f"""
+import sys, types
+package = types.ModuleType({_PACKAGE!r})
+package.__path__ = [{os.path.dirname(__file__)!r}]
+sys.modules.setdefault({_PACKAGE!r}, package)
+"""
+
+
+class ThreadParseBackend:
+    """Parse pages in the integration's thread pool."""
+
+    def __init__(self, hass: HomeAssistant, executor: FetchExecutor) -> None:
+        """Initialize the backend.
+
+        Args:
+            hass: Home Assistant instance
+            executor: Thread pool the pages are parsed in
+        """
+        self.hass = hass
+        self.executor = executor
+
+    async def async_parse(
+        self,
+        feed: str,
+        body: bytes,
+        limit: int = DEFAULT_RECOMMENDED_COUNT,
+        known: frozenset[str] = frozenset(),
+    ) -> ParseResult:
+        """Parse a downloaded page.
+
+        Args:
+            feed: Feed name the page belongs to
+            body: Raw response body
+            limit: Maximum number of recommended videos or history entries to extract
+            known: Upload watermarks, video IDs the uploads walk stops at
+
+        Returns:
+            Parse result with the extracted records and stage timings
+
+        Raises:
+            JobRejected: If the thread pool sheds the job
+        """
+        return await self.executor.async_run(
+            FEED_PRIORITIES[feed], parse_page, feed, body, limit, known
+        )
+
+    async def async_shutdown(self) -> None:
+        """Release the resources held by the backend."""
+
+
+class ProcessParseBackend(ThreadParseBackend):
+    """Parse pages in a persistent worker process, falling back to threads."""
+
+    def __init__(self, hass: HomeAssistant, executor: FetchExecutor) -> None:
+        """Initialize the backend.
+
+        Args:
+            hass: Home Assistant instance
+            executor: Thread pool used when the worker process is unavailable
+        """
+        super().__init__(hass, executor)
+        self._pool: ProcessPoolExecutor | None = None
+        self._disabled = False
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """Start the worker process and wait until it is ready.
+
+        Returns:
+            Process pool with a single warm worker
+        """
+        pool = ProcessPoolExecutor(
+            max_workers=1,
+            # spawn: forking the Home Assistant process is not safe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=exec,
+            initargs=(_WORKER_BOOTSTRAP,),
+        )
+        try:
+            pool.submit(int).result()
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        return pool
+
+    async def async_parse(
+        self,
+        feed: str,
+        body: bytes,
+        limit: int = DEFAULT_RECOMMENDED_COUNT,
+        known: frozenset[str] = frozenset(),
+    ) -> ParseResult:
+        """Parse a downloaded page in the worker process.
+
+        Args:
+            feed: Feed name the page belongs to
+            body: Raw response body
+            limit: Maximum number of recommended videos or history entries to extract
+            known: Upload watermarks, video IDs the uploads walk stops at
+
+        Returns:
+            Parse result with the extracted records and stage timings
+        """
+        if self._disabled:
+            return await super().async_parse(feed, body, limit, known)
+
+        try:
+            if self._pool is None:
+                self._pool = await self.hass.async_add_executor_job(self._start_pool)
+            return await self.hass.loop.run_in_executor(
+                self._pool, parse_page, feed, body, limit, known
+            )
+        except BrokenProcessPool as err:
+            # The worker died (e.g. OOM killed); start a new one next time
+            _LOGGER.warning("Parse worker process died, parsing in a thread: %s", err)
+            await self.async_shutdown()
+        except (OSError, pickle.PicklingError) as err:
+            _LOGGER.error(
+                "Can't use a parse worker process, parsing in threads from now on: %s",
+                err,
+            )
+            self._disabled = True
+            await self.async_shutdown()
+
+        return await super().async_parse(feed, body, limit, known)
+
+    async def async_shutdown(self) -> None:
+        """Stop the worker process."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await self.hass.async_add_executor_job(
+                lambda: pool.shutdown(wait=True, cancel_futures=True)
+            )
+
+
+def create_parse_backend(
+    hass: HomeAssistant, backend: str, executor: FetchExecutor
+) -> ThreadParseBackend:
+    """Create the configured parse backend.
+
+    Args:
+        hass: Home Assistant instance
+        backend: Backend name from the entry options
+        executor: Thread pool for parsing in threads
+
+    Returns:
+        Parse backend instance
+    """
+    if backend == PARSE_BACKEND_PROCESS:
+        return ProcessParseBackend(hass, executor)
+    return ThreadParseBackend(hass, executor)
@@ -0,0 +1,1112 @@
+"""Parsers for YouTube ytInitialData pages.
+
+Everything in this module is free of network and Home Assistant imports so
+the parse stages can run offline against saved pages and in the parse worker
+process.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+import re
+import sys
+import time
+from typing import Any
+
+from . import json_backend
+from .const import (
+    ATTR_AVATAR,
+    ATTR_HANDLE,
+    ATTR_SUBSCRIBER_COUNT,
+    ATTR_VIDEO_COUNT,
+    DEFAULT_RECOMMENDED_COUNT,
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+)
+from .models import (
+    NOT_AVAILABLE,
+    SHORTS_LABEL,
+    SHORTS_DURATION,
+    LIVE_DURATION,
+    ChannelInfo,
+    VideoInfo,
+    clean_text,
+)
+from .stats import STAGE_EXTRACT, STAGE_JSON_DECODE, STAGE_REGEX
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only the start of the object is matched with a regex; the end is the first
+# "};" after it (what a lazy "({.*?});" would match), found with a plain
+# substring search which is much cheaper on multi-megabyte pages.
+INITIAL_DATA_REGEX = re.compile(r"var ytInitialData\s*=\s*{")
+ALT_INITIAL_DATA_REGEX = re.compile(r"ytInitialData\s*=\s*{")
+# Same patterns on the raw body, so the page never has to be decoded to str
+INITIAL_DATA_BYTES_REGEX = re.compile(INITIAL_DATA_REGEX.pattern.encode())
+ALT_INITIAL_DATA_BYTES_REGEX = re.compile(ALT_INITIAL_DATA_REGEX.pattern.encode())
+
+# Starts of the arrays whose items the feeds read, for partial decoding. Home
+# and uploads have one rich grid; the history is walked key by key instead.
+RICH_GRID_REGEX = re.compile(r'"richGridRenderer"\s*:\s*\{\s*"contents"\s*:\s*\[')
+TRACKING_PARAMS_REGEX = re.compile(r'"serviceTrackingParams"\s*:\s*\[')
+# Whitespace and the comma between two array items
+ITEM_SEPARATOR_REGEX = re.compile(r"[\s,]*")
+# Next key of an object, up to where its value starts
+MEMBER_KEY_REGEX = re.compile(r'[\s,]*"((?:[^"\\]|\\.)*)"\s*:\s*')
+WHITESPACE_REGEX = re.compile(r"\s*")
+
+# Feeds that only need the first few items of their arrays
+PARTIAL_FEEDS = frozenset({FEED_HISTORY, FEED_RECOMMENDED, FEED_UPLOADS})
+
+_DECODER = json.JSONDecoder()
+# Returned by _next_item at the end of an array
+_END = object()
+
+
+@dataclass(slots=True)
+class ParseResult:
+    """Compact outcome of parsing one downloaded page."""
+
+    # VideoInfo for history, list[VideoInfo] or list[ChannelInfo] otherwise
+    records: Any = None
+    # Whether ytInitialData was found in the page at all
+    found: bool = False
+    raw_bytes: int = 0
+    # Login state YouTube reported for the page, None if unknown
+    logged_in: bool | None = None
+    # Latest history entries, newest first (history feed only)
+    history: list[VideoInfo] = field(default_factory=list)
+    # Whether only the needed items were decoded instead of the whole page
+    partial: bool = False
+    # Stage name -> duration in seconds
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def find_initial_data(
+    html: str | bytes, allow_alternative: bool = False
+) -> str | bytes | None:
+    """Locate the raw ytInitialData JSON embedded in a page.
+
+    Args:
+        html: Page HTML as returned by YouTube, either decoded or raw bytes
+        allow_alternative: Also accept ytInitialData without the var prefix
+
+    Returns:
+        Raw JSON of the same type as the page or None if it is missing
+    """
+    if isinstance(html, bytes):
+        regexes = [INITIAL_DATA_BYTES_REGEX, ALT_INITIAL_DATA_BYTES_REGEX]
+        terminator = b"};"
+    else:
+        regexes = [INITIAL_DATA_REGEX, ALT_INITIAL_DATA_REGEX]
+        terminator = "};"
+    if not allow_alternative:
+        del regexes[1:]
+
+    for regex in regexes:
+        match = regex.search(html)
+        if not match:
+            continue
+        start = match.end() - 1
+        end = html.find(terminator, start + 1)
+        if end != -1:
+            return html[start:end + 1]
+    return None
+
+
+def decode_initial_data(raw: str | bytes) -> dict[str, Any]:
+    """Decode raw ytInitialData JSON with the fastest available decoder.
+
+    Args:
+        raw: JSON returned by find_initial_data
+
+    Returns:
+        Decoded ytInitialData
+
+    Raises:
+        json.JSONDecodeError: If the JSON is malformed
+    """
+    return json_backend.loads(raw)
+
+
+def decode_initial_data_partial(
+    raw: str | bytes,
+    feed: str,
+    limit: int = DEFAULT_RECOMMENDED_COUNT,
+    known: frozenset[str] = frozenset(),
+) -> dict[str, Any] | None:
+    """Decode only the parts of ytInitialData a feed reads.
+
+    A full decode builds every object of the page: navigation, menus,
+    tracking params and framework updates that make up most of its size.
+    This locates the item arrays of the feed in the raw JSON (for the
+    history by following the keys down to the selected tab's section list)
+    and decodes their items one at a time, stopping as soon as enough videos
+    were seen, plus the login tracking params. The result is a skeleton with the same
+    paths as the full ytInitialData, so the regular parse functions read it.
+
+    Args:
+        raw: JSON returned by find_initial_data
+        feed: Feed name the page belongs to, one of PARTIAL_FEEDS
+        limit: Videos after which decoding stops
+        known: Upload watermarks, decoding of the uploads stops at the first one
+
+    Returns:
+        Skeleton ytInitialData, or None if the arrays were not found or
+        could not be decoded, in which case the page needs a full decode
+    """
+    try:
+        text = raw.decode() if isinstance(raw, bytes) else raw
+        if feed == FEED_HISTORY:
+            tabs = _decode_history_tabs(text, limit)
+        else:
+            tabs = _decode_rich_grid(text, limit, known)
+        if tabs is None:
+            return None
+        match = TRACKING_PARAMS_REGEX.search(text)
+        tracking = _DECODER.raw_decode(text, match.end() - 1)[0] if match else []
+    except ValueError as err:
+        # JSONDecodeError and UnicodeDecodeError
+        _LOGGER.debug("Partial decode of the %s page failed: %s", feed, err)
+        return None
+
+    return {
+        "responseContext": {"serviceTrackingParams": tracking},
+        "contents": {"twoColumnBrowseResultsRenderer": {"tabs": tabs}},
+    }
+
+
+def _next_item(text: str, pos: int) -> tuple[Any, int]:
+    """Decode the array item at pos.
+
+    Returns:
+        Item and the index after it, or _END and the index after the
+        closing bracket
+
+    Raises:
+        json.JSONDecodeError: If there is no valid item at pos
+    """
+    pos = ITEM_SEPARATOR_REGEX.match(text, pos).end()
+    if text.startswith("]", pos):
+        return _END, pos + 1
+    return _DECODER.raw_decode(text, pos)
+
+
+def _open(text: str, pos: int, bracket: str) -> int:
+    """Return the index after the bracket opening the value at pos.
+
+    Raises:
+        ValueError: If the value at pos is not of that type
+    """
+    pos = WHITESPACE_REGEX.match(text, pos).end()
+    if not text.startswith(bracket, pos):
+        raise ValueError(f"Expected {bracket!r} at {pos}")
+    return pos + 1
+
+
+def _find_member(text: str, pos: int, key: str) -> int | None:
+    """Return where the value of key starts, skipping the members before it.
+
+    Args:
+        text: Raw JSON
+        pos: Index inside an object, after its brace or one of its values
+        key: Member to find
+
+    Returns:
+        Index of the value, or None at the end of the object
+    """
+    while (match := MEMBER_KEY_REGEX.match(text, pos)) is not None:
+        if match.group(1) == key:
+            return match.end()
+        pos = _DECODER.raw_decode(text, match.end())[1]
+    return None
+
+
+def _find_path(text: str, pos: int, keys: tuple[str, ...]) -> int | None:
+    """Return where the value at a path of nested object keys starts."""
+    for key in keys:
+        pos = _find_member(text, _open(text, pos, "{"), key)
+        if pos is None:
+            return None
+    return pos
+
+
+def _object_end(text: str, pos: int) -> int:
+    """Skip the remaining members of an object and return the index after it."""
+    while (match := MEMBER_KEY_REGEX.match(text, pos)) is not None:
+        pos = _DECODER.raw_decode(text, match.end())[1]
+    return _open(text, pos, "}")
+
+
+def _decode_history_tabs(text: str, limit: int) -> list[Any] | None:
+    """Decode the tabs of the history page, the selected one only up to limit.
+
+    The selected tab's section list is decoded item by item until limit
+    videos or a message were seen. The first item section is always decoded
+    completely, as parse_history looks at all of its items. Other tabs
+    are small and decoded whole.
+
+    Returns:
+        Tabs for the skeleton, or None if the page has another layout, in
+        which case the parse functions could read other parts than these
+    """
+    pos = _find_path(text, 0, ("contents", "twoColumnBrowseResultsRenderer", "tabs"))
+    if pos is None:
+        return None
+    pos = _open(text, pos, "[")
+    tabs: list[Any] = []
+    sections: list[Any] | None = None
+    while True:
+        pos = ITEM_SEPARATOR_REGEX.match(text, pos).end()
+        if text.startswith("]", pos):
+            break
+        renderer_pos = _find_member(text, _open(text, pos, "{"), "tabRenderer")
+        if renderer_pos is None:
+            tab, pos = _DECODER.raw_decode(text, pos)
+            tabs.append(tab)
+            continue
+
+        tab_renderer: dict[str, Any] = {}
+        tabs.append({"tabRenderer": tab_renderer})
+        pos = _open(text, renderer_pos, "{")
+        while (match := MEMBER_KEY_REGEX.match(text, pos)) is not None:
+            if match.group(1) != "content":
+                tab_renderer[match.group(1)], pos = _DECODER.raw_decode(text, match.end())
+                continue
+            if sections is not None or tab_renderer.get("selected") is not True:
+                # Content outside the selected tab, or before its selected flag
+                return None
+            sections = []
+            tab_renderer["content"] = {"sectionListRenderer": {"contents": sections}}
+            list_pos = _find_path(text, match.end(), ("sectionListRenderer", "contents"))
+            if list_pos is None:
+                return None
+            pos = _decode_history_sections(text, list_pos, sections, limit)
+            if pos is None:
+                # Stopped early, the rest of the page is not needed
+                return tabs
+            # Close the section list and the content
+            pos = _object_end(text, _object_end(text, pos))
+        # Close the tab renderer and the tab
+        pos = _object_end(text, _object_end(text, pos))
+    return tabs if sections is not None else None
+
+
+def _decode_history_sections(
+    text: str, pos: int, sections: list[Any], limit: int
+) -> int | None:
+    """Decode history sections into sections until limit videos or a message.
+
+    Args:
+        text: Raw JSON
+        pos: Index of the section list array
+        sections: Decoded sections are appended here
+        limit: Videos after which decoding stops
+
+    Returns:
+        Index after the array, or None if decoding stopped before its end
+    """
+    found = 0
+    # parse_history reads the first item section that has items
+    whole = True
+    pos = _open(text, pos, "[")
+    while True:
+        pos = ITEM_SEPARATOR_REGEX.match(text, pos).end()
+        if text.startswith("]", pos):
+            return pos + 1
+        if found >= limit:
+            return None
+        items_pos = _find_path(text, pos, ("itemSectionRenderer", "contents"))
+        if items_pos is None:
+            # Continuations and other sections, the parse functions skip them
+            section, pos = _DECODER.raw_decode(text, pos)
+            sections.append(section)
+            continue
+
+        items: list[Any] = []
+        sections.append({"itemSectionRenderer": {"contents": items}})
+        pos = _open(text, items_pos, "[")
+        while whole or found < limit:
+            item, pos = _next_item(text, pos)
+            if item is _END:
+                break
+            items.append(item)
+            if not isinstance(item, dict):
+                continue
+            if "messageRenderer" in item:
+                # Paused or empty history, nothing follows
+                return None
+            found += _count_history_videos(item)
+        else:
+            return None
+        whole = whole and not items
+        # Close the item section and the section
+        pos = _object_end(text, _object_end(text, pos))
+
+
+def _count_history_videos(item: dict[str, Any]) -> int:
+    """Count the videos _extract_history_item finds in an item, without extracting them."""
+    if "lockupViewModel" in item:
+        lockup = item["lockupViewModel"]
+        return int(
+            lockup.get("contentType", "") == "LOCKUP_CONTENT_TYPE_VIDEO"
+            and bool(lockup.get("contentId"))
+        )
+    if "videoRenderer" in item:
+        return 1
+    if "videoRenderer" in item.get("richItemRenderer", {}).get("content", {}):
+        return 1
+    return sum(
+        1
+        for reel_item in item.get("reelShelfRenderer", {}).get("items", [])
+        if _has_shorts_id(reel_item.get("shortsLockupViewModel"))
+    )
+
+
+def _has_shorts_id(shorts_data: dict[str, Any] | None) -> bool:
+    """Return true if extract_shorts_info would find a video ID."""
+    if shorts_data is None:
+        return False
+    entity_id = shorts_data.get("entityId", "")
+    if entity_id and entity_id.split("-")[-1] not in ("", "item"):
+        return True
+    return bool(
+        shorts_data.get("onTap", {})
+        .get("innertubeCommand", {})
+        .get("reelWatchEndpoint", {})
+        .get("videoId")
+    )
+
+
+def _decode_rich_grid(
+    text: str, limit: int, known: frozenset[str]
+) -> list[list[Any]] | None:
+    """Decode rich grid items until limit videos or a known video were seen."""
+    match = RICH_GRID_REGEX.search(text)
+    if match is None:
+        return None
+    items: list[Any] = []
+    found = 0
+    pos = match.end()
+    while found < limit:
+        item, pos = _next_item(text, pos)
+        if item is _END:
+            break
+        items.append(item)
+        video_info = _extract_rich_item(item) if isinstance(item, dict) else None
+        if video_info is None:
+            continue
+        if video_info.video_id in known:
+            break
+        found += 1
+    content = {"richGridRenderer": {"contents": items}}
+    return [{"tabRenderer": {"selected": True, "content": content}}]
+
+
+def extract_initial_data(html: str, allow_alternative: bool = False) -> dict[str, Any] | None:
+    """Locate and decode the ytInitialData object embedded in a page.
+
+    Args:
+        html: Page HTML as returned by YouTube
+        allow_alternative: Also accept ytInitialData without the var prefix
+
+    Returns:
+        Decoded ytInitialData or None if it is missing
+
+    Raises:
+        json.JSONDecodeError: If the embedded JSON is malformed
+    """
+    raw = find_initial_data(html, allow_alternative)
+    if raw is None:
+        return None
+    return decode_initial_data(raw)
+
+
+def parse_page(
+    feed: str,
+    body: bytes,
+    limit: int = DEFAULT_RECOMMENDED_COUNT,
+    known: frozenset[str] = frozenset(),
+) -> ParseResult:
+    """Run the whole parse pipeline for a downloaded page.
+
+    This is the unit of work handed to the parse backends, so it only takes
+    and returns plain picklable values.
+
+    Args:
+        feed: Feed name the page belongs to
+        body: Raw response body
+        limit: Maximum number of recommended videos or history entries to extract
+        known: Upload watermarks, video IDs the uploads walk stops at
+
+    Returns:
+        Parse result with the extracted records and stage timings
+
+    Raises:
+        json.JSONDecodeError: If the embedded JSON is malformed
+        KeyError: If the subscriptions page does not have the expected layout
+    """
+    result = ParseResult()
+
+    start = time.perf_counter()
+    raw = find_initial_data(body, allow_alternative=feed == FEED_HISTORY)
+    result.timings[STAGE_REGEX] = time.perf_counter() - start
+    if raw is None:
+        return result
+    result.found = True
+    result.raw_bytes = len(raw)
+
+    start = time.perf_counter()
+    data = None
+    if feed in PARTIAL_FEEDS:
+        data = decode_initial_data_partial(raw, feed, limit, known)
+        result.partial = data is not None
+    if data is None:
+        data = decode_initial_data(raw)
+    result.timings[STAGE_JSON_DECODE] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result.logged_in = parse_logged_in(data)
+    if feed == FEED_HISTORY:
+        result.records = parse_history(data)
+        result.history = parse_history_items(data, limit)
+    elif feed == FEED_RECOMMENDED:
+        result.records = parse_recommended(data, limit)
+    elif feed == FEED_SUBSCRIPTIONS:
+        result.records = parse_subscriptions(data)
+    elif feed == FEED_UPLOADS:
+        result.records = parse_uploads(data, known, limit)
+    result.timings[STAGE_EXTRACT] = time.perf_counter() - start
+
+    return result
+
+
+def parse_logged_in(data: dict[str, Any]) -> bool | None:
+    """Read the login state YouTube reports in a response.
+
+    Every ytInitialData and InnerTube response carries a ``logged_in``
+    tracking parameter, which tells a logged-out page (that otherwise just
+    parses as an empty history) apart from a real empty one.
+
+    Args:
+        data: Decoded ytInitialData or InnerTube response
+
+    Returns:
+        True or False if the flag is present, otherwise None
+    """
+    try:
+        services = data["responseContext"]["serviceTrackingParams"]
+    except (KeyError, TypeError):
+        return None
+
+    for service in services:
+        for param in service.get("params", []):
+            if param.get("key") == "logged_in":
+                return param.get("value") == "1"
+    return None
+
+
+def parse_history(data: dict[str, Any]) -> VideoInfo | None:
+    """Find the most recently watched video in the history page data.
+
+    Args:
+        data: Decoded ytInitialData of /feed/history
+
+    Returns:
+        Most recently watched video or None
+    """
+    # Try multiple paths to find video content
+    path = None
+
+    # Path 1: Standard path
+    try:
+        path = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][0]["tabRenderer"] \
+                   ["content"]["sectionListRenderer"]["contents"][0]["itemSectionRenderer"]["contents"]
+    except (KeyError, TypeError, IndexError):
+        pass
+
+    # Path 2: Iterate through tabs
+    if path is None:
+        try:
+            tabs = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]
+            for tab in tabs:
+                if "tabRenderer" in tab:
+                    content = tab["tabRenderer"].get("content", {})
+                    if "sectionListRenderer" in content:
+                        sections = content["sectionListRenderer"].get("contents", [])
+                        for section in sections:
+                            if "itemSectionRenderer" in section:
+                                contents = section["itemSectionRenderer"].get("contents", [])
+                                if contents:
+                                    path = contents
+                                    break
+                    if path:
+                        break
+        except (KeyError, TypeError):
+            pass
+
+    if not path:
+        _LOGGER.error("Could not find videos in history")
+        return None
+
+    # Check for messageRenderer (empty history or paused)
+    for item in path:
+        if isinstance(item, dict) and "messageRenderer" in item:
+            return None
+
+    # Find video: Try lockupViewModel first, then videoRenderer, then Shorts
+
+    # Step 1: Look for lockupViewModel (new YouTube format)
+    for item in path:
+        if isinstance(item, dict) and "lockupViewModel" in item:
+            lockup = item["lockupViewModel"]
+            content_type = lockup.get("contentType", "")
+            if content_type == "LOCKUP_CONTENT_TYPE_VIDEO":
+                video_data = extract_lockup_info(lockup)
+                if video_data:
+                    return video_data
+
+    # Step 2: Look for videoRenderer (old YouTube format)
+    for item in path:
+        if isinstance(item, dict):
+            if "videoRenderer" in item:
+                video_data = extract_video_renderer_info(item["videoRenderer"])
+                if video_data:
+                    return video_data
+            elif "richItemRenderer" in item:
+                content = item["richItemRenderer"].get("content", {})
+                if "videoRenderer" in content:
+                    video_data = extract_video_renderer_info(content["videoRenderer"])
+                    if video_data:
+                        return video_data
+
+    # Step 3: Look for Shorts
+    for item in path:
+        if isinstance(item, dict):
+            if "reelShelfRenderer" in item:
+                reel_shelf = item["reelShelfRenderer"]
+                reel_items = reel_shelf.get("items", [])
+                for reel_item in reel_items:
+                    if "shortsLockupViewModel" in reel_item:
+                        video_data = extract_shorts_info(reel_item["shortsLockupViewModel"])
+                        if video_data:
+                            return video_data
+
+    _LOGGER.error("No video found in history")
+    return None
+
+
+def parse_history_items(data: dict[str, Any], limit: int) -> list[VideoInfo]:
+    """Collect the latest history entries in page order.
+
+    Unlike parse_history this walks every day section of the page, so the
+    result is the watch history newest first.
+
+    Args:
+        data: Decoded ytInitialData of /feed/history
+        limit: Maximum number of entries to return
+
+    Returns:
+        List of watched videos, empty if history is empty or paused
+    """
+    videos: list[VideoInfo] = []
+    if limit <= 0:
+        return videos
+
+    tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
+    for tab in tabs:
+        content = tab.get("tabRenderer", {}).get("content", {})
+        for section in content.get("sectionListRenderer", {}).get("contents", []):
+            for item in section.get("itemSectionRenderer", {}).get("contents", []):
+                if "messageRenderer" in item:
+                    return videos
+
+                for video_info in _extract_history_item(item):
+                    videos.append(video_info)
+                    if len(videos) >= limit:
+                        return videos
+
+    return videos
+
+
+def _extract_history_item(item: dict[str, Any]) -> list[VideoInfo]:
+    """Extract the videos of one history section item."""
+    if "lockupViewModel" in item:
+        lockup = item["lockupViewModel"]
+        if lockup.get("contentType", "") == "LOCKUP_CONTENT_TYPE_VIDEO":
+            video_info = extract_lockup_info(lockup)
+            return [video_info] if video_info else []
+        return []
+
+    renderer = item.get("videoRenderer")
+    if renderer is None:
+        renderer = item.get("richItemRenderer", {}).get("content", {}).get("videoRenderer")
+    if renderer is not None:
+        video_info = extract_video_renderer_info(renderer)
+        return [video_info] if video_info else []
+
+    videos = []
+    for reel_item in item.get("reelShelfRenderer", {}).get("items", []):
+        if "shortsLockupViewModel" in reel_item:
+            video_info = extract_shorts_info(reel_item["shortsLockupViewModel"])
+            if video_info:
+                videos.append(video_info)
+    return videos
+
+
+def parse_recommended(
+    data: dict[str, Any], limit: int = DEFAULT_RECOMMENDED_COUNT
+) -> list[VideoInfo]:
+    """Collect recommended videos from the home page data.
+
+    The grid is walked in order and the walk stops as soon as ``limit``
+    videos were extracted. Shelves (Shorts, news, ...) and ads are skipped
+    by their renderer key without looking inside them.
+
+    Args:
+        data: Decoded ytInitialData of the YouTube home page
+        limit: Maximum number of videos to return
+
+    Returns:
+        List of recommended videos, possibly empty
+    """
+    videos: list[VideoInfo] = []
+    if limit <= 0:
+        return videos
+
+    tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
+
+    for tab in tabs:
+        tab_renderer = tab.get("tabRenderer", {})
+        if tab_renderer.get("selected"):
+            rich_grid = tab_renderer.get("content", {}).get("richGridRenderer", {})
+            grid_contents = rich_grid.get("contents", [])
+
+            for item in grid_contents:
+                video_info = _extract_rich_item(item)
+                if video_info:
+                    videos.append(video_info)
+                    if len(videos) >= limit:
+                        break
+
+            break
+
+    return videos
+
+
+def parse_uploads(
+    data: dict[str, Any], known: frozenset[str], limit: int
+) -> list[VideoInfo]:
+    """Collect the uploads newer than the watermarks from the subscriptions feed.
+
+    The feed is ordered newest first across all channels, so the first video
+    already seen is the newest seen upload of its channel and everything
+    after it is older than what earlier polls returned. The walk stops
+    there without extracting the rest of the grid.
+
+    Args:
+        data: Decoded ytInitialData of /feed/subscriptions
+        known: Last seen video ID of every channel
+        limit: Maximum number of uploads to return
+
+    Returns:
+        New uploads, newest first
+    """
+    videos: list[VideoInfo] = []
+    if limit <= 0:
+        return videos
+
+    tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
+    for tab in tabs:
+        tab_renderer = tab.get("tabRenderer", {})
+        if not tab_renderer.get("selected"):
+            continue
+        grid = tab_renderer.get("content", {}).get("richGridRenderer", {})
+        for item in grid.get("contents", []):
+            video_info = _extract_rich_item(item)
+            if video_info is None:
+                continue
+            if video_info.video_id in known:
+                break
+            videos.append(video_info)
+            if len(videos) >= limit:
+                break
+        break
+
+    return videos
+
+
+def _extract_rich_item(item: dict[str, Any]) -> VideoInfo | None:
+    """Extract the video of a rich grid item.
+
+    richSectionRenderer (shelves), continuations, ads and Shorts are skipped
+    by their renderer key without looking inside them.
+    """
+    rich_item = item.get("richItemRenderer")
+    if rich_item is None:
+        return None
+    content = rich_item.get("content", {})
+
+    if "lockupViewModel" in content:
+        lockup = content["lockupViewModel"]
+        if lockup.get("contentType", "") == "LOCKUP_CONTENT_TYPE_VIDEO":
+            return extract_lockup_info(lockup)
+        return None
+
+    if "videoRenderer" in content:
+        return extract_video_renderer_info(content["videoRenderer"])
+
+    # Anything else (adSlotRenderer, Shorts, ...) is ignored
+    return None
+
+
+def parse_subscriptions(data: dict[str, Any]) -> list[ChannelInfo]:
+    """Collect subscribed channels from the channels page data.
+
+    Args:
+        data: Decoded ytInitialData of /feed/channels
+
+    Returns:
+        List of subscribed channels, possibly empty
+
+    Raises:
+        KeyError: If the page does not have the expected layout
+    """
+    tabs = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]
+
+    channel_list = None
+    for tab in tabs:
+        if "tabRenderer" in tab:
+            tab_content = tab["tabRenderer"].get("content", {})
+            if "sectionListRenderer" in tab_content:
+                sections = tab_content["sectionListRenderer"].get("contents", [])
+                for section in sections:
+                    if "itemSectionRenderer" in section:
+                        items = section["itemSectionRenderer"].get("contents", [])
+                        for item in items:
+                            if "shelfRenderer" in item:
+                                shelf_content = item["shelfRenderer"].get("content", {})
+                                if "expandedShelfContentsRenderer" in shelf_content:
+                                    channel_list = shelf_content["expandedShelfContentsRenderer"].get("items", [])
+                                    break
+                        if channel_list:
+                            break
+            if channel_list:
+                break
+
+    if not channel_list:
+        return []
+
+    channels = []
+    for item in channel_list:
+        if "channelRenderer" in item:
+            channel = _extract_channel(item["channelRenderer"])
+            if channel is not None:
+                channels.append(channel)
+
+    return channels
+
+
+def _extract_channel(channel_renderer: dict[str, Any]) -> ChannelInfo | None:
+    """Build a channel record from a channelRenderer of the channels page.
+
+    The renderer's labels don't match their content: on the current layout
+    ``subscriberCountText`` carries the @handle and ``videoCountText`` the
+    subscriber count, with no video count at all. Every text is therefore
+    classified by what it says rather than by the key it came in.
+    """
+    channel_title = clean_text(channel_renderer.get("title", {}).get("simpleText"), "")
+    if not channel_title:
+        return None
+
+    details: dict[str, str] = {}
+    for key in ("subscriberCountText", "videoCountText"):
+        _classify_channel_text(_renderer_text(channel_renderer.get(key)), details)
+
+    channel_id = channel_renderer.get("channelId") or (
+        channel_renderer.get("navigationEndpoint", {}).get("browseEndpoint", {}).get("browseId")
+    )
+    thumbnails = channel_renderer.get("thumbnail", {}).get("thumbnails") or [{}]
+
+    return ChannelInfo(
+        channel_name=sys.intern(channel_title),
+        channel_id=channel_id or None,
+        handle=details.get(ATTR_HANDLE),
+        subscriber_count=details.get(ATTR_SUBSCRIBER_COUNT),
+        video_count=details.get(ATTR_VIDEO_COUNT),
+        avatar=_absolute_url(thumbnails[-1].get("url")),
+    )
+
+
+def parse_channel_details(data: dict[str, Any]) -> dict[str, str]:
+    """Collect channel details from an InnerTube browse response.
+
+    Handles the older c4TabbedHeaderRenderer header and the newer
+    pageHeaderRenderer, whose counts are untyped metadata rows.
+
+    Args:
+        data: Decoded InnerTube browse response of a channel
+
+    Returns:
+        Details found, keyed by ATTR_HANDLE, ATTR_SUBSCRIBER_COUNT,
+        ATTR_VIDEO_COUNT and ATTR_AVATAR
+    """
+    details: dict[str, str] = {}
+    header = data.get("header", {})
+    avatars: list[dict[str, Any]] = []
+
+    if "c4TabbedHeaderRenderer" in header:
+        renderer = header["c4TabbedHeaderRenderer"]
+        for key in ("channelHandleText", "subscriberCountText", "videosCountText"):
+            _classify_channel_text(_renderer_text(renderer.get(key)), details)
+        avatars = renderer.get("avatar", {}).get("thumbnails", [])
+    elif "pageHeaderRenderer" in header:
+        view_model = header["pageHeaderRenderer"].get("content", {}).get("pageHeaderViewModel", {})
+        rows = (
+            view_model.get("metadata", {})
+            .get("contentMetadataViewModel", {})
+            .get("metadataRows", [])
+        )
+        for row in rows:
+            for part in row.get("metadataParts", []):
+                _classify_channel_text(part.get("text", {}).get("content"), details)
+        avatars = (
+            view_model.get("image", {})
+            .get("decoratedAvatarViewModel", {})
+            .get("avatar", {})
+            .get("avatarViewModel", {})
+            .get("image", {})
+            .get("sources", [])
+        )
+
+    if not avatars:
+        avatars = (
+            data.get("metadata", {})
+            .get("channelMetadataRenderer", {})
+            .get("avatar", {})
+            .get("thumbnails", [])
+        )
+    if avatars:
+        avatar = _absolute_url(avatars[-1].get("url"))
+        if avatar:
+            details[ATTR_AVATAR] = avatar
+
+    return details
+
+
+def _renderer_text(text_obj: Any) -> str | None:
+    """Return the text of a simpleText or runs object."""
+    if not isinstance(text_obj, dict):
+        return None
+    if "simpleText" in text_obj:
+        return text_obj["simpleText"]
+    runs = text_obj.get("runs")
+    if runs:
+        return "".join(run.get("text", "") for run in runs)
+    return None
+
+
+def _classify_channel_text(text: str | None, details: dict[str, str]) -> None:
+    """Store a channel header text under the detail it describes.
+
+    Pages are requested in English, so counts end in "subscribers" or
+    "videos"; handles start with "@".
+    """
+    text = clean_text(text, "")
+    if not text:
+        return
+    lowered = text.lower()
+    if text.startswith("@"):
+        details.setdefault(ATTR_HANDLE, text)
+    elif "subscriber" in lowered:
+        details.setdefault(ATTR_SUBSCRIBER_COUNT, text)
+    elif "video" in lowered:
+        details.setdefault(ATTR_VIDEO_COUNT, text)
+
+
+def _absolute_url(url: Any) -> str | None:
+    """Return an image URL with a scheme; YouTube often omits it."""
+    if not url or not isinstance(url, str):
+        return None
+    if url.startswith("//"):
+        return f"https:{url}"
+    return url
+
+
+def extract_lockup_info(lockup: dict) -> VideoInfo | None:
+    """Extract information from lockupViewModel.
+
+    Args:
+        lockup: lockupViewModel dictionary from YouTube API
+
+    Returns:
+        Video record or None if extraction fails
+    """
+    try:
+        video_id = lockup.get("contentId")
+        if not video_id:
+            return None
+
+        metadata = lockup.get("metadata", {}).get("lockupMetadataViewModel", {})
+
+        title = clean_text(metadata.get("title", {}).get("content"))
+
+        channel = NOT_AVAILABLE
+        metadata_rows = metadata.get("metadata", {}).get("contentMetadataViewModel", {}).get("metadataRows", [])
+        if metadata_rows:
+            first_row = metadata_rows[0]
+            parts = first_row.get("metadataParts", [])
+            if parts:
+                channel = clean_text(parts[0].get("text", {}).get("content"))
+
+        # Extract duration
+        duration = NOT_AVAILABLE
+
+        thumbnail = lockup.get("contentImage", {}).get("thumbnailViewModel", {})
+        overlays = thumbnail.get("overlays", [])
+
+        for overlay in overlays:
+            if "thumbnailOverlayBadgeViewModel" in overlay:
+                badge_vm = overlay["thumbnailOverlayBadgeViewModel"]
+                badges = badge_vm.get("thumbnailBadges", [])
+                for badge in badges:
+                    if "thumbnailBadgeViewModel" in badge:
+                        badge_data = badge["thumbnailBadgeViewModel"]
+                        badge_text = badge_data.get("text", "")
+                        badge_style = badge_data.get("badgeStyle", "")
+
+                        if badge_style == "THUMBNAIL_OVERLAY_BADGE_STYLE_LIVE" or badge_text in ["라이브", "LIVE"]:
+                            duration = LIVE_DURATION
+                            break
+                        elif badge_text and re.match(r'^\d{1,2}:\d{2}', badge_text):
+                            duration = badge_text
+                            break
+                if duration != NOT_AVAILABLE:
+                    break
+
+            elif "thumbnailOverlayTimeStatusRenderer" in overlay:
+                time_status = overlay["thumbnailOverlayTimeStatusRenderer"]
+                text_obj = time_status.get("text", {})
+                if "simpleText" in text_obj:
+                    duration = text_obj["simpleText"]
+                    break
+                elif "accessibility" in text_obj:
+                    duration = text_obj["accessibility"].get("accessibilityData", {}).get("label", NOT_AVAILABLE)
+                    break
+
+            elif "thumbnailBottomOverlayViewModel" in overlay:
+                badges = overlay["thumbnailBottomOverlayViewModel"].get("badges", [])
+                for badge in badges:
+                    if "thumbnailBadgeViewModel" in badge:
+                        duration = badge["thumbnailBadgeViewModel"].get("text", NOT_AVAILABLE)
+                        break
+                if duration != NOT_AVAILABLE:
+                    break
+
+        if duration == NOT_AVAILABLE:
+            for row in metadata_rows:
+                parts = row.get("metadataParts", [])
+                for part in parts:
+                    text = part.get("text", {}).get("content", "")
+                    if re.match(r'^\d{1,2}:\d{2}(:\d{2})?$', text):
+                        duration = text
+                        break
+                if duration != NOT_AVAILABLE:
+                    break
+
+        return VideoInfo(
+            video_id=video_id,
+            title=title,
+            channel=sys.intern(channel),
+            duration=duration,
+        )
+
+    except Exception as err:
+        _LOGGER.error("Failed to extract lockupViewModel: %s", err)
+        return None
+
+
+def extract_video_renderer_info(video_renderer: dict) -> VideoInfo | None:
+    """Extract information from videoRenderer.
+
+    Args:
+        video_renderer: videoRenderer dictionary from YouTube API
+
+    Returns:
+        Video record or None if extraction fails
+    """
+    try:
+        video_id = video_renderer.get("videoId", NOT_AVAILABLE)
+
+        title = NOT_AVAILABLE
+        if "title" in video_renderer:
+            title_data = video_renderer["title"]
+            if "runs" in title_data and len(title_data["runs"]) > 0:
+                title = title_data["runs"][0].get("text")
+            elif "simpleText" in title_data:
+                title = title_data["simpleText"]
+
+            title = clean_text(title)
+
+        channel = NOT_AVAILABLE
+        for key in ["longBylineText", "shortBylineText", "ownerText"]:
+            if key in video_renderer:
+                byline = video_renderer[key]
+                if "runs" in byline and len(byline["runs"]) > 0:
+                    channel = byline["runs"][0].get("text")
+                    break
+                elif "simpleText" in byline:
+                    channel = byline["simpleText"]
+                    break
+
+        return VideoInfo(
+            video_id=video_id,
+            title=title,
+            channel=sys.intern(clean_text(channel)),
+            duration=video_renderer.get("lengthText", {}).get("simpleText", NOT_AVAILABLE),
+        )
+
+    except Exception as err:
+        _LOGGER.error("Failed to extract videoRenderer: %s", err)
+        return None
+
+
+def extract_shorts_info(shorts_data: dict) -> VideoInfo | None:
+    """Extract information from shortsLockupViewModel.
+
+    Args:
+        shorts_data: shortsLockupViewModel dictionary from YouTube API
+
+    Returns:
+        Shorts video record or None if extraction fails
+    """
+    try:
+        entity_id = shorts_data.get("entityId", "")
+        video_id = entity_id.split("-")[-1] if entity_id else None
+
+        if not video_id or video_id == "item":
+            on_tap = shorts_data.get("onTap", {})
+            innertube = on_tap.get("innertubeCommand", {})
+            reel_watch = innertube.get("reelWatchEndpoint", {})
+            video_id = reel_watch.get("videoId")
+
+        if not video_id:
+            return None
+
+        overlay = shorts_data.get("overlayMetadata", {})
+        title = clean_text(overlay.get("primaryText", {}).get("content"), SHORTS_LABEL)
+
+        return VideoInfo(
+            video_id=video_id,
+            title=title,
+            channel=SHORTS_LABEL,
+            duration=SHORTS_DURATION,
+            is_short=True,
+        )
+
+    except Exception as err:
+        _LOGGER.error("Failed to extract Shorts info: %s", err)
+        return None
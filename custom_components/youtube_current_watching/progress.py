@@ -0,0 +1,108 @@
+"""Local playback progress for YouTube Watching integration.
+
+YouTube's pages say nothing about how far into a video the user is, and
+polling harder wouldn't change that. The position is estimated locally
+instead: it starts when playback of a new video is detected, stops and
+continues with the linked media player's pause and play state changes, and
+jumps to the player's own position whenever the player reports one.
+
+Free of Home Assistant imports; the caller passes the current time.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import ATTR_POSITION, ATTR_PROGRESS, ATTR_REMAINING
+
+
+class PlaybackProgress:
+    """Estimated playback position of the current video."""
+
+    def __init__(self) -> None:
+        """Initialize the model, with nothing played yet."""
+        self.playing = False
+        # When playback of the current video started, and the player's title
+        self.started_at: datetime | None = None
+        self.title: str | None = None
+        # Position in seconds at the anchor time
+        self._offset = 0.0
+        self._anchor: datetime | None = None
+
+    def start(self, now: datetime, title: str | None = None) -> None:
+        """Start a new video at position zero.
+
+        Args:
+            now: Current time
+            title: Title the media player reports, None if not started by it
+        """
+        self.started_at = now
+        self.title = title
+        self.seek(0.0, now)
+        self.playing = True
+
+    def pause(self, now: datetime) -> None:
+        """Stop advancing the position."""
+        if self.playing:
+            self._offset = self.position(now) or 0.0
+            self._anchor = now
+            self.playing = False
+
+    def resume(self, now: datetime) -> None:
+        """Continue advancing from the paused position."""
+        if self.started_at is None:
+            self.start(now)
+        elif not self.playing:
+            self._anchor = now
+            self.playing = True
+
+    def seek(self, position: float, at: datetime) -> None:
+        """Set the position the player reported at a point in time."""
+        self._offset = max(0.0, position)
+        self._anchor = at
+
+    def restart_if_stale(self, now: datetime, grace: timedelta) -> bool:
+        """Start over unless playback started within grace.
+
+        The watched video usually changes a little after the play event that
+        started the progress, once the history caught up. Only a change
+        without a recent play event (autoplay, or no linked media player)
+        means a new video started.
+
+        Returns:
+            True if the progress was restarted
+        """
+        if self.started_at is not None and now - self.started_at < grace:
+            return False
+        self.start(now)
+        return True
+
+    def position(self, now: datetime) -> float | None:
+        """Return the estimated position in seconds, None before any playback."""
+        if self._anchor is None:
+            return None
+        if not self.playing:
+            return self._offset
+        return self._offset + max(0.0, (now - self._anchor).total_seconds())
+
+    def as_dict(self, duration: int | None, now: datetime) -> dict[str, Any]:
+        """Return position, remaining seconds and percent for entity attributes.
+
+        Args:
+            duration: Length of the current video in seconds, None if unknown
+            now: Current time
+
+        Returns:
+            Attributes; remaining and percent are None without a duration
+        """
+        position = self.position(now)
+        if position is None:
+            return {ATTR_POSITION: None, ATTR_REMAINING: None, ATTR_PROGRESS: None}
+        if not duration:
+            return {ATTR_POSITION: int(position), ATTR_REMAINING: None, ATTR_PROGRESS: None}
+        position = min(position, duration)
+        return {
+            ATTR_POSITION: int(position),
+            ATTR_REMAINING: int(duration - position),
+            ATTR_PROGRESS: round(position / duration * 100, 1),
+        }
@@ -0,0 +1,201 @@
+"""Page recording for YouTube Watching integration.
+
+When YouTube changes a layout, the log only says that no video was found.
+With record mode on, the ytInitialData of every parsed page is saved, so the
+failing or slow parse can be replayed offline with
+``python -m tests.support.replay`` or turned into a test fixture.
+
+Only ytInitialData is kept, not the page around it, so the cookies, session
+tokens and account config embedded in ytcfg never reach the disk. Inside it
+the account menu is dropped, opaque session and tracking tokens are replaced
+and only the login state is kept of the response context. The watched and
+recommended videos themselves stay, so recordings are still personal and
+must not be shared publicly.
+
+Every recording is a minimal gzip-compressed page that ``parse_page`` reads
+like a downloaded one. The directory keeps the newest few per feed.
+
+Free of Home Assistant imports, like the parser.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from .const import FEED_HISTORY, RECORDING_MAX_FILES
+from .parser import decode_initial_data, find_initial_data, parse_logged_in
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_SUFFIX = ".html.gz"
+# Enough of a page for find_initial_data
+RECORDING_TEMPLATE = "<script>var ytInitialData = {};</script>"
+# Pages are large and written often; level 6 is much faster than the default 9
+COMPRESS_LEVEL = 6
+
+SANITIZED = "SANITIZED"
+# Subtrees about the signed-in account, dropped wherever they appear
+DROPPED_KEYS = frozenset({"topbar", "activeAccountHeaderRenderer"})
+# Opaque session, continuation and tracking tokens, replaced wherever they appear
+SCRUBBED_KEYS = frozenset({
+    "clickTrackingParams",
+    "continuation",
+    "datasyncId",
+    "delegatedSessionId",
+    "params",
+    "serializedShareEntity",
+    "sessionIndex",
+    "token",
+    "trackingParams",
+    "visitorData",
+})
+
+
+def scrub(data: dict[str, Any]) -> dict[str, Any]:
+    """Return ytInitialData without account details and session tokens.
+
+    Args:
+        data: Decoded ytInitialData
+
+    Returns:
+        Scrubbed copy; the response context only keeps the login state
+    """
+    scrubbed = _scrub_value(data)
+    logged_in = parse_logged_in(data)
+    scrubbed["responseContext"] = {
+        "serviceTrackingParams": [
+            {
+                "service": "GFEEDBACK",
+                "params": [{"key": "logged_in", "value": "1" if logged_in else "0"}],
+            }
+        ]
+    } if logged_in is not None else {}
+    return scrubbed
+
+
+def _scrub_value(value: Any) -> Any:
+    """Scrub a decoded JSON value recursively."""
+    if isinstance(value, dict):
+        return {
+            key: SANITIZED if key in SCRUBBED_KEYS else _scrub_value(item)
+            for key, item in value.items()
+            if key not in DROPPED_KEYS
+        }
+    if isinstance(value, list):
+        return [_scrub_value(item) for item in value]
+    return value
+
+
+def recording_feed(path: str) -> str:
+    """Return the feed name a recording belongs to."""
+    return os.path.basename(path).partition("_")[0]
+
+
+def load_recording(path: str) -> bytes:
+    """Return the page of a recording, as parse_page takes it."""
+    with gzip.open(path, "rb") as file:
+        return file.read()
+
+
+def iter_recordings(directory: str, feed: str | None = None) -> Iterator[str]:
+    """Yield the recordings in a directory, oldest first.
+
+    Args:
+        directory: Recording directory
+        feed: Only yield recordings of this feed, None for all
+
+    Yields:
+        Paths of the recordings
+    """
+    prefix = f"{feed}_" if feed else ""
+    for name in sorted(os.listdir(directory)):
+        if name.startswith(prefix) and name.endswith(RECORDING_SUFFIX):
+            yield os.path.join(directory, name)
+
+
+class PageRecorder:
+    """Writes scrubbed pages into a directory, keeping the newest per feed.
+
+    record runs in worker threads, so the state is guarded by a lock.
+    """
+
+    def __init__(self, directory: str, max_files: int = RECORDING_MAX_FILES) -> None:
+        """Initialize the recorder.
+
+        Args:
+            directory: Directory the recordings are written to, created on first use
+            max_files: Recordings kept per feed; older ones are removed
+        """
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        # Feed -> digest of its last recording, to skip unchanged pages
+        self._digests: dict[str, bytes] = {}
+        self.recorded = 0
+        self.unchanged = 0
+
+    def record(self, feed: str, body: bytes) -> str | None:
+        """Save the scrubbed ytInitialData of a downloaded page.
+
+        Args:
+            feed: Feed name the page belongs to
+            body: Raw response body
+
+        Returns:
+            Path of the recording, None if the page has no ytInitialData or
+            did not change since the last recording of the feed
+
+        Raises:
+            json.JSONDecodeError: If the embedded JSON is malformed
+            OSError: If the recording can't be written
+        """
+        raw = find_initial_data(body, allow_alternative=feed == FEED_HISTORY)
+        if raw is None:
+            return None
+        data = scrub(decode_initial_data(raw))
+        page = RECORDING_TEMPLATE.format(
+            json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        ).encode()
+        digest = hashlib.sha1(page).digest()
+
+        with self._lock:
+            if self._digests.get(feed) == digest:
+                self.unchanged += 1
+                return None
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{feed}_{time.time_ns()}{RECORDING_SUFFIX}")
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=COMPRESS_LEVEL) as file:
+                file.write(page)
+            os.replace(tmp_path, path)
+            self._digests[feed] = digest
+            self.recorded += 1
+            self._rotate(feed)
+
+        _LOGGER.debug("Recorded the %s page to %s", feed, path)
+        return path
+
+    def _rotate(self, feed: str) -> None:
+        """Remove the oldest recordings of a feed beyond max_files."""
+        recordings = list(iter_recordings(self.directory, feed))
+        for path in recordings[: max(0, len(recordings) - self.max_files)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recorder state for diagnostics."""
+        with self._lock:
+            return {
+                "max_files": self.max_files,
+                "recorded": self.recorded,
+                "unchanged": self.unchanged,
+            }
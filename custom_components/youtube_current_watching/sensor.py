@@ -1,14 +1,27 @@
 """Sensor platform for YouTube Watching integration."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_ENTITY_PICTURE, EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -17,10 +30,21 @@ from .const import (
     ATTR_VIDEO_ID,
     ATTR_THUMBNAIL,
     ATTR_DURATION,
+    ATTR_DURATION_SECONDS,
+    ATTR_POSITION,
+    ATTR_PROGRESS,
+    ATTR_REMAINING,
     ATTR_URL,
     ATTR_TOTAL_COUNT,
     ATTR_CHANNELS,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+    PROGRESS_UPDATE_SECONDS,
 )
+from .models import NOT_AVAILABLE, VideoInfo
+from .stats import REFRESH, STAGE_TOTAL
+from .thumbnail_cache import ThumbnailCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,42 +61,165 @@ async def async_setup_entry(
         entry: Config entry
         async_add_entities: Callback to add entities
     """
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    thumbnail_cache = entry_data["thumbnail_cache"]
     
-    async_add_entities(
-        [
-            YouTubeWatchingSensor(coordinator),
-            YouTubeSubscriptionsSensor(coordinator),
-            YouTubeRecommendedSensor(coordinator),  # 추천 영상 센서 추가
-        ],
-        True,
-    )
+    entities = [
+        YouTubeWatchingSensor(coordinator, thumbnail_cache),
+        YouTubeRefreshTimingSensor(coordinator),
+        YouTubeRequestBudgetSensor(coordinator),
+    ]
+    # Feeds turned off in the options get no entities
+    if coordinator.feed_enabled(FEED_SUBSCRIPTIONS):
+        entities.append(YouTubeSubscriptionsSensor(coordinator))
+    if coordinator.feed_enabled(FEED_RECOMMENDED):
+        entities.append(YouTubeRecommendedSensor(coordinator, thumbnail_cache))  # 추천 영상 센서 추가
+    if coordinator.feed_enabled(FEED_UPLOADS):
+        entities.append(YouTubeUploadsSensor(coordinator))
+
+    async_add_entities(entities, True)
+
+
+class _CachedPicture:
+    """Entity picture served from the thumbnail cache by an image entity.
+
+    Dashboards then load thumbnails from Home Assistant instead of YouTube;
+    the remote URL is only used until the thumbnail is cached. The sensor
+    writes its state again when a thumbnail gets cached and when the image
+    entity shows a new one. The access token in the proxy URL rotates every
+    few minutes; that alone doesn't rewrite the sensor, which would add a
+    recorder row each time. The previous token stays valid for one more
+    rotation and every other write picks up the current one.
+    """
+
+    def __init__(self, entity: Entity, cache: ThumbnailCache, image_key: str) -> None:
+        """Initialize the picture.
+
+        Args:
+            entity: Sensor showing the picture
+            cache: Thumbnail cache of the config entry
+            image_key: Unique ID suffix of the image entity serving the thumbnail
+        """
+        self._entity = entity
+        self._cache = cache
+        self._image_unique_id = f"{DOMAIN}_{image_key}"
+        self._image_entity_id: str | None = None
+        self._unsub_image: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_added(self) -> None:
+        """Follow the cache while the sensor is added."""
+        self._entity.async_on_remove(
+            self._cache.async_add_listener(self._async_thumbnail_stored)
+        )
+        self._entity.async_on_remove(self._async_untrack_image)
+
+    @callback
+    def url(self, video: VideoInfo | None) -> str | None:
+        """Return the local picture URL of a video, the remote one until it is cached."""
+        if video is None:
+            return None
+        entity_id = self._async_image_entity_id()
+        if entity_id is not None and video.video_id in self._cache:
+            state = self._entity.hass.states.get(entity_id)
+            picture = state.attributes.get(ATTR_ENTITY_PICTURE) if state else None
+            if picture:
+                # The proxy URL is the same for every video; keep browsers
+                # from showing the previous one from their cache
+                return f"{picture}&v={video.video_id}"
+        return video.thumbnail
+
+    @callback
+    def _async_image_entity_id(self) -> str | None:
+        """Return the image entity ID, following its state from the first lookup."""
+        if self._image_entity_id is None:
+            entity_id = er.async_get(self._entity.hass).async_get_entity_id(
+                "image", DOMAIN, self._image_unique_id
+            )
+            if entity_id is None:
+                # The image platform is not set up yet
+                return None
+            self._image_entity_id = entity_id
+            self._unsub_image = async_track_state_change_event(
+                self._entity.hass, entity_id, self._async_image_changed
+            )
+        return self._image_entity_id
+
+    @callback
+    def _async_image_changed(self, event: Event) -> None:
+        """Pick up a new thumbnail of the image entity."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            # Same image_last_updated, only the access token rotated
+            return
+        self._entity.async_write_ha_state()
+
+    @callback
+    def _async_thumbnail_stored(self, _video_id: str) -> None:
+        """Switch to the local picture once a thumbnail is cached."""
+        self._entity.async_write_ha_state()
+
+    @callback
+    def _async_untrack_image(self) -> None:
+        """Stop following the image entity."""
+        if self._unsub_image is not None:
+            self._unsub_image()
+            self._unsub_image = None
 
 
 class YouTubeWatchingSensor(CoordinatorEntity, SensorEntity):
     """Representation of a YouTube Watching sensor."""
 
     _attr_has_entity_name = True
+    # The progress moves every few seconds while playing, keep it out of the recorder
+    _unrecorded_attributes = frozenset({ATTR_POSITION, ATTR_REMAINING, ATTR_PROGRESS})
 
-    def __init__(self, coordinator) -> None:
+    def __init__(self, coordinator, thumbnail_cache: ThumbnailCache) -> None:
         """Initialize the sensor.
         
         Args:
             coordinator: Data coordinator instance
+            thumbnail_cache: Thumbnail cache the entity picture is served from
         """
         super().__init__(coordinator)
+        self._picture = _CachedPicture(self, thumbnail_cache, "watching_thumbnail")
         self._attr_name = "YouTube Watching"
         self._attr_unique_id = f"{DOMAIN}_watching"
         self._attr_icon = "mdi:youtube"
 
+    async def async_added_to_hass(self) -> None:
+        """Move the progress attributes on a local timer while playing."""
+        await super().async_added_to_hass()
+        self._picture.async_added()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_progress_tick,
+                timedelta(seconds=PROGRESS_UPDATE_SECONDS),
+                name=f"{DOMAIN} playback progress",
+            )
+        )
+
+    @callback
+    def _async_progress_tick(self, _now: datetime) -> None:
+        """Write the state with the current progress, no YouTube request involved."""
+        if self.coordinator.progress.playing:
+            self.async_write_ha_state()
+
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         if self.coordinator.data is None:
             return "No Recent Videos"
         
-        title = self.coordinator.data.get(ATTR_TITLE)
-        if not title or title == "N/A":
+        title = self.coordinator.data.title
+        if not title or title == NOT_AVAILABLE:
             return "No Recent Videos"
             
         return title
@@ -87,24 +234,24 @@ class YouTubeWatchingSensor(CoordinatorEntity, SensorEntity):
                 ATTR_VIDEO_ID: None,
                 ATTR_THUMBNAIL: None,
                 ATTR_DURATION: None,
+                ATTR_DURATION_SECONDS: None,
                 ATTR_URL: None,
+                ATTR_POSITION: None,
+                ATTR_REMAINING: None,
+                ATTR_PROGRESS: None,
             }
 
         return {
-            ATTR_CHANNEL: self.coordinator.data.get(ATTR_CHANNEL),
-            ATTR_TITLE: self.coordinator.data.get(ATTR_TITLE),
-            ATTR_VIDEO_ID: self.coordinator.data.get(ATTR_VIDEO_ID),
-            ATTR_THUMBNAIL: self.coordinator.data.get(ATTR_THUMBNAIL),
-            ATTR_DURATION: self.coordinator.data.get(ATTR_DURATION),
-            ATTR_URL: self.coordinator.data.get(ATTR_URL),
+            **self.coordinator.data.as_dict(),
+            **self.coordinator.progress.as_dict(
+                self.coordinator.data.duration_seconds, dt_util.utcnow()
+            ),
         }
 
     @property
     def entity_picture(self) -> str | None:
         """Return the entity picture to use in the frontend."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(ATTR_THUMBNAIL)
+        return self._picture.url(self.coordinator.data)
 
     @property
     def available(self) -> bool:
@@ -155,7 +302,7 @@ class YouTubeSubscriptionsSensor(CoordinatorEntity, SensorEntity):
         # Extract and process channel names
         channel_names = []
         for channel in channels:
-            name = channel.get("channel_name", "Unknown")
+            name = channel.channel_name
             # Replace commas with periods to avoid delimiter confusion
             name = name.replace(",", ".")
             # Truncate long names and add ellipsis
@@ -180,23 +327,30 @@ class YouTubeRecommendedSensor(CoordinatorEntity, SensorEntity):
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator) -> None:
+    def __init__(self, coordinator, thumbnail_cache: ThumbnailCache) -> None:
         """Initialize the sensor.
         
         Args:
             coordinator: Data coordinator instance
+            thumbnail_cache: Thumbnail cache the entity picture is served from
         """
         super().__init__(coordinator)
+        self._picture = _CachedPicture(self, thumbnail_cache, "recommended_thumbnail")
         self._attr_name = "YouTube Recommended"
         self._attr_unique_id = f"{DOMAIN}_recommended"
         self._attr_icon = "mdi:youtube"
 
+    async def async_added_to_hass(self) -> None:
+        """Follow the thumbnail cache for the entity picture."""
+        await super().async_added_to_hass()
+        self._picture.async_added()
+
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor (number of recommended videos)."""
         if self.coordinator.recommended_data is None:
             return 0
-        return len(self.coordinator.recommended_data)
+        return min(len(self.coordinator.recommended_data), self.coordinator.recommended_count)
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -216,30 +370,154 @@ class YouTubeRecommendedSensor(CoordinatorEntity, SensorEntity):
         
         # 각 비디오 정보를 속성으로 저장
         video_list = []
-        for idx, video in enumerate(videos[:3], 1):  # 최대 3개
-            video_list.append({
-                "position": idx,
-                ATTR_CHANNEL: video.get(ATTR_CHANNEL, "N/A"),
-                ATTR_TITLE: video.get(ATTR_TITLE, "N/A"),
-                ATTR_VIDEO_ID: video.get(ATTR_VIDEO_ID, "N/A"),
-                ATTR_THUMBNAIL: video.get(ATTR_THUMBNAIL, ""),
-                ATTR_DURATION: video.get(ATTR_DURATION, "N/A"),
-                ATTR_URL: video.get(ATTR_URL, ""),
-            })
+        for idx, video in enumerate(videos[:self.coordinator.recommended_count], 1):
+            video_list.append({"position": idx, **video.as_dict()})
         
         return {
-            "video_count": len(videos),
+            "video_count": len(video_list),
             "videos": video_list,
         }
 
     @property
     def entity_picture(self) -> str | None:
         """Return the entity picture to use in the frontend (첫 번째 추천 영상 썸네일)."""
-        if self.coordinator.recommended_data is None or len(self.coordinator.recommended_data) == 0:
+        if not self.coordinator.recommended_data:
+            return None
+        return self._picture.url(self.coordinator.recommended_data[0])
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.cookies_valid
+
+
+class YouTubeUploadsSensor(CoordinatorEntity, SensorEntity):
+    """Newest uploads of the subscribed channels."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor.
+        
+        Args:
+            coordinator: Data coordinator instance
+        """
+        super().__init__(coordinator)
+        self._attr_name = "YouTube Subscription Uploads"
+        self._attr_unique_id = f"{DOMAIN}_subscription_uploads"
+        self._attr_icon = "mdi:youtube-subscription"
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the title of the newest upload."""
+        if not self.coordinator.uploads_data:
             return None
-        return self.coordinator.recommended_data[0].get(ATTR_THUMBNAIL)
+        return self.coordinator.uploads_data[0].title
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        videos = [
+            {"position": idx, **video.as_dict()}
+            for idx, video in enumerate(self.coordinator.uploads_data, 1)
+        ]
+        return {
+            "video_count": len(videos),
+            "videos": videos,
+        }
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Return the thumbnail of the newest upload."""
+        if not self.coordinator.uploads_data:
+            return None
+        return self.coordinator.uploads_data[0].thumbnail
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.cookies_valid
+
+
+class YouTubeRefreshTimingSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing per-stage refresh timings."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    # The stage breakdown changes every refresh, keep it out of the recorder
+    _unrecorded_attributes = frozenset({"stages", "executor"})
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor.
+        
+        Args:
+            coordinator: Data coordinator instance
+        """
+        super().__init__(coordinator)
+        self._attr_name = "YouTube Refresh Time"
+        self._attr_unique_id = f"{DOMAIN}_refresh_time"
+        self._attr_icon = "mdi:timer-outline"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last refresh in milliseconds."""
+        duration = self.coordinator.stats.last_duration(REFRESH, STAGE_TOTAL)
+        if duration is None:
+            return None
+        return round(duration * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes (p50/p95 per feed and stage, thread pool)."""
+        return {
+            "stages": self.coordinator.stats.as_dict(),
+            "executor": self.coordinator.executor.as_dict(),
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return True  # Timings are most useful exactly when refreshes fail
+
+
+class YouTubeRequestBudgetSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing the request budget consumption."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "requests"
+    _unrecorded_attributes = frozenset({"requests", "deferred"})
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the sensor.
+        
+        Args:
+            coordinator: Data coordinator instance
+        """
+        super().__init__(coordinator)
+        self._attr_name = "YouTube Requests Last Hour"
+        self._attr_unique_id = f"{DOMAIN}_request_budget"
+        self._attr_icon = "mdi:speedometer"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests made within the last hour."""
+        return self.coordinator.budget.used_last_hour
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the budget, tokens left and requests per priority."""
+        budget = self.coordinator.budget.as_dict()
+        budget["usage_percent"] = round(
+            budget["used_last_hour"] / budget["budget_per_hour"] * 100, 1
+        )
+        return budget
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.cookies_valid
\ No newline at end of file
+        return True  # Budget state matters most when feeds are deferred
@@ -0,0 +1,185 @@
+"""Services for YouTube Watching integration."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    ATTR_LIMIT,
+    ATTR_MAX_AGE,
+    ATTR_TOTAL_COUNT,
+    ATTR_CHANNELS,
+    ATTR_VIDEOS,
+    ATTR_UPDATED,
+    DEFAULT_HISTORY_COUNT,
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    SERVICE_GET_HISTORY,
+    SERVICE_GET_RECOMMENDED,
+    SERVICE_GET_SUBSCRIPTIONS,
+    SERVICE_REFRESH,
+)
+from .coordinator import YouTubeDataCoordinator
+
+BASE_SCHEMA = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+}
+
+GET_SCHEMA = vol.Schema(
+    {
+        **BASE_SCHEMA,
+        vol.Optional(ATTR_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+GET_HISTORY_SCHEMA = GET_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_HISTORY_COUNT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=DEFAULT_HISTORY_COUNT)
+        ),
+    }
+)
+
+REFRESH_SCHEMA = vol.Schema(BASE_SCHEMA)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall, feed: str = FEED_HISTORY
+) -> YouTubeDataCoordinator:
+    """Return the coordinator a service call is meant for.
+    
+    Args:
+        hass: Home Assistant instance
+        call: Service call, optionally naming a config entry
+        feed: Feed the call reads
+        
+    Returns:
+        Coordinator of the selected config entry
+        
+    Raises:
+        ServiceValidationError: If no single loaded entry matches or the
+            feed is turned off for it
+    """
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+
+    if entry_id is None:
+        if len(entries) != 1:
+            raise ServiceValidationError(
+                f"Select the config entry to use, {len(entries)} are loaded"
+            )
+        coordinator = next(iter(entries.values()))["coordinator"]
+    elif entry_id not in entries:
+        raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+    else:
+        coordinator = entries[entry_id]["coordinator"]
+
+    if not coordinator.feed_enabled(feed):
+        raise ServiceValidationError(f"The {feed} feed is turned off in the options")
+    return coordinator
+
+
+def _updated(coordinator: YouTubeDataCoordinator, feed: str) -> str | None:
+    """Return when a feed was last fetched, as ISO string."""
+    updated = coordinator.feed_updated(feed)
+    return updated.isoformat() if updated else None
+
+
+async def _async_get_history(call: ServiceCall) -> ServiceResponse:
+    """Return the latest watch history entries."""
+    coordinator = _get_coordinator(call.hass, call)
+    await coordinator.async_refresh_if_stale(call.data.get(ATTR_MAX_AGE), FEED_HISTORY)
+
+    return {
+        ATTR_VIDEOS: [
+            video.as_dict() for video in coordinator.history_data[: call.data[ATTR_LIMIT]]
+        ],
+        ATTR_UPDATED: _updated(coordinator, FEED_HISTORY),
+    }
+
+
+async def _async_get_recommended(call: ServiceCall) -> ServiceResponse:
+    """Return the recommended videos."""
+    coordinator = _get_coordinator(call.hass, call, FEED_RECOMMENDED)
+    await coordinator.async_refresh_if_stale(call.data.get(ATTR_MAX_AGE), FEED_RECOMMENDED)
+
+    videos = coordinator.recommended_data or []
+    return {
+        ATTR_VIDEOS: [video.as_dict() for video in videos[: coordinator.recommended_count]],
+        ATTR_UPDATED: _updated(coordinator, FEED_RECOMMENDED),
+    }
+
+
+async def _async_get_subscriptions(call: ServiceCall) -> ServiceResponse:
+    """Return the subscribed channels."""
+    coordinator = _get_coordinator(call.hass, call, FEED_SUBSCRIPTIONS)
+    await coordinator.async_refresh_if_stale(call.data.get(ATTR_MAX_AGE), FEED_SUBSCRIPTIONS)
+
+    channels = (coordinator.subscriptions_data or {}).get("channels", [])
+    return {
+        ATTR_TOTAL_COUNT: len(channels),
+        ATTR_CHANNELS: [channel.as_dict() for channel in channels],
+        ATTR_UPDATED: _updated(coordinator, FEED_SUBSCRIPTIONS),
+    }
+
+
+async def _async_refresh(call: ServiceCall) -> ServiceResponse:
+    """Refresh now and return the currently watched video."""
+    coordinator = _get_coordinator(call.hass, call)
+    await coordinator.async_refresh_if_stale(0)
+
+    response: dict[str, Any] = {
+        "success": coordinator.last_update_success,
+        "video": coordinator.data.as_dict() if coordinator.data else None,
+        ATTR_UPDATED: _updated(coordinator, FEED_HISTORY),
+    }
+    return response if call.return_response else None
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services.
+    
+    Args:
+        hass: Home Assistant instance
+    """
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_RECOMMENDED,
+        _async_get_recommended,
+        schema=GET_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SUBSCRIPTIONS,
+        _async_get_subscriptions,
+        schema=GET_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,140 @@
+"""Per-stage refresh timing for YouTube Watching integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import Any
+
+# Pseudo feed used for the whole refresh cycle
+REFRESH = "refresh"
+# Pseudo feed used for the login probe
+AUTH = "auth"
+
+# Refresh stages, in pipeline order
+STAGE_COOKIE_LOAD = "cookie_load"
+STAGE_CONNECT = "connect"  # TLS connect + time to response headers
+STAGE_DOWNLOAD = "download"
+STAGE_REGEX = "regex"
+STAGE_JSON_DECODE = "json_decode"
+STAGE_EXTRACT = "extract"
+STAGE_THUMBNAIL = "thumbnail"
+STAGE_CHANNEL_DETAILS = "channel_details"  # background, per channel
+STAGE_TOTAL = "total"
+
+OUTCOME_OK = "ok"
+OUTCOME_EMPTY = "empty"
+OUTCOME_ERROR = "error"
+
+DEFAULT_WINDOW = 50
+
+
+@dataclass(slots=True)
+class StageSample:
+    """A single timed run of one stage."""
+
+    duration: float = 0.0
+    nbytes: int | None = None
+    # Bytes received before content decoding, for downloads
+    wire_bytes: int | None = None
+    outcome: str = OUTCOME_OK
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    index = max(0, round(percent / 100 * len(values) + 0.5) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+class RefreshStats:
+    """Rolling window of stage timings, keyed by feed and stage.
+
+    Samples are appended from executor threads; deque appends are atomic so
+    no extra locking is needed for the writers.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """Initialize the stats.
+
+        Args:
+            window: Number of samples kept per feed and stage
+        """
+        self._window = window
+        self._samples: dict[tuple[str, str], deque[StageSample]] = {}
+
+    @contextmanager
+    def stage(self, feed: str, stage: str) -> Iterator[StageSample]:
+        """Time a block of work as one sample of a stage.
+
+        The yielded sample can be updated with byte counts or an outcome.
+        An exception escaping the block is recorded as an error.
+
+        Args:
+            feed: Feed name the work belongs to
+            stage: Stage name
+        """
+        sample = StageSample()
+        start = time.perf_counter()
+        try:
+            yield sample
+        except BaseException:
+            sample.outcome = OUTCOME_ERROR
+            raise
+        finally:
+            sample.duration = time.perf_counter() - start
+            self.add(feed, stage, sample)
+
+    def add(self, feed: str, stage: str, sample: StageSample) -> None:
+        """Add a finished sample.
+
+        Args:
+            feed: Feed name the work belongs to
+            stage: Stage name
+            sample: Timed sample
+        """
+        key = (feed, stage)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples.setdefault(key, deque(maxlen=self._window))
+        samples.append(sample)
+
+    def last_duration(self, feed: str, stage: str) -> float | None:
+        """Return the most recent duration of a stage in seconds."""
+        samples = self._samples.get((feed, stage))
+        if not samples:
+            return None
+        return samples[-1].duration
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Summarize the window per feed and stage.
+
+        Returns:
+            Nested dictionary of feed -> stage -> summary, durations in ms
+        """
+        summary: dict[str, dict[str, dict[str, Any]]] = {}
+        for (feed, stage), samples in list(self._samples.items()):
+            snapshot = list(samples)
+            if not snapshot:
+                continue
+            durations = sorted(sample.duration * 1000 for sample in snapshot)
+            byte_counts = [sample.nbytes for sample in snapshot if sample.nbytes is not None]
+            wire_counts = [
+                sample.wire_bytes for sample in snapshot if sample.wire_bytes is not None
+            ]
+            stage_summary: dict[str, Any] = {
+                "count": len(snapshot),
+                "last_ms": round(snapshot[-1].duration * 1000, 1),
+                "p50_ms": round(percentile(durations, 50), 1),
+                "p95_ms": round(percentile(durations, 95), 1),
+                "outcomes": dict(Counter(sample.outcome for sample in snapshot)),
+            }
+            if byte_counts:
+                stage_summary["last_bytes"] = byte_counts[-1]
+                stage_summary["avg_bytes"] = sum(byte_counts) // len(byte_counts)
+            if wire_counts:
+                stage_summary["last_wire_bytes"] = wire_counts[-1]
+                stage_summary["avg_wire_bytes"] = sum(wire_counts) // len(wire_counts)
+            summary.setdefault(feed, {})[stage] = stage_summary
+        return summary
@@ -0,0 +1,283 @@
+"""On-disk thumbnail cache for YouTube Watching integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+import io
+import logging
+import os
+import re
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .budget import PRIORITY_LOW, RequestBudget
+from .executor import FetchExecutor, JobRejected
+from .models import THUMBNAIL_URL
+from .transport import TransportError
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow ships with Home Assistant
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# YouTube video IDs; anything else is never used as a file name
+VIDEO_ID_REGEX = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+FILE_SUFFIX = ".jpg"
+
+
+class ThumbnailCache:
+    """Bounded on-disk cache of video thumbnails with LRU eviction by size.
+
+    The LRU index is only touched from the event loop; file access runs in
+    the executor and downloads in the integration's thread pool when one is
+    given. Every video_id is downloaded at most once at a time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        directory: str,
+        max_bytes: int,
+        download: Callable[[str], bytes],
+        thumbnail_url: str = THUMBNAIL_URL,
+        target_width: int = 0,
+        budget: RequestBudget | None = None,
+        executor: FetchExecutor | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            hass: Home Assistant instance
+            directory: Directory the thumbnails are stored in
+            max_bytes: Total size the cache is evicted down to
+            download: Blocking download of a URL, raises TransportError on failure
+            thumbnail_url: Thumbnail host URL prefix the fallback URL is built from
+            target_width: Resize thumbnails to this width, 0 keeps the original
+            budget: Request budget the downloads are charged to
+            executor: Thread pool the downloads run in
+        """
+        self.hass = hass
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._download_url = download
+        self.thumbnail_url = thumbnail_url
+        self.target_width = target_width
+        self.budget = budget
+        self.executor = executor
+        # video_id -> file size, least recently used first
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._pending: dict[str, asyncio.Task[bytes | None]] = {}
+        # Called with the video_id of every newly stored thumbnail
+        self._listeners: list[Callable[[str], None]] = []
+
+    def __contains__(self, video_id: str) -> bool:
+        """Return if the thumbnail of a video is cached."""
+        return video_id in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the size of all cached thumbnails."""
+        return self._total_bytes
+
+    def _path(self, video_id: str) -> str:
+        """Return the file path of a cached thumbnail."""
+        return os.path.join(self.directory, f"{video_id}{FILE_SUFFIX}")
+
+    async def async_setup(self) -> None:
+        """Index the thumbnails already on disk, oldest access first."""
+        entries = await self.hass.async_add_executor_job(self._scan)
+        for video_id, size in entries:
+            self._entries[video_id] = size
+            self._total_bytes += size
+        await self._async_evict()
+
+    def _scan(self) -> list[tuple[str, int]]:
+        """Create the cache directory and list its thumbnails.
+
+        Returns:
+            List of (video_id, size) ordered by last access
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(FILE_SUFFIX) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[: -len(FILE_SUFFIX)], stat.st_size))
+        found.sort()
+        return [(video_id, size) for _, video_id, size in found]
+
+    @callback
+    def async_add_listener(self, listener: Callable[[str], None]) -> CALLBACK_TYPE:
+        """Call listener with the video ID of every newly stored thumbnail.
+
+        Returns:
+            Function that removes the listener
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def async_schedule(self, video_id: str, url: str) -> None:
+        """Download a thumbnail in the background unless it is cached.
+
+        Args:
+            video_id: YouTube video ID
+            url: Preferred thumbnail URL
+        """
+        if video_id in self._entries or video_id in self._pending:
+            return
+        if not VIDEO_ID_REGEX.match(video_id):
+            return
+        self.hass.async_create_background_task(
+            self.async_fetch(video_id, url), f"{__name__} fetch {video_id}"
+        )
+
+    async def async_fetch(self, video_id: str, url: str) -> bytes | None:
+        """Return a thumbnail, downloading it once if it is not cached.
+
+        Args:
+            video_id: YouTube video ID
+            url: Preferred thumbnail URL
+
+        Returns:
+            JPEG bytes or None if the thumbnail can't be fetched
+        """
+        if not VIDEO_ID_REGEX.match(video_id):
+            return None
+
+        if video_id in self._entries:
+            self._entries.move_to_end(video_id)
+            data = await self.hass.async_add_executor_job(self._read, video_id)
+            if data is not None:
+                return data
+            # Removed behind our back, download again
+            self._total_bytes -= self._entries.pop(video_id, 0)
+
+        task = self._pending.get(video_id)
+        if task is None:
+            task = self.hass.async_create_task(self._async_download(video_id, url))
+            self._pending[video_id] = task
+            task.add_done_callback(lambda _: self._pending.pop(video_id, None))
+        return await asyncio.shield(task)
+
+    async def _async_download(self, video_id: str, url: str) -> bytes | None:
+        """Download, store and index a thumbnail."""
+        if self.executor is None:
+            data = await self.hass.async_add_executor_job(self._download, video_id, url)
+        else:
+            try:
+                data = await self.executor.async_run(
+                    PRIORITY_LOW, self._download, video_id, url
+                )
+            except JobRejected as err:
+                _LOGGER.debug("Deferring thumbnail %s: %s", video_id, err)
+                return None
+        if data is None:
+            return None
+
+        try:
+            await self.hass.async_add_executor_job(self._write, video_id, data)
+        except OSError as err:
+            _LOGGER.error("Failed to store thumbnail %s: %s", video_id, err)
+            return data
+
+        self._total_bytes += len(data) - self._entries.pop(video_id, 0)
+        self._entries[video_id] = len(data)
+        await self._async_evict()
+        for listener in list(self._listeners):
+            listener(video_id)
+        return data
+
+    async def _async_evict(self) -> None:
+        """Remove least recently used thumbnails until the cache fits."""
+        evicted = []
+        # Always keep the newest thumbnail, even if it alone is too large
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            video_id, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(video_id)
+        if evicted:
+            await self.hass.async_add_executor_job(self._remove, evicted)
+
+    def _download(self, video_id: str, url: str) -> bytes | None:
+        """Download a thumbnail, falling back to the default resolution.
+
+        Returns:
+            (Resized) JPEG bytes or None if every URL failed
+        """
+        urls = [url] if url else []
+        default_url = f"{self.thumbnail_url}{video_id}/0.jpg"
+        if default_url not in urls:
+            urls.append(default_url)
+
+        for candidate in urls:
+            if self.budget is not None and not self.budget.try_acquire(PRIORITY_LOW):
+                _LOGGER.debug("Request budget is running low, deferring thumbnail %s", video_id)
+                return None
+            try:
+                data = self._download_url(candidate)
+            except TransportError as err:
+                _LOGGER.debug("Thumbnail request error for %s: %s", candidate, err)
+                continue
+            if data:
+                return self._resize(data)
+
+        _LOGGER.warning("Could not download thumbnail for %s", video_id)
+        return None
+
+    def _resize(self, data: bytes) -> bytes:
+        """Scale a JPEG down to the target width if it is wider."""
+        if not self.target_width or Image is None:
+            return data
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                if image.width <= self.target_width:
+                    return data
+                height = round(image.height * self.target_width / image.width)
+                resized = image.convert("RGB").resize(
+                    (self.target_width, height), Image.Resampling.LANCZOS
+                )
+                output = io.BytesIO()
+                resized.save(output, "JPEG", quality=85)
+                return output.getvalue()
+        except OSError as err:
+            _LOGGER.debug("Could not resize thumbnail: %s", err)
+            return data
+
+    def _read(self, video_id: str) -> bytes | None:
+        """Read a cached thumbnail and mark it as used."""
+        path = self._path(video_id)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            # mtime keeps the LRU order across restarts
+            now = time.time()
+            os.utime(path, (now, now))
+        except OSError:
+            return None
+        return data
+
+    def _write(self, video_id: str, data: bytes) -> None:
+        """Atomically write a thumbnail to the cache directory."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(video_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, video_ids: list[str]) -> None:
+        """Delete evicted thumbnails."""
+        for video_id in video_ids:
+            try:
+                os.remove(self._path(video_id))
+            except OSError:
+                pass
@@ -0,0 +1,162 @@
+"""Title index for YouTube Watching integration.
+
+Media players report the title of what is playing long before YouTube's
+history page shows it. The index keeps the videos recently seen in any feed
+keyed by normalized title, so a play event can be resolved locally: first
+by exact normalized title, then by character trigram similarity, which
+tolerates truncated titles and decorations added by the player.
+"""
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+import re
+import unicodedata
+
+from .models import VideoInfo
+
+# Titles shorter than this (normalized) are too ambiguous to match fuzzily
+MIN_FUZZY_LENGTH = 6
+NGRAM_SIZE = 3
+# Dice similarity a fuzzy match needs to be trusted
+DEFAULT_MIN_SCORE = 0.75
+DEFAULT_MAX_ENTRIES = 500
+
+_PUNCTUATION_REGEX = re.compile(r"[^\w\s]+")
+_SPACE_REGEX = re.compile(r"\s+")
+# Decorations some players add around the title
+_DECORATION_REGEX = re.compile(r"\s*[-|]\s*youtube\s*$")
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for matching.
+
+    Unicode compatibility forms are folded, case and punctuation dropped and
+    whitespace collapsed, so "ＭＶ｜Song (Live)" and "mv song live" match.
+
+    Args:
+        title: Title as shown by YouTube or a media player
+
+    Returns:
+        Normalized title, possibly empty
+    """
+    text = unicodedata.normalize("NFKC", title).casefold()
+    text = _DECORATION_REGEX.sub("", text)
+    text = _PUNCTUATION_REGEX.sub(" ", text).replace("_", " ")
+    return _SPACE_REGEX.sub(" ", text).strip()
+
+
+def _ngrams(text: str) -> frozenset[str]:
+    """Return the character n-grams of a normalized title."""
+    padded = f" {text} "
+    return frozenset(padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+
+
+@dataclass(frozen=True, slots=True)
+class TitleMatch:
+    """Video found for a title."""
+
+    video: VideoInfo
+    # 1.0 for an exact normalized match, Dice similarity otherwise
+    score: float
+
+
+class TitleIndex:
+    """Bounded index of recently seen videos by normalized title.
+
+    Entries are evicted oldest first; adding a video again refreshes it.
+    Only touched from the event loop.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the index.
+
+        Args:
+            max_entries: Number of videos kept
+        """
+        self.max_entries = max_entries
+        # video_id -> (video, normalized title, n-grams), oldest first
+        self._entries: OrderedDict[str, tuple[VideoInfo, str, frozenset[str]]] = OrderedDict()
+        self._by_title: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed videos."""
+        return len(self._entries)
+
+    def add(self, video: VideoInfo) -> None:
+        """Index a video, replacing an older record of it.
+
+        Args:
+            video: Video record from any feed
+        """
+        normalized = normalize_title(video.title)
+        if not normalized:
+            return
+
+        self._remove(video.video_id)
+        grams = _ngrams(normalized)
+        self._entries[video.video_id] = (video, normalized, grams)
+        self._by_title[normalized] = video.video_id
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(video.video_id)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def add_many(self, videos: list[VideoInfo] | None) -> None:
+        """Index several videos, the first one ending up newest.
+
+        Args:
+            videos: Video records in feed order
+        """
+        for video in reversed(videos or []):
+            self.add(video)
+
+    def _remove(self, video_id: str) -> None:
+        """Drop a video from the index."""
+        entry = self._entries.pop(video_id, None)
+        if entry is None:
+            return
+        _, normalized, grams = entry
+        if self._by_title.get(normalized) == video_id:
+            del self._by_title[normalized]
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(video_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def lookup(self, title: str, min_score: float = DEFAULT_MIN_SCORE) -> TitleMatch | None:
+        """Find the indexed video a title most likely refers to.
+
+        Args:
+            title: Title reported by the media player
+            min_score: Similarity a fuzzy match needs
+
+        Returns:
+            Best match or None if nothing is similar enough
+        """
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+
+        video_id = self._by_title.get(normalized)
+        if video_id is not None:
+            return TitleMatch(self._entries[video_id][0], 1.0)
+        if len(normalized) < MIN_FUZZY_LENGTH:
+            return None
+
+        grams = _ngrams(normalized)
+        shared: Counter[str] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        best: TitleMatch | None = None
+        for video_id, count in shared.items():
+            video, _, entry_grams = self._entries[video_id]
+            score = 2 * count / (len(grams) + len(entry_grams))
+            if score >= min_score and (best is None or score > best.score):
+                best = TitleMatch(video, score)
+        return best
@@ -0,0 +1,289 @@
+"""HTTP transports for YouTube Watching integration.
+
+Every coordinator keeps one long-lived client, so the TCP and TLS connection
+to YouTube is reused across pages and refresh cycles instead of being set up
+again for every page. Pages are requested compressed (brotli when a decoder
+is installed, gzip otherwise) and every download reports the bytes received
+on the wire next to the decoded size.
+
+The default transport uses requests. With the HTTP/2 option and httpx (plus
+h2) installed, pages are fetched over a single multiplexed HTTP/2 connection
+instead, which lets the coordinator request the feeds of a cycle concurrently.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
+import logging
+from typing import Any
+
+import requests
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    import brotli  # noqa: F401
+except ImportError:
+    try:
+        import brotlicffi as brotli  # noqa: F401
+    except ImportError:
+        brotli = None
+
+TRANSPORT_REQUESTS = "requests"
+TRANSPORT_HTTPX = "httpx"
+
+# Only advertise brotli when the installed client can decode it
+ACCEPT_ENCODING = "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-us,en;q=0.5",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Sec-Fetch-Mode": "navigate",
+}
+
+
+class TransportError(Exception):
+    """Request failed, whatever client was used."""
+
+
+@dataclass(slots=True)
+class Download:
+    """Body of a finished download."""
+
+    body: bytes
+    # Bytes received before content decoding
+    wire_bytes: int
+    encoding: str
+    http_version: str
+
+
+class RequestsTransport:
+    """Transport backed by one requests session (HTTP/1.1 keep-alive)."""
+
+    name = TRANSPORT_REQUESTS
+    # Requests of one cycle would each need their own connection
+    multiplexed = False
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.client = requests.Session()
+        self.client.headers.update(DEFAULT_HEADERS)
+
+    def set_cookies(self, cookie_jar: CookieJar) -> None:
+        """Replace the cookies sent with every request."""
+        self.client.cookies = cookie_jar
+
+    def open(self, url: str, timeout: float) -> _RequestsResponse:
+        """Send a GET request and return once the headers arrived.
+
+        Args:
+            url: Page URL
+            timeout: Seconds to wait for the connection and each read
+
+        Returns:
+            Response whose body has not been read yet
+
+        Raises:
+            TransportError: If the request fails or YouTube answers with an error
+        """
+        try:
+            response = self.client.get(url, timeout=timeout, stream=True)
+        except requests.exceptions.RequestException as err:
+            raise TransportError(str(err)) from err
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as err:
+            response.close()
+            raise TransportError(str(err)) from err
+        return _RequestsResponse(response)
+
+    def head(self, url: str, timeout: float) -> int:
+        """Send a HEAD request and return the status code.
+
+        Raises:
+            TransportError: If the request fails
+        """
+        try:
+            return self.client.head(url, timeout=timeout).status_code
+        except requests.exceptions.RequestException as err:
+            raise TransportError(str(err)) from err
+
+    def post(
+        self, url: str, payload: Any, headers: dict[str, str], timeout: float
+    ) -> tuple[int, bytes]:
+        """Send a JSON POST request.
+
+        Returns:
+            Status code and raw response body
+
+        Raises:
+            TransportError: If the request fails
+        """
+        try:
+            response = self.client.post(url, json=payload, headers=headers, timeout=timeout)
+        except requests.exceptions.RequestException as err:
+            raise TransportError(str(err)) from err
+        return response.status_code, response.content
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.client.close()
+
+
+class _RequestsResponse:
+    """requests response whose body is still on the wire."""
+
+    def __init__(self, response: requests.Response) -> None:
+        self._response = response
+
+    def read(self) -> Download:
+        """Read and decode the body.
+
+        Raises:
+            TransportError: If the connection breaks while reading
+        """
+        response = self._response
+        try:
+            body = response.content
+        except requests.exceptions.RequestException as err:
+            raise TransportError(str(err)) from err
+        finally:
+            response.close()
+        return Download(
+            body=body,
+            # urllib3 counts what it pulled off the socket, before decoding
+            wire_bytes=response.raw.tell(),
+            encoding=response.headers.get("Content-Encoding", "identity"),
+            http_version="HTTP/1.1" if response.raw.version == 11 else "HTTP/1.0",
+        )
+
+
+class HttpxTransport:
+    """Transport backed by one httpx client speaking HTTP/2."""
+
+    name = TRANSPORT_HTTPX
+    multiplexed = True
+
+    def __init__(self) -> None:
+        """Initialize the transport.
+
+        Raises:
+            ImportError: If httpx or h2 is not installed
+        """
+        import httpx
+
+        self._httpx = httpx
+        # http2=True raises ImportError here without h2
+        self.client = httpx.Client(
+            http2=True, headers=DEFAULT_HEADERS, follow_redirects=True
+        )
+
+    def set_cookies(self, cookie_jar: CookieJar) -> None:
+        """Replace the cookies sent with every request."""
+        self.client.cookies = cookie_jar
+
+    def open(self, url: str, timeout: float) -> _HttpxResponse:
+        """Send a GET request and return once the headers arrived.
+
+        Raises:
+            TransportError: If the request fails or YouTube answers with an error
+        """
+        request = self.client.build_request("GET", url, timeout=timeout)
+        try:
+            response = self.client.send(request, stream=True)
+        except self._httpx.HTTPError as err:
+            raise TransportError(str(err)) from err
+        try:
+            response.raise_for_status()
+        except self._httpx.HTTPStatusError as err:
+            response.close()
+            raise TransportError(str(err)) from err
+        return _HttpxResponse(response, self._httpx.HTTPError)
+
+    def head(self, url: str, timeout: float) -> int:
+        """Send a HEAD request and return the status code.
+
+        Raises:
+            TransportError: If the request fails
+        """
+        try:
+            return self.client.head(url, timeout=timeout).status_code
+        except self._httpx.HTTPError as err:
+            raise TransportError(str(err)) from err
+
+    def post(
+        self, url: str, payload: Any, headers: dict[str, str], timeout: float
+    ) -> tuple[int, bytes]:
+        """Send a JSON POST request.
+
+        Returns:
+            Status code and raw response body
+
+        Raises:
+            TransportError: If the request fails
+        """
+        try:
+            response = self.client.post(url, json=payload, headers=headers, timeout=timeout)
+        except self._httpx.HTTPError as err:
+            raise TransportError(str(err)) from err
+        return response.status_code, response.content
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.client.close()
+
+
+class _HttpxResponse:
+    """httpx response whose body is still on the wire."""
+
+    def __init__(self, response: Any, error: type[Exception]) -> None:
+        self._response = response
+        self._error = error
+
+    def read(self) -> Download:
+        """Read and decode the body.
+
+        Raises:
+            TransportError: If the connection breaks while reading
+        """
+        response = self._response
+        try:
+            body = response.read()
+        except self._error as err:
+            raise TransportError(str(err)) from err
+        finally:
+            response.close()
+        return Download(
+            body=body,
+            wire_bytes=response.num_bytes_downloaded,
+            encoding=response.headers.get("Content-Encoding", "identity"),
+            http_version=response.http_version,
+        )
+
+
+Transport = RequestsTransport | HttpxTransport
+
+
+def create_transport(http2: bool = False) -> Transport:
+    """Create the transport for a coordinator.
+
+    Must run in the executor: creating an HTTP/2 client loads the TLS
+    certificates from disk.
+
+    Args:
+        http2: Prefer a multiplexed HTTP/2 connection
+
+    Returns:
+        httpx transport if HTTP/2 was asked for and is available, else requests
+    """
+    if http2:
+        try:
+            return HttpxTransport()
+        except ImportError:
+            _LOGGER.warning(
+                "HTTP/2 needs the httpx and h2 packages, falling back to HTTP/1.1"
+            )
+    return RequestsTransport()
@@ -0,0 +1,234 @@
+"""Watch statistics for YouTube Watching integration.
+
+Every video that shows up on top of the watch history counts as watched.
+Watches are rolled up per hour as they arrive (videos in total, videos per
+channel and minutes estimated from the video durations) and imported into
+Home Assistant's long-term statistics as external statistics, so statistics
+graphs and cards can show them without a sensor whose every state change is
+recorded.
+
+Every statistic is a running sum. A watch only rewrites the row of the
+current hour; the sums are persisted in a Store so a restart continues them.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+from .models import NOT_AVAILABLE, VideoInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Seconds to collect changes before the Store is written
+SAVE_DELAY = 60
+
+STATISTIC_VIDEOS = f"{DOMAIN}:videos_watched"
+STATISTIC_MINUTES = f"{DOMAIN}:minutes_watched"
+# Followed by the slugified channel name
+STATISTIC_CHANNEL_PREFIX = f"{DOMAIN}:channel_"
+UNIT_VIDEOS = "videos"
+
+# Shorts have no duration label; they run up to a minute
+SHORTS_ESTIMATED_SECONDS = 30
+
+
+@dataclass(slots=True)
+class _Rollup:
+    """Running sum of one statistic with the total of its current hour."""
+
+    name: str
+    unit: str
+    # Start of the hour the value belongs to
+    hour: datetime
+    # Sum before that hour
+    base: float = 0.0
+    value: float = 0.0
+
+    def add(self, amount: float, hour: datetime) -> None:
+        """Add to the hour starting at hour, closing the current one if older."""
+        if hour > self.hour:
+            self.base += self.value
+            self.value = 0.0
+            self.hour = hour
+        self.value += amount
+
+    @property
+    def sum(self) -> float:
+        """Return the running sum including the current hour."""
+        return self.base + self.value
+
+
+class WatchStatistics:
+    """Hourly watch rollups, imported as long-term statistics.
+
+    Only touched from the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store | None = None) -> None:
+        """Initialize the rollups.
+
+        Args:
+            hass: Home Assistant instance
+            store: Store the sums are persisted in, None keeps them in memory
+        """
+        self.hass = hass
+        self._store = store
+        # statistic_id -> rollup
+        self._rollups: dict[str, _Rollup] = {}
+        # Top of the history page at the last update
+        self._last_video_id: str | None = None
+
+    def __len__(self) -> int:
+        """Return the number of statistics."""
+        return len(self._rollups)
+
+    async def async_load(self) -> None:
+        """Load the persisted sums."""
+        if self._store is None:
+            return
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self._last_video_id = stored.get("last_video_id")
+        for statistic_id, entry in stored.get("rollups", {}).items():
+            hour = dt_util.parse_datetime(entry["hour"])
+            if hour is None:
+                continue
+            self._rollups[statistic_id] = _Rollup(
+                entry["name"], entry["unit"], hour, entry["base"], entry["value"]
+            )
+
+    @callback
+    def async_record(self, history: list[VideoInfo]) -> list[VideoInfo]:
+        """Count the videos that are new on top of the watch history.
+
+        The first page ever seen only sets the starting point.
+
+        Args:
+            history: Latest history entries, newest first
+
+        Returns:
+            Videos counted as watched, newest first
+        """
+        if not history or history[0].video_id == self._last_video_id:
+            return []
+        watched = self._new_videos(history)
+        self._last_video_id = history[0].video_id
+
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        changed: set[str] = set()
+        for video in watched:
+            changed.add(
+                self._add(STATISTIC_VIDEOS, "YouTube videos watched", UNIT_VIDEOS, 1, hour)
+            )
+            changed.add(
+                self._add(
+                    STATISTIC_MINUTES,
+                    "YouTube minutes watched",
+                    UnitOfTime.MINUTES,
+                    _estimated_minutes(video),
+                    hour,
+                )
+            )
+            if video.channel != NOT_AVAILABLE:
+                changed.add(
+                    self._add(
+                        f"{STATISTIC_CHANNEL_PREFIX}{slugify(video.channel)}",
+                        f"YouTube {video.channel}",
+                        UNIT_VIDEOS,
+                        1,
+                        hour,
+                    )
+                )
+
+        if changed:
+            _LOGGER.debug("Counted %d watched videos", len(watched))
+            self._async_import(changed)
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return watched
+
+    def _new_videos(self, history: list[VideoInfo]) -> list[VideoInfo]:
+        """Return the entries above the previous top of the history."""
+        if self._last_video_id is None:
+            return []
+        new = []
+        for video in history:
+            if video.video_id == self._last_video_id:
+                return new
+            new.append(video)
+        # The previous top dropped off the page, so how many videos were
+        # watched in between is unknown; count only the one on top
+        return history[:1]
+
+    def _add(
+        self, statistic_id: str, name: str, unit: str, amount: float, hour: datetime
+    ) -> str:
+        """Add to a statistic, creating it on first use."""
+        rollup = self._rollups.get(statistic_id)
+        if rollup is None:
+            rollup = self._rollups[statistic_id] = _Rollup(name, unit, hour)
+        rollup.add(amount, hour)
+        return statistic_id
+
+    @callback
+    def _async_import(self, statistic_ids: set[str]) -> None:
+        """Hand the current hour of changed statistics to the recorder."""
+        if "recorder" not in self.hass.config.components:
+            return
+        for statistic_id in statistic_ids:
+            rollup = self._rollups[statistic_id]
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=rollup.name,
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=rollup.unit,
+            )
+            # Rows are keyed by start, so this replaces the earlier row of the hour
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [StatisticData(start=rollup.hour, state=rollup.value, sum=rollup.sum)],
+            )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the sums in their stored form."""
+        return {
+            "last_video_id": self._last_video_id,
+            "rollups": {
+                statistic_id: {
+                    "name": rollup.name,
+                    "unit": rollup.unit,
+                    "hour": rollup.hour.isoformat(),
+                    "base": rollup.base,
+                    "value": rollup.value,
+                }
+                for statistic_id, rollup in self._rollups.items()
+            },
+        }
+
+
+def _estimated_minutes(video: VideoInfo) -> float:
+    """Return the minutes a watched video likely took.
+
+    Videos count with their full length; live streams have no length and
+    count as zero.
+    """
+    if video.is_short:
+        return SHORTS_ESTIMATED_SECONDS / 60
+    seconds = video.duration_seconds
+    return seconds / 60 if seconds is not None else 0.0
@@ -0,0 +1,61 @@
+"""Shared fixtures for YouTube Watching tests."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from custom_components.youtube_current_watching.parser import find_initial_data
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Number of filler entries added to each page; "large" is roughly the size
+# of a real logged-in history page (~2 MB of ytInitialData).
+PAGE_SIZES = {
+    "small": 0,
+    "medium": 2_000,
+    "large": 20_000,
+}
+
+
+def load_fixture(name: str) -> str:
+    """Return the HTML of a saved page fixture."""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def build_page(name: str, page_size: str) -> str:
+    """Return a fixture page padded to the requested size.
+
+    Real pages carry large subtrees (framework updates, menus, tracking
+    params) that the parser never looks at but still has to decode, so the
+    filler is added under frameworkUpdates the way YouTube does.
+    """
+    html = load_fixture(name)
+    filler = PAGE_SIZES[page_size]
+    if not filler:
+        return html
+
+    raw = find_initial_data(html)
+    start = html.index(raw)
+    data = json.loads(raw)
+    data["frameworkUpdates"] = {
+        "entityBatchUpdate": {
+            "mutations": [
+                {
+                    "entityKey": f"SANITIZED{idx:08d}",
+                    "type": "ENTITY_MUTATION_TYPE_REPLACE",
+                    "payload": {
+                        "macroMarkersListEntity": {
+                            "markersList": {"markerType": "MARKER_TYPE_HEATMAP"},
+                            "trackingParams": "SANITIZED",
+                        }
+                    },
+                }
+                for idx in range(filler)
+            ]
+        }
+    }
+    return (
+        html[:start]
+        + json.dumps(data, ensure_ascii=False)
+        + html[start + len(raw) :]
+    )
@@ -0,0 +1,5 @@
+"""Local YouTube stand-in and load-test harness.
+
+Nothing in here talks to the real YouTube. ``server.StubYouTube`` serves the
+fixture pages over HTTP and ``harness`` drives coordinators against it.
+"""
@@ -0,0 +1,280 @@
+"""Load-test harness driving many coordinators against the stub server.
+
+Every simulated entry gets its own cookies file and YouTubeDataCoordinator
+pointed at ``StubYouTube``. All entries refresh concurrently for a number
+of cycles while the harness samples Home Assistant's executor, and the
+report covers throughput, refresh latency percentiles, executor occupancy,
+the queue wait and shed jobs of the coordinators' own thread pools and
+memory.
+
+Run from the repository root::
+
+    python -m tests.support.harness --entries 50 --cycles 10 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+import resource
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.youtube_current_watching.const import (
+    FEED_RECOMMENDED,
+    MAX_REQUEST_BUDGET,
+    PARSE_BACKEND_THREAD,
+    PARSE_BACKENDS,
+)
+from custom_components.youtube_current_watching.coordinator import YouTubeDataCoordinator
+from custom_components.youtube_current_watching.stats import percentile
+
+from ..conftest import PAGE_SIZES
+from .server import HISTORY_VARIANTS, StubConfig, StubYouTube
+
+# Netscape cookie file with the auth cookies the login check looks for
+COOKIES_TEMPLATE = """# Netscape HTTP Cookie File
+.youtube.com\tTRUE\t/\tTRUE\t{expires}\tSID\tstub-sid-{index}
+.youtube.com\tTRUE\t/\tTRUE\t{expires}\tLOGIN_INFO\tstub-login-{index}
+.youtube.com\tTRUE\t/\tTRUE\t{expires}\tSAPISID\tstub-sapisid-{index}
+"""
+
+
+@dataclass
+class LoadReport:
+    """Result of one load run."""
+
+    entries: int
+    cycles: int
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    failures: int = 0
+    # Executor samples: (busy threads, queued jobs)
+    executor_samples: list[tuple[int, int]] = field(default_factory=list)
+    executor_threads: int | None = None
+    # FetchExecutor.as_dict() of every coordinator's own thread pool
+    fetch_executors: list[dict[str, Any]] = field(default_factory=list)
+    tracemalloc_peak: int = 0
+    max_rss: int = 0
+    server_requests: dict[str, int] = field(default_factory=dict)
+    server_statuses: dict[int, int] = field(default_factory=dict)
+    server_bytes: int = 0
+
+    @property
+    def refreshes(self) -> int:
+        """Return the number of refreshes run."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Return completed refreshes per second."""
+        return self.refreshes / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as plain values."""
+        busy = [sample[0] for sample in self.executor_samples]
+        queued = [sample[1] for sample in self.executor_samples]
+        latencies = sorted(self.latencies)
+        return {
+            "entries": self.entries,
+            "cycles": self.cycles,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_per_s": round(self.throughput, 2),
+            "latency_ms": {
+                name: round(value * 1000, 1) if value is not None else None
+                for name, value in (
+                    ("p50", percentile(latencies, 50) if latencies else None),
+                    ("p95", percentile(latencies, 95) if latencies else None),
+                    ("p99", percentile(latencies, 99) if latencies else None),
+                    ("max", max(latencies, default=None)),
+                )
+            },
+            "executor": {
+                "threads": self.executor_threads,
+                "busy_mean": round(statistics.fmean(busy), 2) if busy else None,
+                "busy_max": max(busy, default=None),
+                "queued_max": max(queued, default=None),
+            },
+            "fetch_executor": {
+                "completed": sum(pool["completed"] for pool in self.fetch_executors),
+                "shed": sum(sum(pool["shed"].values()) for pool in self.fetch_executors),
+                "queue_wait_p95_ms_max": max(
+                    (
+                        pool["queue_wait_p95_ms"]
+                        for pool in self.fetch_executors
+                        if pool["queue_wait_p95_ms"] is not None
+                    ),
+                    default=None,
+                ),
+            },
+            "memory": {
+                "tracemalloc_peak": self.tracemalloc_peak,
+                "max_rss": self.max_rss,
+            },
+            "server": {
+                "requests": self.server_requests,
+                "statuses": self.server_statuses,
+                "bytes_sent": self.server_bytes,
+            },
+        }
+
+
+def write_cookies(directory: Path, index: int) -> str:
+    """Write the cookies file of a simulated entry."""
+    path = directory / f"cookies_{index}.txt"
+    path.write_text(
+        COOKIES_TEMPLATE.format(expires=int(time.time()) + 86400 * 180, index=index),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+async def _sample_executor(
+    executor: ThreadPoolExecutor, report: LoadReport, interval: float
+) -> None:
+    """Record busy threads and queued jobs of the executor until cancelled.
+
+    ThreadPoolExecutor has no public occupancy API, so this reads its
+    thread set, idle semaphore and work queue.
+    """
+    while True:
+        threads = len(executor._threads)  # noqa: SLF001
+        idle = executor._idle_semaphore._value  # noqa: SLF001
+        report.executor_threads = executor._max_workers  # noqa: SLF001
+        report.executor_samples.append(
+            (max(0, threads - idle), executor._work_queue.qsize())  # noqa: SLF001
+        )
+        await asyncio.sleep(interval)
+
+
+async def async_run_load(
+    hass: HomeAssistant,
+    stub: StubYouTube,
+    workdir: Path,
+    entries: int = 10,
+    cycles: int = 5,
+    parse_backend: str = PARSE_BACKEND_THREAD,
+    sample_interval: float = 0.05,
+) -> LoadReport:
+    """Refresh many coordinators against the stub server.
+
+    Args:
+        hass: Home Assistant instance
+        stub: Running stub server
+        workdir: Directory for the cookies files
+        entries: Number of simulated config entries
+        cycles: Refresh cycles per entry; all entries refresh concurrently
+        parse_backend: Parse backend of every coordinator
+        sample_interval: Seconds between executor samples
+
+    Returns:
+        Load report
+    """
+    coordinators = [
+        YouTubeDataCoordinator(
+            hass,
+            write_cookies(workdir, index),
+            parse_backend=parse_backend,
+            # Fetch every feed in every cycle
+            feed_intervals={FEED_RECOMMENDED: 0},
+            request_budget=MAX_REQUEST_BUDGET,
+            base_url=stub.base_url,
+            thumbnail_url=stub.thumbnail_url,
+        )
+        for index in range(entries)
+    ]
+    report = LoadReport(entries=entries, cycles=cycles)
+
+    async def refresh(coordinator: YouTubeDataCoordinator) -> None:
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        report.latencies.append(time.perf_counter() - start)
+        if not coordinator.last_update_success:
+            report.failures += 1
+
+    sampler = None
+    executor = hass.loop._default_executor  # noqa: SLF001
+    if isinstance(executor, ThreadPoolExecutor):
+        sampler = asyncio.create_task(_sample_executor(executor, report, sample_interval))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(coordinator.async_check_auth() for coordinator in coordinators))
+        for _ in range(cycles):
+            await asyncio.gather(*(refresh(coordinator) for coordinator in coordinators))
+    finally:
+        report.elapsed = time.perf_counter() - start
+        _, report.tracemalloc_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if sampler is not None:
+            sampler.cancel()
+        for coordinator in coordinators:
+            report.fetch_executors.append(coordinator.executor.as_dict())
+            await coordinator.async_shutdown()
+
+    report.max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    report.server_requests = dict(stub.counters.requests)
+    report.server_statuses = dict(stub.counters.statuses)
+    report.server_bytes = stub.counters.bytes_sent
+    return report
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run one load test from the command line."""
+    # Imported here so the module can be used without the pytest plugin
+    from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        history_page=args.history_page,
+        page_size=args.page_size,
+        compress=args.compress,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        async with async_test_home_assistant() as hass, StubYouTube(config) as stub:
+            report = await async_run_load(
+                hass,
+                stub,
+                Path(workdir),
+                entries=args.entries,
+                cycles=args.cycles,
+                parse_backend=args.parse_backend,
+            )
+
+    for key, value in report.as_dict().items():
+        print(f"{key}: {value}")
+
+
+def main() -> None:
+    """Parse the command line and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--parse-backend", choices=PARSE_BACKENDS, default=PARSE_BACKEND_THREAD)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500s")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429s")
+    parser.add_argument("--history-page", choices=HISTORY_VARIANTS, default=HISTORY_VARIANTS[0])
+    parser.add_argument("--page-size", choices=list(PAGE_SIZES), default="small")
+    parser.add_argument("--compress", action="store_true", help="compress the pages")
+    parser.add_argument("--seed", type=int, default=None)
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Offline replay of page recordings through the parse pipeline.
+
+Runs ``parse_page`` over the pages that record mode (see ``recording.py``)
+saved, exactly as a refresh parses a downloaded page, and prints the stage
+timings and what was extracted from every recording. Copy the recordings
+directory off the Home Assistant host
+(``.storage/youtube_current_watching/<entry_id>/recordings``) and run from
+the repository root::
+
+    python -m tests.support.replay /path/to/recordings --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+import statistics
+
+from custom_components.youtube_current_watching.const import (
+    DEFAULT_HISTORY_COUNT,
+    DEFAULT_RECOMMENDED_COUNT,
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+    MAX_NEW_UPLOADS,
+)
+from custom_components.youtube_current_watching.parser import parse_page
+from custom_components.youtube_current_watching.recording import (
+    RECORDING_SUFFIX,
+    iter_recordings,
+    load_recording,
+    recording_feed,
+)
+from custom_components.youtube_current_watching.stats import (
+    STAGE_EXTRACT,
+    STAGE_JSON_DECODE,
+    STAGE_REGEX,
+)
+
+STAGES = [STAGE_REGEX, STAGE_JSON_DECODE, STAGE_EXTRACT]
+# Feed -> limit the coordinator parses the page with
+FEED_LIMITS = {
+    FEED_HISTORY: DEFAULT_HISTORY_COUNT,
+    FEED_RECOMMENDED: DEFAULT_RECOMMENDED_COUNT,
+    FEED_SUBSCRIPTIONS: DEFAULT_RECOMMENDED_COUNT,
+    FEED_UPLOADS: MAX_NEW_UPLOADS,
+}
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of replaying one recording."""
+
+    path: str
+    feed: str
+    found: bool = False
+    partial: bool = False
+    logged_in: bool | None = None
+    raw_bytes: int = 0
+    # Videos or channels extracted
+    records: int = 0
+    # Stage name -> median milliseconds over the repeats
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        """Return the median milliseconds of all stages together."""
+        return sum(self.timings.values())
+
+
+def replay(path: str, repeat: int = 1) -> ReplayResult:
+    """Parse a recording repeat times.
+
+    Args:
+        path: Recording to parse
+        repeat: Times to parse it, the median of every stage is reported
+
+    Returns:
+        What the last parse extracted, with the median stage timings
+    """
+    feed = recording_feed(path)
+    body = load_recording(path)
+    samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    for _ in range(repeat):
+        result = parse_page(feed, body, FEED_LIMITS[feed])
+        for stage, duration in result.timings.items():
+            samples[stage].append(duration * 1000)
+
+    if feed == FEED_HISTORY:
+        records = len(result.history)
+    else:
+        records = len(result.records or [])
+    return ReplayResult(
+        path=path,
+        feed=feed,
+        found=result.found,
+        partial=result.partial,
+        logged_in=result.logged_in,
+        raw_bytes=result.raw_bytes,
+        records=records,
+        timings={
+            stage: statistics.median(values) for stage, values in samples.items() if values
+        },
+    )
+
+
+def _recordings(paths: list[str], feed: str | None) -> list[str]:
+    """Expand recording directories into their recordings."""
+    recordings = []
+    for path in paths:
+        if Path(path).is_dir():
+            recordings.extend(iter_recordings(path, feed))
+        elif path.endswith(RECORDING_SUFFIX):
+            recordings.append(path)
+    return recordings
+
+
+def main() -> None:
+    """Parse the command line and replay the recordings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="recordings or recording directories")
+    parser.add_argument("--feed", choices=list(FEED_LIMITS), help="only this feed")
+    parser.add_argument("--repeat", type=int, default=1, help="parses per recording")
+    args = parser.parse_args()
+
+    print(
+        f"{'recording':<44} {'feed':<13} {'bytes':>9} "
+        + " ".join(f"{stage + ' ms':>15}" for stage in STAGES)
+        + f" {'records':>7}  notes"
+    )
+    results = [replay(path, args.repeat) for path in _recordings(args.paths, args.feed)]
+    for result in results:
+        notes = []
+        if not result.found:
+            notes.append("no ytInitialData")
+        elif not result.records:
+            notes.append("nothing extracted")
+        if result.partial:
+            notes.append("partial decode")
+        if result.logged_in is False:
+            notes.append("logged out")
+        print(
+            f"{Path(result.path).name:<44} {result.feed:<13} {result.raw_bytes:>9} "
+            + " ".join(f"{result.timings.get(stage, 0.0):>15.2f}" for stage in STAGES)
+            + f" {result.records:>7}  {', '.join(notes)}"
+        )
+
+    if results:
+        totals = sorted(result.total for result in results)
+        print(
+            f"{len(results)} recordings, total ms median {statistics.median(totals):.2f}, "
+            f"max {totals[-1]:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
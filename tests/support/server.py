@@ -0,0 +1,258 @@
+"""aiohttp server standing in for YouTube.
+
+Serves the fixture pages for /feed/history, /feed/channels,
+/feed/subscriptions and the home page, thumbnails for /vi/<video_id>/<name>.jpg and a logged-in answer for
+every InnerTube endpoint, with a channel header for browse calls. Latency, errors, 429s, the login state and the
+page layout can be changed while the server runs through ``StubConfig``.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import random
+
+from aiohttp import web
+
+from ..conftest import build_page
+
+# 1x1 baseline JPEG, enough for the thumbnail probes and the cache
+JPEG_BYTES = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707"
+    "070909080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c"
+    "1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101011100"
+    "ffc4001f0000010501010101010100000000000000000102030405060708090a0bff"
+    "c400b5100002010303020403050504040000017d0102030004110512213141061351"
+    "6107227114328191a1082342b1c11552d1f02433627282090a161718191a25262728"
+    "292a3435363738393a434445464748494a535455565758595a636465666768696a73"
+    "7475767778797a838485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2"
+    "b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8"
+    "e9eaf1f2f3f4f5f6f7f8f9faffda0008010100003f00fbd3ffd9"
+)
+
+# Layout variants per page, as fixture file names
+HISTORY_VARIANTS = [
+    "history_lockup.html",
+    "history_lockup_live.html",
+    "history_video_renderer.html",
+    "history_rich_item.html",
+    "history_shorts.html",
+    "history_paused.html",
+]
+HOME_VARIANTS = ["home.html"]
+CHANNELS_VARIANTS = ["channels.html"]
+UPLOADS_VARIANTS = ["subscriptions.html"]
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub server; may be changed while it runs."""
+
+    # Seconds added to every response, plus uniform random jitter
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of requests answered with 500 / 429 (with Retry-After)
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    # Fixture served for each page, one of the *_VARIANTS
+    history_page: str = HISTORY_VARIANTS[0]
+    home_page: str = HOME_VARIANTS[0]
+    channels_page: str = CHANNELS_VARIANTS[0]
+    uploads_page: str = UPLOADS_VARIANTS[0]
+    # Filler size of the pages, a key of conftest.PAGE_SIZES
+    page_size: str = "small"
+    # Whether pages and InnerTube answers report a logged-in session
+    logged_in: bool = True
+    # maxresdefault.jpg exists; otherwise only 0.jpg is served
+    maxres_thumbnails: bool = True
+    # Compress pages with the encoding the client accepts
+    compress: bool = False
+    seed: int | None = None
+
+
+@dataclass
+class StubCounters:
+    """What the server answered so far."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    # Path -> requests that carried a Cookie header
+    cookie_requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+    bytes_sent: int = 0
+
+
+class StubYouTube:
+    """YouTube stand-in serving fixture pages on a local port."""
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        """Initialize the server.
+
+        Args:
+            config: Server behaviour, defaults to a fast and healthy YouTube
+        """
+        self.config = config or StubConfig()
+        self.counters = StubCounters()
+        self._random = random.Random(self.config.seed)
+        self._pages: dict[tuple[str, str, bool], bytes] = {}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/", self._home)
+        self.app.router.add_get("/feed/history", self._history)
+        self.app.router.add_get("/feed/channels", self._channels)
+        self.app.router.add_get("/feed/subscriptions", self._uploads)
+        self.app.router.add_get("/vi/{video_id}/{name}", self._thumbnail)
+        self.app.router.add_post("/youtubei/v1/{endpoint:.*}", self._innertube)
+
+    @property
+    def thumbnail_url(self) -> str:
+        """Return the thumbnail URL prefix to give the coordinator."""
+        return f"{self.base_url}/vi/"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free one
+
+        Returns:
+            Base URL of the server
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> StubYouTube:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency and injected failures, then count the response."""
+        config = self.config
+        self.counters.requests[request.path] += 1
+        if "Cookie" in request.headers:
+            self.counters.cookie_requests[request.path] += 1
+
+        delay = config.latency + self._random.uniform(0, config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < config.throttle_rate:
+            response = web.Response(status=429, headers={"Retry-After": "30"})
+        elif roll < config.throttle_rate + config.error_rate:
+            response = web.Response(status=500)
+        else:
+            response = await handler(request)
+
+        self.counters.statuses[response.status] += 1
+        if isinstance(response, web.Response) and response.body is not None:
+            self.counters.bytes_sent += len(response.body)
+        return response
+
+    def _page(self, fixture: str) -> web.Response:
+        """Return a fixture page with the configured size and login state."""
+        key = (fixture, self.config.page_size, self.config.logged_in)
+        body = self._pages.get(key)
+        if body is None:
+            html = build_page(fixture, self.config.page_size)
+            if not self.config.logged_in:
+                html = html.replace(
+                    '"key": "logged_in", "value": "1"', '"key": "logged_in", "value": "0"'
+                )
+            body = self._pages[key] = html.encode()
+        response = web.Response(body=body, content_type="text/html", charset="utf-8")
+        if self.config.compress:
+            response.enable_compression()
+        return response
+
+    async def _home(self, request: web.Request) -> web.Response:
+        return self._page(self.config.home_page)
+
+    async def _history(self, request: web.Request) -> web.Response:
+        return self._page(self.config.history_page)
+
+    async def _channels(self, request: web.Request) -> web.Response:
+        return self._page(self.config.channels_page)
+
+    async def _uploads(self, request: web.Request) -> web.Response:
+        return self._page(self.config.uploads_page)
+
+    async def _thumbnail(self, request: web.Request) -> web.Response:
+        if request.match_info["name"] == "maxresdefault.jpg" and not self.config.maxres_thumbnails:
+            return web.Response(status=404)
+        return web.Response(body=JPEG_BYTES, content_type="image/jpeg")
+
+    async def _innertube(self, request: web.Request) -> web.Response:
+        logged_in = "1" if self.config.logged_in else "0"
+        response = {
+            "responseContext": {
+                "serviceTrackingParams": [
+                    {
+                        "service": "GFEEDBACK",
+                        "params": [{"key": "logged_in", "value": logged_in}],
+                    }
+                ]
+            },
+            "endpoint": request.match_info["endpoint"],
+        }
+        if request.match_info["endpoint"] == "browse":
+            payload = await request.json()
+            response["header"] = channel_header(payload.get("browseId", ""))
+        return web.json_response(response)
+
+
+def channel_header(channel_id: str) -> dict:
+    """Return the pageHeaderRenderer of a channel's browse response."""
+    suffix = channel_id[-1:] or "0"
+    return {
+        "pageHeaderRenderer": {
+            "content": {
+                "pageHeaderViewModel": {
+                    "image": {
+                        "decoratedAvatarViewModel": {
+                            "avatar": {
+                                "avatarViewModel": {
+                                    "image": {
+                                        "sources": [
+                                            {"url": f"https://yt3.ggpht.com/{channel_id}=s72"},
+                                            {"url": f"https://yt3.ggpht.com/{channel_id}=s160"},
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "metadata": {
+                        "contentMetadataViewModel": {
+                            "metadataRows": [
+                                {"metadataParts": [{"text": {"content": f"@stub{suffix}"}}]},
+                                {
+                                    "metadataParts": [
+                                        {"text": {"content": f"{suffix}.5K subscribers"}},
+                                        {"text": {"content": f"{suffix}0 videos"}},
+                                    ]
+                                },
+                            ]
+                        }
+                    },
+                }
+            }
+        }
+    }
@@ -0,0 +1,81 @@
+"""Tests for the cookie checks."""
+from __future__ import annotations
+
+from http.cookiejar import MozillaCookieJar
+from pathlib import Path
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.youtube_current_watching.auth import probe_login, read_cookie_expiry
+from custom_components.youtube_current_watching.transport import TransportError
+
+COOKIE_LINE = "{domain}\tTRUE\t/\tTRUE\t{expires}\t{name}\t{value}\n"
+
+
+def _jar(tmp_path: Path, *cookies: tuple[str, str, str]) -> MozillaCookieJar:
+    """Load a cookies.txt with (domain, name, value) cookies."""
+    expires = int(time.time()) + 86400
+    path = tmp_path / "cookies.txt"
+    path.write_text(
+        "# Netscape HTTP Cookie File\n"
+        + "".join(
+            COOKIE_LINE.format(domain=domain, expires=expires, name=name, value=value)
+            for domain, name, value in cookies
+        ),
+        encoding="utf-8",
+    )
+    jar = MozillaCookieJar(str(path))
+    jar.load()
+    return jar
+
+
+def test_sapisid_of_either_domain(tmp_path: Path) -> None:
+    """SAPISID counts for .google.com too; the .youtube.com one wins."""
+    session = [(".youtube.com", "SID", "sid"), (".youtube.com", "LOGIN_INFO", "login")]
+
+    expiry = read_cookie_expiry(_jar(tmp_path, *session, (".google.com", "SAPISID", "google")))
+    assert expiry.missing == ()
+    assert expiry.sapisid == "google"
+    assert expiry.expires_at is not None
+
+    expiry = read_cookie_expiry(
+        _jar(
+            tmp_path,
+            *session,
+            (".google.com", "SAPISID", "google"),
+            (".youtube.com", "SAPISID", "youtube"),
+        )
+    )
+    assert expiry.sapisid == "youtube"
+
+    expiry = read_cookie_expiry(_jar(tmp_path, *session))
+    assert expiry.missing == ("SAPISID",)
+    assert expiry.sapisid is None
+
+
+class _AnsweringTransport:
+    """Transport answering every POST with one status and body."""
+
+    def __init__(self, status: int, body: bytes = b"{}") -> None:
+        self.status = status
+        self.body = body
+
+    def post(
+        self, url: str, payload: Any, headers: dict[str, str], timeout: float
+    ) -> tuple[int, bytes]:
+        return self.status, self.body
+
+
+def test_probe_only_trusts_the_logged_in_flag() -> None:
+    """A refused probe is an unclear answer, not a logged-out session."""
+    logged_out = (
+        b'{"responseContext": {"serviceTrackingParams": [{"service": "GFEEDBACK",'
+        b' "params": [{"key": "logged_in", "value": "0"}]}]}}'
+    )
+    assert probe_login(_AnsweringTransport(200, logged_out), "sapisid") is False
+    assert probe_login(_AnsweringTransport(200), "sapisid") is None
+    for status in (401, 403):
+        with pytest.raises(TransportError):
+            probe_login(_AnsweringTransport(status), "sapisid")
@@ -0,0 +1,35 @@
+"""Tests for the request budget."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.youtube_current_watching import budget
+from custom_components.youtube_current_watching.budget import (
+    HOUR,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    RequestBudget,
+)
+
+
+def test_counts_cover_the_last_hour(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Requests and deferrals per priority age out like used_last_hour."""
+    now = 1000.0
+    monkeypatch.setattr(budget.time, "monotonic", lambda: now)
+    request_budget = RequestBudget(120)
+
+    # The low priority leaves half of the 10 token bucket to the others
+    results = [request_budget.try_acquire(PRIORITY_LOW) for _ in range(7)]
+    assert results == [True] * 5 + [False] * 2
+    assert request_budget.try_acquire(PRIORITY_HIGH)
+
+    state = request_budget.as_dict()
+    assert state["used_last_hour"] == 6
+    assert state["requests"] == {"high": 1, "normal": 0, "low": 5}
+    assert state["deferred"] == {"high": 0, "normal": 0, "low": 2}
+
+    now += HOUR
+    state = request_budget.as_dict()
+    assert state["used_last_hour"] == 0
+    assert state["requests"] == {"high": 0, "normal": 0, "low": 0}
+    assert state["deferred"] == {"high": 0, "normal": 0, "low": 0}
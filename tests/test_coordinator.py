@@ -0,0 +1,195 @@
+"""Tests for the coordinator against the stub server."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.youtube_current_watching.auth import (
+    REASON_MISSING_COOKIES,
+    REASON_OK,
+)
+from custom_components.youtube_current_watching.const import (
+    FEED_HISTORY,
+    FEED_SUBSCRIPTIONS,
+    MAX_REQUEST_BUDGET,
+)
+from custom_components.youtube_current_watching.coordinator import YouTubeDataCoordinator
+from custom_components.youtube_current_watching.thumbnail_cache import ThumbnailCache
+
+from .support.harness import write_cookies
+from .support.server import JPEG_BYTES, StubConfig, StubYouTube
+
+COOKIE_LINE = ".youtube.com\tTRUE\t/\tTRUE\t{expires}\t{name}\tstub\n"
+
+
+async def test_cookie_heuristics_do_not_pause(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Unusual cookie exports keep updating; only YouTube's answer decides."""
+    path = tmp_path / "cookies.txt"
+    async with StubYouTube(StubConfig()) as stub:
+        coordinator = YouTubeDataCoordinator(
+            hass, str(path), base_url=stub.base_url, thumbnail_url=stub.thumbnail_url
+        )
+        try:
+            # No LOGIN_INFO and an expired SID, but the probe says logged in
+            path.write_text(
+                "# Netscape HTTP Cookie File\n"
+                + COOKIE_LINE.format(expires=int(time.time()) - 60, name="SID")
+                + COOKIE_LINE.format(expires=int(time.time()) + 86400, name="SAPISID"),
+                encoding="utf-8",
+            )
+            status = await coordinator.async_check_auth()
+            assert status.valid is True and status.reason == REASON_OK
+            assert status.expiry.missing == ("LOGIN_INFO",)
+            assert status.expiry.expired
+
+            # Without SAPISID there is no probe, the status stays unknown
+            path.write_text(
+                "# Netscape HTTP Cookie File\n"
+                + COOKIE_LINE.format(expires=int(time.time()) + 86400, name="SID"),
+                encoding="utf-8",
+            )
+            status = await coordinator.async_check_auth()
+            assert status.valid is None and status.reason == REASON_MISSING_COOKIES
+            assert stub.counters.requests["/youtubei/v1/account/account_menu"] == 1
+
+            await coordinator.async_refresh()
+            assert stub.counters.requests["/feed/history"] == 1
+            assert not coordinator.auth_known_bad
+        finally:
+            await coordinator.async_shutdown()
+
+
+async def test_refresh_if_stale_checks_every_feed(hass: HomeAssistant, tmp_path: Path) -> None:
+    """A caller queued behind a refresh for another feed still gets fresh data."""
+    async with StubYouTube(StubConfig(latency=0.05)) as stub:
+        coordinator = YouTubeDataCoordinator(
+            hass,
+            write_cookies(tmp_path, 0),
+            # A history refresh never includes the subscriptions on its own
+            feed_intervals={FEED_SUBSCRIPTIONS: 3600},
+            request_budget=MAX_REQUEST_BUDGET,
+            base_url=stub.base_url,
+            thumbnail_url=stub.thumbnail_url,
+        )
+        try:
+            await coordinator.async_check_auth()
+            await coordinator.async_refresh()
+            assert stub.counters.requests["/feed/channels"] == 1
+            # The subscriptions are now two minutes old
+            coordinator._last_feed_update[FEED_SUBSCRIPTIONS] -= timedelta(minutes=2)
+
+            history = asyncio.create_task(coordinator.async_refresh_if_stale(0, FEED_HISTORY))
+            await asyncio.sleep(0)
+            subscriptions = asyncio.create_task(
+                coordinator.async_refresh_if_stale(60, FEED_SUBSCRIPTIONS)
+            )
+            await asyncio.gather(history, subscriptions)
+
+            assert stub.counters.requests["/feed/history"] == 3
+            assert stub.counters.requests["/feed/channels"] == 2
+            updated = coordinator.feed_updated(FEED_SUBSCRIPTIONS)
+            assert (dt_util.utcnow() - updated).total_seconds() < 60
+
+            # Both feeds are fresh now, so neither caller refreshes again
+            await asyncio.gather(
+                coordinator.async_refresh_if_stale(60, FEED_HISTORY),
+                coordinator.async_refresh_if_stale(60, FEED_SUBSCRIPTIONS),
+            )
+            assert stub.counters.requests["/feed/history"] == 3
+        finally:
+            await coordinator.async_shutdown()
+
+
+async def test_failed_fetch_keeps_update_time(hass: HomeAssistant, tmp_path: Path) -> None:
+    """A feed that wasn't fetched keeps its data and its update time."""
+    async with StubYouTube(StubConfig()) as stub:
+        coordinator = YouTubeDataCoordinator(
+            hass,
+            write_cookies(tmp_path, 0),
+            base_url=stub.base_url,
+            thumbnail_url=stub.thumbnail_url,
+        )
+        try:
+            await coordinator.async_refresh()
+            history = coordinator.feed_updated(FEED_HISTORY)
+            subscriptions = coordinator.feed_updated(FEED_SUBSCRIPTIONS)
+            channels = coordinator.subscriptions_data
+            assert history is not None and channels is not None
+
+            stub.config.throttle_rate = 1.0
+            await coordinator.async_refresh_if_stale(0, FEED_SUBSCRIPTIONS)
+            assert coordinator.feed_updated(FEED_HISTORY) == history
+            assert coordinator.feed_updated(FEED_SUBSCRIPTIONS) == subscriptions
+            assert coordinator.subscriptions_data == channels
+
+            # Still forced, the next cycle fetches the page once it can
+            stub.config.throttle_rate = 0.0
+            await coordinator.async_refresh()
+            assert coordinator.feed_updated(FEED_SUBSCRIPTIONS) > subscriptions
+            assert stub.counters.requests["/feed/channels"] == 3
+        finally:
+            await coordinator.async_shutdown()
+
+
+async def test_thumbnail_cache_downloads_over_the_transport(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Thumbnails come from the coordinator's host, falling back to 0.jpg there."""
+    async with StubYouTube(StubConfig(maxres_thumbnails=False)) as stub:
+        coordinator = YouTubeDataCoordinator(
+            hass,
+            write_cookies(tmp_path, 0),
+            base_url=stub.base_url,
+            thumbnail_url=stub.thumbnail_url,
+        )
+        cache = ThumbnailCache(
+            hass,
+            str(tmp_path / "thumbnails"),
+            1024 * 1024,
+            download=coordinator.download_thumbnail,
+            thumbnail_url=coordinator.thumbnail_url,
+            executor=coordinator.executor,
+        )
+        stored: list[str] = []
+        cache.async_add_listener(stored.append)
+        try:
+            await cache.async_setup()
+            data = await cache.async_fetch(
+                "aaaaaaaaaa1", f"{stub.thumbnail_url}aaaaaaaaaa1/maxresdefault.jpg"
+            )
+        finally:
+            await coordinator.async_shutdown()
+
+    assert data == JPEG_BYTES
+    assert "aaaaaaaaaa1" in cache
+    assert stored == ["aaaaaaaaaa1"]
+    assert stub.counters.requests["/vi/aaaaaaaaaa1/maxresdefault.jpg"] == 1
+    assert stub.counters.requests["/vi/aaaaaaaaaa1/0.jpg"] == 1
+    assert not stub.counters.cookie_requests
+
+
+async def test_maxres_probe_once_per_video(hass: HomeAssistant, tmp_path: Path) -> None:
+    """The maxres probe is remembered and never carries the account cookies."""
+    async with StubYouTube(StubConfig()) as stub:
+        coordinator = YouTubeDataCoordinator(
+            hass,
+            write_cookies(tmp_path, 0),
+            base_url=stub.base_url,
+            thumbnail_url=stub.thumbnail_url,
+        )
+        try:
+            await coordinator.async_refresh()
+            await coordinator.async_refresh()
+        finally:
+            await coordinator.async_shutdown()
+
+    assert coordinator.data.thumbnail == f"{stub.thumbnail_url}aaaaaaaaaa1/maxresdefault.jpg"
+    assert stub.counters.requests["/feed/history"] == 2
+    assert stub.counters.requests["/vi/aaaaaaaaaa1/maxresdefault.jpg"] == 1
+    assert stub.counters.cookie_requests["/feed/history"] == 2
+    assert not any(path.startswith("/vi/") for path in stub.counters.cookie_requests)
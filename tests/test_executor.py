@@ -0,0 +1,37 @@
+"""Tests for the integration's own thread pool."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from custom_components.youtube_current_watching.budget import PRIORITY_LOW, PRIORITY_NORMAL
+from custom_components.youtube_current_watching.executor import FetchExecutor
+
+
+async def test_cancelled_queued_job_frees_its_slot() -> None:
+    """A job cancelled before a worker took it no longer counts as queued."""
+    executor = FetchExecutor(None, max_workers=1, max_queue=2)
+    release = threading.Event()
+    ran = []
+    try:
+        blocker = asyncio.ensure_future(executor.async_run(PRIORITY_NORMAL, release.wait))
+        while executor.as_dict()["active"] == 0:
+            await asyncio.sleep(0.01)
+
+        queued = asyncio.ensure_future(executor.async_run(PRIORITY_LOW, ran.append, 1))
+        await asyncio.sleep(0)
+        assert executor.as_dict()["queued"] == 1
+
+        queued.cancel()
+        await asyncio.gather(queued, return_exceptions=True)
+        assert executor.as_dict()["queued"] == 0
+
+        release.set()
+        await blocker
+        # The slot is usable again and the cancelled job never ran
+        await executor.async_run(PRIORITY_LOW, ran.append, 2)
+        assert ran == [2]
+        assert executor.as_dict()["queued"] == 0
+    finally:
+        release.set()
+        executor._pool.shutdown(wait=True)
@@ -0,0 +1,42 @@
+"""Smoke tests for the stub server and the load-test harness."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from .support.harness import async_run_load
+from .support.server import StubConfig, StubYouTube
+
+
+async def test_load_harness(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Every simulated entry fetches all feeds once per cycle."""
+    async with StubYouTube(StubConfig(latency=0.01, seed=1)) as stub:
+        report = await async_run_load(hass, stub, tmp_path, entries=4, cycles=2)
+
+    assert report.refreshes == 8
+    assert report.failures == 0
+    assert report.server_requests["/feed/history"] == 8
+    assert report.server_requests["/feed/channels"] == 8
+    assert report.server_requests["/"] == 8
+    assert report.as_dict()["latency_ms"]["p95"] >= 10
+    assert report.as_dict()["fetch_executor"]["completed"] > 0
+    assert report.as_dict()["fetch_executor"]["shed"] == 0
+
+
+async def test_load_harness_logged_out(hass: HomeAssistant, tmp_path: Path) -> None:
+    """A logged-out account stops after the login probe."""
+    async with StubYouTube(StubConfig(logged_in=False)) as stub:
+        report = await async_run_load(hass, stub, tmp_path, entries=2, cycles=3)
+
+    assert report.server_requests.get("/feed/history", 0) == 0
+    assert report.server_requests["/youtubei/v1/account/account_menu"] == 2
+
+
+async def test_load_harness_throttled(hass: HomeAssistant, tmp_path: Path) -> None:
+    """429s from every page leave the entries without data but keep them running."""
+    async with StubYouTube(StubConfig(throttle_rate=1.0)) as stub:
+        report = await async_run_load(hass, stub, tmp_path, entries=2, cycles=2)
+
+    assert report.refreshes == 4
+    assert report.server_statuses == {429: stub.counters.statuses[429]}
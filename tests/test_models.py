@@ -0,0 +1,24 @@
+"""Tests for the data models."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.youtube_current_watching.models import parse_duration
+
+
+@pytest.mark.parametrize(
+    ("duration", "expected"),
+    [
+        ("12:34", 754),
+        ("0:59", 59),
+        ("1:02:03", 3723),
+        ("LIVE", None),
+        ("Shorts", None),
+        ("N/A", None),
+        ("1:2:3:4", None),
+        ("", None),
+    ],
+)
+def test_parse_duration(duration, expected):
+    """Duration labels convert to seconds, other labels to None."""
+    assert parse_duration(duration) == expected
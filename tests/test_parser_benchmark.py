@@ -0,0 +1,391 @@
+"""Offline benchmarks for the YouTube page parsers.
+
+Run with ``pytest tests/test_parser_benchmark.py --benchmark-autosave`` and
+compare against a saved run with ``--benchmark-compare-fail=mean:10%`` to
+gate regressions. Every case also asserts the extracted result, so layout
+changes in the fixtures show up as failures rather than silent slowdowns.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from custom_components.youtube_current_watching.const import (
+    ATTR_AVATAR,
+    ATTR_HANDLE,
+    ATTR_SUBSCRIBER_COUNT,
+    ATTR_VIDEO_COUNT,
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+)
+from custom_components.youtube_current_watching.json_backend import DECODERS
+from custom_components.youtube_current_watching.parser import (
+    decode_initial_data,
+    decode_initial_data_partial,
+    extract_initial_data,
+    extract_lockup_info,
+    extract_shorts_info,
+    extract_video_renderer_info,
+    find_initial_data,
+    parse_history,
+    parse_channel_details,
+    parse_history_items,
+    parse_page,
+    parse_recommended,
+    parse_subscriptions,
+    parse_uploads,
+)
+
+from .conftest import PAGE_SIZES, build_page, load_fixture
+from .support.server import HISTORY_VARIANTS, channel_header
+
+HISTORY_CASES = [
+    ("history_lockup.html", "aaaaaaaaaa1", "12:34"),
+    ("history_lockup_live.html", "aaaaaaaaaa3", "LIVE"),
+    ("history_video_renderer.html", "bbbbbbbbbb1", "4:05"),
+    ("history_rich_item.html", "bbbbbbbbbb2", "9:59"),
+    ("history_shorts.html", "ccccccccccc", "Shorts"),
+]
+
+
+def _run(benchmark, func: Callable[[], Any], payload_bytes: int) -> Any:
+    """Record tracemalloc peak and payload size, then benchmark func."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["payload_bytes"] = payload_bytes
+    benchmark.extra_info["tracemalloc_peak"] = peak
+    return benchmark(func)
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize(("fixture_name", "video_id", "duration"), HISTORY_CASES)
+def test_history_parse_stage(benchmark, page_size, fixture_name, video_id, duration):
+    """Benchmark the parse stage of _fetch_youtube_history."""
+    html = build_page(fixture_name, page_size)
+
+    video = _run(
+        benchmark,
+        lambda: parse_history(extract_initial_data(html, allow_alternative=True)),
+        len(html.encode()),
+    )
+
+    assert video is not None
+    assert video.video_id == video_id
+    assert video.duration == duration
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_history_paused(benchmark, page_size):
+    """Benchmark the messageRenderer (paused history) short-circuit."""
+    html = build_page("history_paused.html", page_size)
+
+    video = _run(
+        benchmark,
+        lambda: parse_history(extract_initial_data(html, allow_alternative=True)),
+        len(html.encode()),
+    )
+
+    assert video is None
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize(("fixture_name", "video_id", "duration"), HISTORY_CASES)
+def test_history_items_parse_stage(benchmark, page_size, fixture_name, video_id, duration):
+    """Benchmark collecting the history entries for the get_history service."""
+    html = build_page(fixture_name, page_size)
+    data = extract_initial_data(html, allow_alternative=True)
+
+    videos = _run(benchmark, lambda: parse_history_items(data, 20), len(html.encode()))
+
+    assert video_id in [video.video_id for video in videos]
+    assert parse_history_items(extract_initial_data(load_fixture("history_paused.html")), 20) == []
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_recommended_parse_stage(benchmark, page_size):
+    """Benchmark the parse stage of _fetch_recommended_videos."""
+    html = build_page("home.html", page_size)
+
+    videos = _run(
+        benchmark,
+        lambda: parse_recommended(extract_initial_data(html)),
+        len(html.encode()),
+    )
+
+    assert [video.video_id for video in videos] == [
+        "dddddddddd1",
+        "dddddddddd2",
+        "dddddddddd3",
+    ]
+
+
+@pytest.mark.parametrize(("limit", "expected"), [(1, 1), (2, 2), (10, 4)])
+def test_recommended_depth(benchmark, limit, expected):
+    """Benchmark the early-exit grid walk at different depths."""
+    data = extract_initial_data(load_fixture("home.html"))
+
+    videos = _run(benchmark, lambda: parse_recommended(data, limit), 0)
+
+    # Ads and the Shorts shelf never count towards the limit
+    assert len(videos) == expected
+    assert not any(video.is_short for video in videos)
+
+
+@pytest.mark.parametrize(
+    ("known", "expected"),
+    [
+        # First poll: everything up to the limit
+        (frozenset(), ["ffffffffff1", "ffffffffff2", "ffffffffff3", "ffffffffff4", "ffffffffff5"]),
+        # Channel A and B watermarks: the walk stops at the first one
+        (frozenset({"ffffffffff3", "ffffffffff5"}), ["ffffffffff1", "ffffffffff2"]),
+        # Nothing new
+        (frozenset({"ffffffffff1", "ffffffffff2", "ffffffffff4"}), []),
+    ],
+)
+def test_uploads_watermarks(benchmark, known, expected):
+    """Benchmark the uploads walk, which stops at the first watermark."""
+    data = extract_initial_data(load_fixture("subscriptions.html"))
+
+    videos = _run(benchmark, lambda: parse_uploads(data, known, 5), 0)
+
+    # The Shorts shelf between the uploads is skipped
+    assert [video.video_id for video in videos] == expected
+    assert all(video.channel.startswith("Channel ") for video in videos)
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+def test_subscriptions_parse_stage(benchmark, page_size):
+    """Benchmark the parse stage of _fetch_subscribed_channels."""
+    html = build_page("channels.html", page_size)
+
+    channels = _run(
+        benchmark,
+        lambda: parse_subscriptions(extract_initial_data(html)),
+        len(html.encode()),
+    )
+
+    assert len(channels) == 5
+    channel = channels[0]
+    assert channel.channel_name == "Sanitized Channel 1"
+    assert channel.channel_id == "UCsanitized000000000001"
+    # subscriberCountText carries the handle, videoCountText the subscribers
+    assert channel.handle == "@sanitized1"
+    assert channel.subscriber_count == "1.1K subscribers"
+    assert channel.video_count is None
+    assert channel.avatar == "https://yt3.ggpht.com/sanitized1=s88"
+    assert not channel.complete
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        channel_header("UCstub3"),
+        {
+            "c4TabbedHeaderRenderer": {
+                "channelHandleText": {"runs": [{"text": "@stub3"}]},
+                "subscriberCountText": {"simpleText": "3.5K subscribers"},
+                "videosCountText": {"runs": [{"text": "30"}, {"text": " videos"}]},
+                "avatar": {"thumbnails": [{"url": "https://yt3.ggpht.com/UCstub3=s160"}]},
+            }
+        },
+    ],
+    ids=["page_header", "c4_header"],
+)
+def test_channel_details(header):
+    """Both channel header layouts yield the same details."""
+    assert parse_channel_details({"header": header}) == {
+        ATTR_HANDLE: "@stub3",
+        ATTR_SUBSCRIBER_COUNT: "3.5K subscribers",
+        ATTR_VIDEO_COUNT: "30 videos",
+        ATTR_AVATAR: "https://yt3.ggpht.com/UCstub3=s160",
+    }
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize("decoder", sorted(DECODERS))
+def test_json_decode_backends(benchmark, decoder, page_size):
+    """Compare the JSON decoders on the raw ytInitialData bytes."""
+    raw = find_initial_data(build_page("history_lockup.html", page_size).encode())
+
+    data = _run(benchmark, lambda: DECODERS[decoder](raw), len(raw))
+
+    assert "contents" in data
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize(
+    ("feed", "fixture_name"),
+    [
+        (FEED_HISTORY, "history_lockup.html"),
+        (FEED_RECOMMENDED, "home.html"),
+        (FEED_SUBSCRIPTIONS, "channels.html"),
+        (FEED_UPLOADS, "subscriptions.html"),
+    ],
+)
+def test_parse_page(benchmark, feed, fixture_name, page_size):
+    """Benchmark the full per-feed parse done by the parse backends."""
+    body = build_page(fixture_name, page_size).encode()
+
+    result = _run(benchmark, lambda: parse_page(feed, body), len(body))
+
+    assert result.found
+    assert result.records
+    assert result.logged_in is True
+
+
+PARTIAL_CASES = [
+    *((FEED_HISTORY, fixture_name) for fixture_name, _, _ in HISTORY_CASES),
+    (FEED_HISTORY, "history_paused.html"),
+    (FEED_RECOMMENDED, "home.html"),
+    (FEED_UPLOADS, "subscriptions.html"),
+]
+
+
+@pytest.mark.parametrize("page_size", PAGE_SIZES)
+@pytest.mark.parametrize(("feed", "fixture_name"), PARTIAL_CASES)
+def test_partial_decode(benchmark, feed, fixture_name, page_size):
+    """Benchmark decoding only the items a feed needs; compare with test_json_decode_backends."""
+    raw = find_initial_data(build_page(fixture_name, page_size).encode(), allow_alternative=True)
+    limit = 20 if feed == FEED_HISTORY else 3
+
+    data = _run(
+        benchmark, lambda: decode_initial_data_partial(raw, feed, limit), len(raw)
+    )
+
+    assert data is not None
+    full = decode_initial_data(raw)
+    if feed == FEED_HISTORY:
+        assert parse_history(data) == parse_history(full)
+        assert parse_history_items(data, limit) == parse_history_items(full, limit)
+    elif feed == FEED_RECOMMENDED:
+        assert parse_recommended(data, limit) == parse_recommended(full, limit)
+    else:
+        assert parse_uploads(data, frozenset(), limit) == parse_uploads(full, frozenset(), limit)
+
+
+def test_partial_decode_fallback():
+    """Pages whose arrays can't be located are decoded in full."""
+    body = load_fixture("home.html").replace(
+        '"richGridRenderer": {"contents": [', '"richGridRenderer": {"header": {}, "contents": ['
+    ).encode()
+
+    assert decode_initial_data_partial(find_initial_data(body), FEED_RECOMMENDED) is None
+    result = parse_page(FEED_RECOMMENDED, body)
+    assert not result.partial
+    assert [video.video_id for video in result.records] == [
+        "dddddddddd1",
+        "dddddddddd2",
+        "dddddddddd3",
+    ]
+    assert parse_page(FEED_RECOMMENDED, load_fixture("home.html").encode()).partial
+
+
+def _history_layouts(data: dict[str, Any]) -> dict[str, tuple[dict[str, Any], bool]]:
+    """Rearrange a history page the ways real pages differ from the fixtures.
+
+    Returns:
+        Layout name -> (ytInitialData, whether the partial decode applies)
+    """
+    tab = data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][0]
+    sections = tab["tabRenderer"]["content"]["sectionListRenderer"]["contents"]
+    items = sections[0]["itemSectionRenderer"]["contents"]
+    header = sections[0]["itemSectionRenderer"]["header"]
+
+    def with_sections(new_sections: list[Any]) -> dict[str, Any]:
+        page = json.loads(json.dumps(data))
+        page_tab = page["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][0]
+        page_tab["tabRenderer"]["content"]["sectionListRenderer"]["contents"] = new_sections
+        return page
+
+    # Keys ahead of contents, one section per item and a continuation
+    split = with_sections([
+        {"itemSectionRenderer": {"header": header, "contents": [item]}} for item in items
+    ] + [{"continuationItemRenderer": {"trigger": "CONTINUATION_TRIGGER_ON_ITEM_SHOWN"}}])
+    # Another item section before the tab, which is not part of the history
+    decoy = {
+        "responseContext": data["responseContext"],
+        "sidebar": {"itemSectionRenderer": {"contents": [
+            {"videoRenderer": {"videoId": "decoydecoy1"}}
+        ]}},
+        **data,
+    }
+    # Content in a tab that isn't the selected one
+    other_tab = json.loads(json.dumps(data))
+    other_tab["contents"]["twoColumnBrowseResultsRenderer"]["tabs"].insert(
+        0, {"tabRenderer": {"selected": False, "content": tab["tabRenderer"]["content"]}}
+    )
+    return {
+        "fixture": (data, True),
+        "split": (split, True),
+        "decoy": (decoy, True),
+        "other_tab": (other_tab, False),
+    }
+
+
+@pytest.mark.parametrize("limit", [1, 20])
+@pytest.mark.parametrize("fixture_name", HISTORY_VARIANTS)
+def test_partial_history_matches_full(fixture_name, limit):
+    """The partial history decode reads exactly what the full decode reads."""
+    html = load_fixture(fixture_name)
+    raw = find_initial_data(html, allow_alternative=True)
+
+    for layout, (data, partial) in _history_layouts(json.loads(raw)).items():
+        body = html.replace(raw, json.dumps(data)).encode()
+        result = parse_page(FEED_HISTORY, body, limit)
+
+        assert result.partial is partial, layout
+        assert result.records == parse_history(data), layout
+        assert result.history == parse_history_items(data, limit), layout
+
+
+def _first_item(fixture_name: str, key: str) -> dict[str, Any]:
+    """Return the first renderer of the given type found in a fixture."""
+    stack: list[Any] = [extract_initial_data(load_fixture(fixture_name))]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if key in node:
+                return node[key]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    raise LookupError(key)
+
+
+@pytest.mark.parametrize(
+    ("extractor", "fixture_name", "key", "video_id"),
+    [
+        (extract_lockup_info, "history_lockup.html", "lockupViewModel", "aaaaaaaaaa1"),
+        (
+            extract_video_renderer_info,
+            "history_video_renderer.html",
+            "videoRenderer",
+            "bbbbbbbbbb1",
+        ),
+        (
+            extract_shorts_info,
+            "history_shorts.html",
+            "shortsLockupViewModel",
+            "ccccccccccc",
+        ),
+    ],
+)
+def test_extract_helpers(benchmark, extractor, fixture_name, key, video_id):
+    """Benchmark the individual renderer extractors."""
+    item = _first_item(fixture_name, key)
+
+    video = _run(benchmark, lambda: extractor(item), len(json.dumps(item)))
+
+    assert video is not None
+    assert video.video_id == video_id
@@ -0,0 +1,53 @@
+"""Tests for the local playback progress model."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.youtube_current_watching.progress import PlaybackProgress
+
+START = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _at(seconds: float) -> datetime:
+    return START + timedelta(seconds=seconds)
+
+
+def test_play_pause_resume():
+    """The position advances while playing and holds while paused."""
+    progress = PlaybackProgress()
+    assert progress.as_dict(600, START) == {"position": None, "remaining": None, "progress": None}
+
+    progress.start(START, "Video")
+    assert progress.as_dict(600, _at(60)) == {"position": 60, "remaining": 540, "progress": 10.0}
+
+    progress.pause(_at(90))
+    assert progress.position(_at(300)) == 90
+
+    progress.resume(_at(300))
+    assert progress.position(_at(330)) == 120
+    # Capped at the end of the video
+    assert progress.as_dict(600, _at(2000)) == {"position": 600, "remaining": 0, "progress": 100.0}
+
+
+def test_unknown_duration_and_seek():
+    """Live streams only report the position; player positions win over the estimate."""
+    progress = PlaybackProgress()
+    progress.start(START, "Live stream")
+    assert progress.as_dict(None, _at(30)) == {"position": 30, "remaining": None, "progress": None}
+
+    progress.seek(500, _at(40))
+    assert progress.position(_at(50)) == 510
+
+
+def test_restart_if_stale():
+    """A video change right after a play event belongs to it, a later one restarts."""
+    progress = PlaybackProgress()
+    progress.start(START, "Video")
+    grace = timedelta(seconds=60)
+
+    assert not progress.restart_if_stale(_at(20), grace)
+    assert progress.position(_at(20)) == 20
+
+    assert progress.restart_if_stale(_at(600), grace)
+    assert progress.position(_at(610)) == 10
+    assert progress.title is None
@@ -0,0 +1,96 @@
+"""Tests for page recording and offline replay."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.youtube_current_watching.const import (
+    FEED_HISTORY,
+    FEED_RECOMMENDED,
+    FEED_SUBSCRIPTIONS,
+    FEED_UPLOADS,
+)
+from custom_components.youtube_current_watching.parser import find_initial_data, parse_page
+from custom_components.youtube_current_watching.recording import (
+    SANITIZED,
+    PageRecorder,
+    iter_recordings,
+    load_recording,
+    recording_feed,
+)
+
+from .conftest import build_page, load_fixture
+from .support.replay import replay
+from .support.server import HISTORY_VARIANTS
+
+RECORD_CASES = [
+    *((FEED_HISTORY, fixture_name) for fixture_name in HISTORY_VARIANTS),
+    (FEED_RECOMMENDED, "home.html"),
+    (FEED_SUBSCRIPTIONS, "channels.html"),
+    (FEED_UPLOADS, "subscriptions.html"),
+]
+
+
+@pytest.mark.parametrize(("feed", "fixture_name"), RECORD_CASES)
+def test_recording_parses_like_the_page(tmp_path, feed, fixture_name):
+    """A recording is scrubbed but parses to the same result as the live page."""
+    body = build_page(fixture_name, "medium").encode()
+    recorder = PageRecorder(str(tmp_path))
+
+    path = recorder.record(feed, body)
+
+    assert path is not None and recording_feed(path) == feed
+    recorded = load_recording(path)
+    data = json.loads(find_initial_data(recorded))
+    assert "topbar" not in data
+    assert SANITIZED not in json.dumps(data["responseContext"])
+    expected, actual = parse_page(feed, body, 20), parse_page(feed, recorded, 20)
+    assert actual.records == expected.records
+    assert actual.history == expected.history
+    assert actual.logged_in == expected.logged_in
+    assert actual.partial == expected.partial
+
+    result = replay(path, repeat=2)
+    assert result.found and result.feed == feed
+    assert set(result.timings) == set(expected.timings)
+
+
+def test_scrub_tokens_and_account(tmp_path):
+    """Session tokens and the account menu never reach the disk."""
+    html = load_fixture("history_lockup.html")
+    raw = find_initial_data(html)
+    data = json.loads(raw)
+    data["responseContext"]["visitorData"] = "Cgt2aXNpdG9y"
+    data["responseContext"]["serviceTrackingParams"].append(
+        {"service": "GOOGLE_HELP", "params": [{"key": "browse_id", "value": "FEhistory"}]}
+    )
+    data["topbar"] = {"activeAccountHeaderRenderer": {"accountName": {"simpleText": "Someone"}}}
+    data["trackingParams"] = "CAAQhGciEwi"
+    body = html.replace(raw, json.dumps(data)).encode()
+
+    path = PageRecorder(str(tmp_path)).record(FEED_HISTORY, body)
+    page = load_recording(path)
+
+    for secret in (b"Cgt2aXNpdG9y", b"FEhistory", b"Someone", b"CAAQhGciEwi"):
+        assert secret not in page
+    assert parse_page(FEED_HISTORY, page).logged_in is True
+
+
+def test_rotation_and_unchanged_pages(tmp_path):
+    """Only the newest recordings per feed are kept; unchanged pages are skipped."""
+    recorder = PageRecorder(str(tmp_path), max_files=3)
+    home = load_fixture("home.html").encode()
+
+    assert recorder.record(FEED_RECOMMENDED, home) is not None
+    assert recorder.record(FEED_RECOMMENDED, home) is None
+    for fixture_name in HISTORY_VARIANTS:
+        recorder.record(FEED_HISTORY, load_fixture(fixture_name).encode())
+
+    history = list(iter_recordings(str(tmp_path), FEED_HISTORY))
+    assert len(history) == 3
+    assert len(list(iter_recordings(str(tmp_path)))) == 4
+    newest = json.loads(find_initial_data(load_recording(history[-1])))
+    expected = json.loads(find_initial_data(load_fixture(HISTORY_VARIANTS[-1])))
+    assert newest["contents"] == expected["contents"]
+    assert recorder.as_dict() == {"max_files": 3, "recorded": 7, "unchanged": 1}
@@ -0,0 +1,70 @@
+"""Tests for the local title index."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.youtube_current_watching.models import VideoInfo
+from custom_components.youtube_current_watching.title_index import (
+    TitleIndex,
+    normalize_title,
+)
+
+
+def _video(video_id: str, title: str) -> VideoInfo:
+    return VideoInfo(video_id=video_id, title=title, channel="Channel", duration="1:00")
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Hello, World!", "hello world"),
+        ("ＭＶ｜Ｓｏｎｇ (Live)", "mv song live"),
+        ("  Song   Title - YouTube ", "song title"),
+        ("노래 제목 [공식]", "노래 제목 공식"),
+        ("!!!", ""),
+    ],
+)
+def test_normalize_title(title, expected):
+    """Titles are folded to a comparable form."""
+    assert normalize_title(title) == expected
+
+
+def test_lookup_exact_and_fuzzy():
+    """Exact normalized titles win, close titles match fuzzily."""
+    index = TitleIndex()
+    index.add_many(
+        [
+            _video("aaaaaaaaaa1", "Cooking pasta at home (easy recipe)"),
+            _video("aaaaaaaaaa2", "Cooking rice at home"),
+            _video("aaaaaaaaaa3", "Evening jazz playlist for studying"),
+        ]
+    )
+
+    match = index.lookup("COOKING PASTA AT HOME - easy recipe")
+    assert match is not None
+    assert match.video.video_id == "aaaaaaaaaa1"
+    assert match.score == 1.0
+
+    match = index.lookup("Evening Jazz Playlist for Study")
+    assert match is not None
+    assert match.video.video_id == "aaaaaaaaaa3"
+    assert match.score < 1.0
+
+    assert index.lookup("Morning news") is None
+    assert index.lookup("jazz") is None
+
+
+def test_add_replaces_and_evicts():
+    """Re-added videos are refreshed and the oldest are evicted."""
+    index = TitleIndex(max_entries=2)
+    index.add(_video("aaaaaaaaaa1", "First video title"))
+    index.add(_video("aaaaaaaaaa2", "Second video title"))
+    index.add(_video("aaaaaaaaaa1", "First video title renamed"))
+    index.add(_video("aaaaaaaaaa3", "Third video title"))
+
+    assert len(index) == 2
+    assert index.lookup("Second video title") is None
+    # The old title is no longer indexed exactly, only close to the new one
+    assert index.lookup("First video title").score < 1.0
+    assert index.lookup("First video title renamed").video.video_id == "aaaaaaaaaa1"
+    assert index.lookup("Third video title").video.video_id == "aaaaaaaaaa3"
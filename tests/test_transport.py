@@ -0,0 +1,59 @@
+"""Tests for the HTTP transports against the stub server."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.youtube_current_watching.transport import (
+    RequestsTransport,
+    TransportError,
+)
+
+from .support.server import StubConfig, StubYouTube
+
+
+async def test_download_reports_wire_bytes() -> None:
+    """Compressed pages report fewer wire bytes than decoded bytes."""
+    async with StubYouTube(StubConfig(compress=True, page_size="medium")) as stub:
+        transport = RequestsTransport()
+        try:
+            response = await asyncio.to_thread(
+                transport.open, f"{stub.base_url}/feed/history", 10
+            )
+            download = await asyncio.to_thread(response.read)
+        finally:
+            transport.close()
+
+    assert download.encoding in ("gzip", "br", "deflate")
+    assert b"ytInitialData" in download.body
+    assert 0 < download.wire_bytes < len(download.body)
+
+
+async def test_download_identity() -> None:
+    """Uncompressed pages arrive as they are on the wire."""
+    async with StubYouTube() as stub:
+        transport = RequestsTransport()
+        try:
+            response = await asyncio.to_thread(transport.open, f"{stub.base_url}/", 10)
+            download = await asyncio.to_thread(response.read)
+            status = await asyncio.to_thread(
+                transport.head, f"{stub.thumbnail_url}aaaaaaaaaaa/maxresdefault.jpg", 3
+            )
+        finally:
+            transport.close()
+
+    assert download.encoding == "identity"
+    assert download.wire_bytes == len(download.body)
+    assert status == 200
+
+
+async def test_error_status_raises() -> None:
+    """Error answers surface as TransportError."""
+    async with StubYouTube(StubConfig(throttle_rate=1.0)) as stub:
+        transport = RequestsTransport()
+        try:
+            with pytest.raises(TransportError):
+                await asyncio.to_thread(transport.open, f"{stub.base_url}/feed/history", 10)
+        finally:
+            transport.close()